@@ -6,11 +6,97 @@ Author: GitHub Copilot
 Date: June 17, 2025
 """
 
+import re
 import requests
+from requests.adapters import HTTPAdapter
 import time
+import random
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Union, Any
 from enum import Enum
 import json
+import os
+import functools
+from urllib.parse import quote
+import sqlite3
+from itertools import islice
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+# orjson (de)serialises response bodies much faster; fall back to the stdlib if missing
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _JSONDecodeError = json.JSONDecodeError
+
+
+# httpx (optional) multiplexes async batch lookups, over HTTP/2 when h2 is installed
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+# Upper bound on in-flight HTTP requests per client; the effective value is
+# further capped by the subscription plan's requests-per-second allowance
+MAX_HTTP_CONCURRENCY = 5
+
+# Reactive rate limiting: pause once the server reports this many requests
+# (or fewer) left in the current window, and retry 429s with backoff
+RATE_LIMIT_REMAINING_THRESHOLD = 2
+MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1.0
+
+# Statuses worth retrying (429 also shrinks the AIMD concurrency target)
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Error bodies larger than this, or not JSON, are not parsed for a message
+MAX_ERROR_BODY_BYTES = 64 * 1024
+
+# AIMD concurrency control: halve in-flight requests on 429, grow by one on success
+CONCURRENCY_DECREASE_FACTOR = 0.5
+CONCURRENCY_INCREASE_STEP = 1.0
+
+# Response cache: entries per client and time-to-live per endpoint family (seconds)
+CACHE_MAXSIZE = 8192
+BOOK_DETAILS_TTL = 30 * 24 * 60 * 60
+DATABASE_STATS_TTL = 60 * 60
+SEARCH_TTL = 5 * 60
+DISK_CACHE_FILENAME = 'isbndb_cache.sqlite3'
+
+# Background prefetch of the next search results page
+PREFETCH_WORKERS = 2
+PREFETCH_MAX_PENDING = 16
+
+# Maximum ISBNs per batch POST to /books, by plan
+BASIC_BATCH_SIZE = 100
+PREMIUM_BATCH_SIZE = 1000
+
+# ISBN normalisation/validation: separators stripped in one C-level pass
+_ISBN_STRIP = str.maketrans('', '', '- \t')
+_ISBN10_RE = re.compile(r'[0-9]{9}[0-9X]')
+_ISBN13_RE = re.compile(r'[0-9]{13}')
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_segment(segment: str) -> str:
+    """Percent-encode one URL path segment (memoised for repeated names)"""
+    return quote(segment, safe='')
 
 
 class SubscriptionPlan(Enum):
@@ -22,6 +108,7 @@ class SubscriptionPlan(Enum):
 
 class ISBNdbAPIError(Exception):
     """Custom exception for ISBNdb API errors"""
+    
     def __init__(self, message: str, status_code: Optional[int] = None):
         self.message = message
         self.status_code = status_code
@@ -29,23 +116,68 @@ class ISBNdbAPIError(Exception):
 
 
 class RateLimiter:
-    """Rate limiter to handle API request limits"""
+    """
+    Token-bucket rate limiter to handle API request limits
+    
+    Tokens refill continuously at ``requests_per_second`` and accumulate up to
+    ``capacity`` while the client is idle, so short bursts go out back-to-back
+    while the long-run rate stays at ``requests_per_second``.
+    """
+    __slots__ = ('requests_per_second', 'refill_rate', 'capacity', 'tokens',
+                 'last_refill', 'paused_until', '_lock')
     
-    def __init__(self, requests_per_second: float):
+    def __init__(self, requests_per_second: float, capacity: Optional[float] = None):
         self.requests_per_second = requests_per_second
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.refill_rate = requests_per_second
+        self.capacity = max(1.0, capacity if capacity is not None else requests_per_second)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
     
-    def wait_if_needed(self):
-        """Wait if necessary to respect rate limits"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+    def _refill(self):
+        """Add the tokens earned since the last refill, up to capacity"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    def pause_until(self, resume_at: float):
+        """
+        Hold back all requests until ``resume_at`` (a ``time.monotonic()`` timestamp)
         
-        if time_since_last_request < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_request
-            time.sleep(sleep_time)
+        Args:
+            resume_at (float): Monotonic time at which requests may resume
+        """
+        with self._lock:
+            self.paused_until = max(self.paused_until, resume_at)
+    
+    def _reserve(self) -> float:
+        """
+        Take a token from the bucket, going into debt if it is empty
         
-        self.last_request_time = time.time()
+        Returns:
+            float: Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            
+            delay = max(0.0, self.paused_until - self.last_refill)
+            if self.tokens < 0:
+                delay = max(delay, -self.tokens / self.refill_rate)
+            return delay
+    
+    def wait_if_needed(self):
+        """Take a token, waiting for one to refill if the bucket is empty (thread-safe)"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def wait_if_needed_async(self):
+        """Asyncio variant of ``wait_if_needed`` that yields to the event loop while waiting"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
 
 
 class ISBNdbAPI:
@@ -61,13 +193,28 @@ class ISBNdbAPI:
     - Database statistics
     """
     
-    def __init__(self, api_key: str, subscription_plan: SubscriptionPlan = SubscriptionPlan.BASIC):
+    __slots__ = (
+        'api_key', 'subscription_plan', 'base_url', 'rate_limiter', 'headers', '_post_headers',
+        'batch_size', 'max_workers', '_session', '_concurrency', '_concurrency_lock',
+        '_cache', '_cache_maxsize', '_cache_lock', '_disk_cache', '_inflight', '_inflight_lock',
+        'prefetch_pages', '_prefetch_pool', '_prefetch_futures', '_prefetch_lock',
+    )
+    
+    # Optional criteria accepted by advanced_book_search, in argument order
+    _ADV_FIELDS = ('title', 'author', 'publisher', 'subject', 'year')
+    
+    def __init__(self, api_key: str, subscription_plan: SubscriptionPlan = SubscriptionPlan.BASIC,
+                 cache_maxsize: int = CACHE_MAXSIZE, prefetch_pages: bool = True,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the ISBNdb API client
         
         Args:
             api_key (str): Your ISBNdb API key
             subscription_plan (SubscriptionPlan): Your subscription plan (BASIC, PREMIUM, or PRO)
+            cache_maxsize (int): Maximum number of GET responses kept in the TTL cache
+            prefetch_pages (bool): Fetch page N+1 of a search in the background once page N returns
+            cache_dir (str, optional): Directory for a persistent SQLite cache shared across runs
         """
         self.api_key = api_key
         self.subscription_plan = subscription_plan
@@ -75,30 +222,293 @@ class ISBNdbAPI:
         # Set base URL and rate limits based on subscription plan
         if subscription_plan == SubscriptionPlan.PREMIUM:
             self.base_url = "https://api.premium.isbndb.com"
-            self.rate_limiter = RateLimiter(3.0)  # 3 requests per second
+            self.rate_limiter = RateLimiter(3.0, capacity=6)  # 3 requests per second, bursts of 6
         elif subscription_plan == SubscriptionPlan.PRO:
             self.base_url = "https://api.pro.isbndb.com"
-            self.rate_limiter = RateLimiter(5.0)  # 5 requests per second
+            self.rate_limiter = RateLimiter(5.0, capacity=10)  # 5 requests per second, bursts of 10
         else:
             self.base_url = "https://api2.isbndb.com"
-            self.rate_limiter = RateLimiter(1.0)  # 1 request per second
+            self.rate_limiter = RateLimiter(1.0, capacity=2)  # 1 request per second, bursts of 2
         
+        # Sent with every request; Content-Type is only added for POST bodies
         self.headers = {
             'Authorization': self.api_key,
-            'Content-Type': 'application/json',
             'User-Agent': 'ISBNdb-Python-Client/1.0'
         }
+        self._post_headers = {'Content-Type': 'application/json'}
+        
+        self.batch_size = BASIC_BATCH_SIZE if subscription_plan == SubscriptionPlan.BASIC else PREMIUM_BATCH_SIZE
+        
+        # Keep the number of in-flight requests in line with the plan's rate limit
+        self.max_workers = max(1, min(MAX_HTTP_CONCURRENCY, int(self.rate_limiter.requests_per_second)))
+        
+        # Shared session so TCP/TLS connections are reused across calls
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Current AIMD concurrency target, shrunk on 429s and regrown on success
+        self._concurrency = float(self.max_workers)
+        self._concurrency_lock = threading.Lock()
+        
+        # In-process LRU of GET responses: key -> (expires_at, response data)
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_maxsize = cache_maxsize
+        self._cache_lock = threading.Lock()
+        
+        # Optional on-disk second tier behind the in-process LRU
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._disk_cache = sqlite3.connect(os.path.join(cache_dir, DISK_CACHE_FILENAME),
+                                               check_same_thread=False)
+            self._disk_cache.execute('PRAGMA journal_mode=WAL')
+            self._disk_cache.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(cache_key TEXT PRIMARY KEY, expires_at REAL, body BLOB)'
+            )
+            self._disk_cache.commit()
+        
+        # Single-flight map of requests currently on the wire: key -> Future
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Background fetches of the next search page: cache key -> Future (LRU bounded)
+        self.prefetch_pages = prefetch_pages
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) if prefetch_pages else None
+        self._prefetch_futures: OrderedDict = OrderedDict()
+        self._prefetch_lock = threading.Lock()
+    
+    def close(self):
+        """Stop background prefetching and release pooled connections"""
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_pool = None
+        self._session.close()
+        if self._disk_cache is not None:
+            with self._cache_lock:
+                self._disk_cache.close()
+                self._disk_cache = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    @staticmethod
+    def _normalize_value(value: Any) -> Any:
+        """Strip and lower-case string search values so equivalent queries compare equal"""
+        return value.strip().lower() if isinstance(value, str) else value
+    
+    @classmethod
+    def _cache_key(cls, endpoint: str, params: Optional[Dict] = None) -> tuple:
+        """Build a hashable cache key from an endpoint and its (normalised) query parameters"""
+        if not params:
+            return (endpoint, ())
+        return (endpoint, tuple(sorted((k, cls._normalize_value(v)) for k, v in params.items())))
+    
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response, in memory first and then in the disk cache
+        
+        Args:
+            key (tuple): Key from ``_cache_key``
+            
+        Returns:
+            dict or None: Cached response data, or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._cache.move_to_end(key)
+                    return value
+                del self._cache[key]
+            
+            if self._disk_cache is None:
+                return None
+            
+            row = self._disk_cache.execute(
+                'SELECT expires_at, body FROM responses WHERE cache_key = ?', (repr(key),)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, body = row
+            remaining = expires_at - time.time()
+            if remaining <= 0:
+                return None
+            
+            # Promote to the in-memory tier for the rest of its lifetime
+            value = _json_loads(body)
+            self._cache[key] = (time.monotonic() + remaining, value)
+            while len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
+            return value
+    
+    def _cache_put(self, key: tuple, value: Dict[str, Any], ttl: float):
+        """
+        Store a response in the cache, evicting the least recently used entry when full
+        
+        Args:
+            key (tuple): Key from ``_cache_key``
+            value (dict): Response data
+            ttl (float): Time-to-live in seconds
+        """
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_maxsize:
+                self._cache.popitem(last=False)
+            
+            if self._disk_cache is not None:
+                self._disk_cache.execute(
+                    'INSERT OR REPLACE INTO responses (cache_key, expires_at, body) VALUES (?, ?, ?)',
+                    (repr(key), time.time() + ttl, _json_dumps(value))
+                )
+                self._disk_cache.commit()
+    
+    def clear_cache(self):
+        """Drop all cached responses, including the disk cache"""
+        with self._cache_lock:
+            self._cache.clear()
+            if self._disk_cache is not None:
+                self._disk_cache.execute('DELETE FROM responses')
+                self._disk_cache.commit()
+    
+    @staticmethod
+    def _parse_retry_after(response) -> Optional[float]:
+        """
+        Parse the ``Retry-After`` header as a number of seconds
+        
+        Args:
+            response: HTTP response (``requests`` or ``httpx``)
+            
+        Returns:
+            float or None: Seconds to wait, or None if the header is absent/unparseable
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    def _apply_rate_limit_headers(self, response):
+        """
+        Pause the rate limiter preemptively when the server reports the quota is nearly spent
+        
+        Args:
+            response: HTTP response (``requests`` or ``httpx``)
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+        
+        if remaining <= RATE_LIMIT_REMAINING_THRESHOLD:
+            retry_after = self._parse_retry_after(response)
+            if retry_after is None:
+                # No hint from the server: hold off for one token's refill time
+                retry_after = 1.0 / self.rate_limiter.refill_rate
+            self.rate_limiter.pause_until(time.monotonic() + retry_after)
+    
+    def _adjust_concurrency(self, throttled: bool):
+        """
+        Additive-increase / multiplicative-decrease of the in-flight request target
+        
+        Args:
+            throttled (bool): True if the server answered 429
+        """
+        with self._concurrency_lock:
+            if throttled:
+                self._concurrency = max(1.0, self._concurrency * CONCURRENCY_DECREASE_FACTOR)
+            else:
+                self._concurrency = min(float(self.max_workers), self._concurrency + CONCURRENCY_INCREASE_STEP)
+    
+    def _should_retry(self, response, attempt: int) -> bool:
+        """
+        Feed a response into the reactive rate limiting and decide whether to retry it
+        
+        On a transient status (see ``TRANSIENT_STATUS_CODES``) the rate limiter
+        is paused for ``Retry-After`` (or an exponential backoff with jitter) so
+        the retry waits before going out again.
+        
+        Args:
+            response: HTTP response (``requests`` or ``httpx``)
+            attempt (int): Zero-based attempt number
+            
+        Returns:
+            bool: True if the request should be sent again
+        """
+        self._apply_rate_limit_headers(response)
+        
+        status_code = response.status_code
+        self._adjust_concurrency(throttled=status_code == 429)
+        if status_code not in TRANSIENT_STATUS_CODES or attempt == MAX_RETRIES:
+            return False
+        
+        # Back off for Retry-After if given, otherwise exponentially, plus jitter
+        delay = self._parse_retry_after(response)
+        if delay is None:
+            delay = BACKOFF_BASE_SECONDS * (2 ** attempt)
+        delay += random.uniform(0, BACKOFF_BASE_SECONDS)
+        self.rate_limiter.pause_until(time.monotonic() + delay)
+        return True
+    
+    @staticmethod
+    def _error_message(response) -> str:
+        """
+        Extract an error message from a failed response
+        
+        The body is only decoded when it is small JSON; HTML error pages fall
+        back to the HTTP reason phrase.
+        
+        Args:
+            response: HTTP response (``requests`` or ``httpx``)
+            
+        Returns:
+            str: Error message
+        """
+        reason = getattr(response, 'reason', None) or getattr(response, 'reason_phrase', '')
+        reason = reason or f"status {response.status_code}"
+        content_type = response.headers.get('Content-Type', '')
+        if content_type.startswith('application/json') and len(response.content) < MAX_ERROR_BODY_BYTES:
+            try:
+                error_data = _json_loads(response.content)
+            except _JSONDecodeError:
+                return reason
+            if isinstance(error_data, dict):
+                return str(error_data.get('message', reason))
+        return reason
     
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None) -> Dict[str, Any]:
+                     data: Optional[Dict] = None, cache_ttl: Optional[float] = None) -> Dict[str, Any]:
         """
         Make a request to the ISBNdb API with rate limiting
         
+        Lookups go cache first, then in-flight requests, then the network:
+        a caller asking for a request that another thread is already making
+        waits for that result instead of spending another rate-limit token.
+        
         Args:
             method (str): HTTP method (GET, POST, etc.)
             endpoint (str): API endpoint
             params (dict, optional): Query parameters
             data (dict, optional): Request body data
+            cache_ttl (float, optional): Cache successful GET responses for this many seconds
             
         Returns:
             dict: API response data
@@ -106,36 +516,200 @@ class ISBNdbAPI:
         Raises:
             ISBNdbAPIError: If the API request fails
         """
-        self.rate_limiter.wait_if_needed()
+        method = method.upper()
+        cache_key = self._cache_key(endpoint, params)
+        use_cache = cache_ttl is not None and method == 'GET'
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
         
-        url = f"{self.base_url}{endpoint}"
+        body_key = json.dumps(data, sort_keys=True) if data is not None else None
+        inflight_key = (method, cache_key, body_key)
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[inflight_key] = future
+        
+        if not is_leader:
+            return future.result()
         
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method.upper() == 'POST':
-                response = requests.post(url, headers=self.headers, json=data, params=params)
-            else:
-                raise ISBNdbAPIError(f"Unsupported HTTP method: {method}")
+            result = self._send_request(method, endpoint, params, data)
+            if use_cache:
+                self._cache_put(cache_key, result, cache_ttl)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[inflight_key]
+    
+    def _send_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                      data: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Send a request over the shared session with rate limiting and retries
+        
+        Rate-limit headers are honoured after every call, and transient
+        failures (429/5xx) are retried up to ``MAX_RETRIES`` times with
+        exponential backoff.
+        
+        Args:
+            method (str): HTTP method (GET or POST)
+            endpoint (str): API endpoint
+            params (dict, optional): Query parameters
+            data (dict, optional): Request body data
             
-            response.raise_for_status()
+        Returns:
+            dict: API response data
             
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                return {"raw_response": response.text}
-                
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code if e.response else None
-            try:
-                error_data = e.response.json() if e.response else {}
-                error_message = error_data.get('message', str(e))
-            except:
-                error_message = str(e)
-            raise ISBNdbAPIError(f"HTTP Error: {error_message}", status_code)
+        Raises:
+            ISBNdbAPIError: If the API request fails
+        """
+        url = f"{self.base_url}{endpoint}"
         
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                self.rate_limiter.wait_if_needed()
+                
+                if method == 'GET':
+                    response = self._session.get(url, params=params)
+                elif method == 'POST':
+                    response = self._session.post(url, headers=self._post_headers, json=data, params=params)
+                else:
+                    raise ISBNdbAPIError(f"Unsupported HTTP method: {method}")
+                
+                if not self._should_retry(response, attempt):
+                    break
         except requests.exceptions.RequestException as e:
             raise ISBNdbAPIError(f"Request Error: {str(e)}")
+        
+        if response.status_code >= 400:
+            raise ISBNdbAPIError(f"HTTP Error: {self._error_message(response)}", response.status_code)
+        
+        try:
+            return _json_loads(response.content)
+        except _JSONDecodeError:
+            return {"raw_response": response.text}
+    
+    async def _amake_request(self, client, method: str, endpoint: str, params: Optional[Dict] = None,
+                             data: Optional[Dict] = None, cache_ttl: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Asyncio counterpart of ``_make_request`` on an ``httpx.AsyncClient``
+        
+        Shares the rate limiter, AIMD concurrency target and response cache
+        with the synchronous path.
+        
+        Args:
+            client (httpx.AsyncClient): Client to send the request with
+            method (str): HTTP method (GET or POST)
+            endpoint (str): API endpoint
+            params (dict, optional): Query parameters
+            data (dict, optional): Request body data
+            cache_ttl (float, optional): Cache successful GET responses for this many seconds
+            
+        Returns:
+            dict: API response data
+            
+        Raises:
+            ISBNdbAPIError: If the API request fails
+        """
+        method = method.upper()
+        if method not in ('GET', 'POST'):
+            raise ISBNdbAPIError(f"Unsupported HTTP method: {method}")
+        
+        use_cache = cache_ttl is not None and method == 'GET'
+        if use_cache:
+            cache_key = self._cache_key(endpoint, params)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+        
+        url = f"{self.base_url}{endpoint}"
+        
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                await self.rate_limiter.wait_if_needed_async()
+                headers = self._post_headers if method == 'POST' else None
+                response = await client.request(method, url, params=params, json=data, headers=headers)
+                if not self._should_retry(response, attempt):
+                    break
+        except httpx.HTTPError as e:
+            raise ISBNdbAPIError(f"Request Error: {str(e)}")
+        
+        if response.status_code >= 400:
+            raise ISBNdbAPIError(f"HTTP Error: {self._error_message(response)}", response.status_code)
+        
+        try:
+            result = _json_loads(response.content)
+        except _JSONDecodeError:
+            return {"raw_response": response.text}
+        
+        if use_cache:
+            self._cache_put(cache_key, result, cache_ttl)
+        return result
+    
+    def _search_page(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch one page of a paginated search, then prefetch the following page
+        
+        A page that was already prefetched is taken from its pending future
+        instead of being requested again. Prefetches go through the same rate
+        limiter and cache as foreground requests.
+        
+        Args:
+            endpoint (str): API endpoint
+            params (dict): Query parameters including ``page`` and ``pageSize``
+            
+        Returns:
+            dict: Search results
+        """
+        key = self._cache_key(endpoint, params)
+        with self._prefetch_lock:
+            future = self._prefetch_futures.pop(key, None)
+        
+        result = None
+        if future is not None and not future.cancelled():
+            try:
+                result = future.result()
+            except ISBNdbAPIError:
+                result = None  # retry in the foreground so the caller sees the real error
+        if result is None:
+            result = self._make_request('GET', endpoint, params=params, cache_ttl=SEARCH_TTL)
+        
+        self._prefetch_next_page(endpoint, params, result)
+        return result
+    
+    def _prefetch_next_page(self, endpoint: str, params: Dict[str, Any], result: Dict[str, Any]):
+        """Submit a background fetch of the page after ``params['page']`` if there is one"""
+        if self._prefetch_pool is None:
+            return
+        
+        total = result.get('total')
+        if isinstance(total, int) and params['page'] * params['pageSize'] >= total:
+            return
+        
+        next_params = dict(params, page=params['page'] + 1)
+        next_key = self._cache_key(endpoint, next_params)
+        with self._prefetch_lock:
+            if next_key in self._prefetch_futures:
+                return
+            try:
+                self._prefetch_futures[next_key] = self._prefetch_pool.submit(
+                    self._make_request, 'GET', endpoint, params=next_params, cache_ttl=SEARCH_TTL)
+            except RuntimeError:
+                return  # pool shut down by close()
+            while len(self._prefetch_futures) > PREFETCH_MAX_PENDING:
+                _, stale = self._prefetch_futures.popitem(last=False)
+                stale.cancel()
+    
+    def _book_endpoint(self, isbn: str) -> str:
+        """Endpoint for one book, normalised so hyphenated and bare ISBNs share a URL and cache entry"""
+        return f"/book/{_quote_segment(self.format_isbn(isbn))}"
     
     # Author endpoints
     def get_author_details(self, author_name: str) -> Dict[str, Any]:
@@ -148,7 +722,7 @@ class ISBNdbAPI:
         Returns:
             dict: Author details
         """
-        endpoint = f"/author/{author_name}"
+        endpoint = f"/author/{_quote_segment(author_name)}"
         return self._make_request('GET', endpoint)
     
     def search_authors(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
@@ -163,12 +737,12 @@ class ISBNdbAPI:
         Returns:
             dict: Search results
         """
-        endpoint = f"/authors/{query}"
+        endpoint = f"/authors/{_quote_segment(query)}"
         params = {
             'page': page,
             'pageSize': page_size
         }
-        return self._make_request('GET', endpoint, params=params)
+        return self._search_page(endpoint, params)
     
     # Book endpoints
     def get_book_details(self, isbn: str) -> Dict[str, Any]:
@@ -181,8 +755,8 @@ class ISBNdbAPI:
         Returns:
             dict: Book details
         """
-        endpoint = f"/book/{isbn}"
-        return self._make_request('GET', endpoint)
+        endpoint = self._book_endpoint(isbn)
+        return self._make_request('GET', endpoint, cache_ttl=BOOK_DETAILS_TTL)
     
     def search_books_get(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
         """
@@ -196,12 +770,12 @@ class ISBNdbAPI:
         Returns:
             dict: Search results
         """
-        endpoint = f"/books/{query}"
+        endpoint = f"/books/{_quote_segment(query)}"
         params = {
             'page': page,
             'pageSize': page_size
         }
-        return self._make_request('GET', endpoint, params=params)
+        return self._search_page(endpoint, params)
     
     def search_books_post(self, search_criteria: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -236,7 +810,7 @@ class ISBNdbAPI:
         Returns:
             dict: Publisher details
         """
-        endpoint = f"/publisher/{publisher_name}"
+        endpoint = f"/publisher/{_quote_segment(publisher_name)}"
         return self._make_request('GET', endpoint)
     
     def search_publishers(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
@@ -251,12 +825,12 @@ class ISBNdbAPI:
         Returns:
             dict: Search results
         """
-        endpoint = f"/publishers/{query}"
+        endpoint = f"/publishers/{_quote_segment(query)}"
         params = {
             'page': page,
             'pageSize': page_size
         }
-        return self._make_request('GET', endpoint, params=params)
+        return self._search_page(endpoint, params)
     
     # Subject endpoints
     def get_subject_details(self, subject_name: str) -> Dict[str, Any]:
@@ -269,7 +843,7 @@ class ISBNdbAPI:
         Returns:
             dict: Subject details
         """
-        endpoint = f"/subject/{subject_name}"
+        endpoint = f"/subject/{_quote_segment(subject_name)}"
         return self._make_request('GET', endpoint)
     
     def search_subjects(self, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
@@ -284,12 +858,12 @@ class ISBNdbAPI:
         Returns:
             dict: Search results
         """
-        endpoint = f"/subjects/{query}"
+        endpoint = f"/subjects/{_quote_segment(query)}"
         params = {
             'page': page,
             'pageSize': page_size
         }
-        return self._make_request('GET', endpoint, params=params)
+        return self._search_page(endpoint, params)
     
     # Search endpoint
     def search_all_databases(self, index: str, query: str, page: int = 1, page_size: int = 20) -> Dict[str, Any]:
@@ -305,13 +879,13 @@ class ISBNdbAPI:
         Returns:
             dict: Search results
         """
-        endpoint = f"/search/{index}"
+        endpoint = f"/search/{_quote_segment(index)}"
         params = {
             'q': query,
             'page': page,
             'pageSize': page_size
         }
-        return self._make_request('GET', endpoint, params=params)
+        return self._search_page(endpoint, params)
     
     # Stats endpoint
     def get_database_stats(self) -> Dict[str, Any]:
@@ -322,33 +896,33 @@ class ISBNdbAPI:
             dict: Database statistics
         """
         endpoint = "/stats"
-        return self._make_request('GET', endpoint)
+        return self._make_request('GET', endpoint, cache_ttl=DATABASE_STATS_TTL)
     
     # Utility methods
     def validate_isbn(self, isbn: str) -> bool:
         """
-        Validate ISBN format (basic validation)
+        Validate ISBN format and check digit
         
         Args:
             isbn (str): ISBN to validate
             
         Returns:
-            bool: True if ISBN format is valid
+            bool: True if ISBN format and check digit are valid
         """
-        # Remove hyphens and spaces
-        clean_isbn = ''.join(c for c in isbn if c.isdigit() or c.upper() == 'X')
+        clean_isbn = self.format_isbn(isbn)
         
-        # Check length
-        if len(clean_isbn) not in [10, 13]:
-            return False
+        if _ISBN10_RE.fullmatch(clean_isbn):
+            # ISBN-10: weights 10..1, check digit X == 10, sum divisible by 11
+            total = sum(int(c) * w for c, w in zip(clean_isbn[:9], range(10, 1, -1)))
+            total += 10 if clean_isbn[9] == 'X' else int(clean_isbn[9])
+            return total % 11 == 0
         
-        # Basic format check
-        if len(clean_isbn) == 10:
-            # ISBN-10: 9 digits + check digit (can be X)
-            return clean_isbn[:-1].isdigit() and (clean_isbn[-1].isdigit() or clean_isbn[-1].upper() == 'X')
-        else:
-            # ISBN-13: all digits
-            return clean_isbn.isdigit()
+        if _ISBN13_RE.fullmatch(clean_isbn):
+            # ISBN-13: alternating weights 1 and 3, sum divisible by 10
+            total = sum(int(c) * (3 if i % 2 else 1) for i, c in enumerate(clean_isbn))
+            return total % 10 == 0
+        
+        return False
     
     def format_isbn(self, isbn: str) -> str:
         """
@@ -358,35 +932,235 @@ class ISBNdbAPI:
             isbn (str): ISBN to format
             
         Returns:
-            str: Formatted ISBN
+            str: Formatted ISBN (a trailing ISBN-10 check digit is upper-cased)
         """
-        return ''.join(c for c in isbn if c.isdigit() or c.upper() == 'X')
+        return isbn.translate(_ISBN_STRIP).upper()
     
-    def get_multiple_books(self, isbn_list: List[str]) -> List[Dict[str, Any]]:
+    def _split_cached_books(self, isbn_list: List[str]):
         """
-        Get details for multiple books by ISBN
+        Answer cached ISBNs up front so they never spend a rate-limit token
         
         Args:
             isbn_list (list): List of ISBNs
             
         Returns:
-            list: List of book details
+            tuple: (results list with cached entries filled in, indices still to fetch)
         """
-        results = []
-        for isbn in isbn_list:
-            try:
-                book_data = self.get_book_details(isbn)
-                results.append({
+        results: List[Optional[Dict[str, Any]]] = [None] * len(isbn_list)
+        pending = []
+        for index, isbn in enumerate(isbn_list):
+            cached = self._cache_get(self._cache_key(self._book_endpoint(isbn)))
+            if cached is not None:
+                results[index] = {
                     'isbn': isbn,
                     'success': True,
-                    'data': book_data
-                })
-            except ISBNdbAPIError as e:
-                results.append({
+                    'data': cached
+                }
+            else:
+                pending.append(index)
+        return results, pending
+    
+    def _batch_chunks(self, isbns: List[str], batch_size: Optional[int] = None):
+        """Yield successive lists of at most ``batch_size`` ISBNs"""
+        batch_size = batch_size or self.batch_size
+        iterator = iter(isbns)
+        chunk = list(islice(iterator, batch_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, batch_size))
+    
+    def _index_batch_response(self, chunk: List[str], response: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Match the books in a batch response back to the requested ISBNs
+        
+        Matched books are stored in the response cache in the same shape as
+        ``get_book_details`` returns them.
+        
+        Args:
+            chunk (list): ISBNs sent in the batch request
+            response (dict): Batch response data
+            
+        Returns:
+            dict: Requested ISBN -> book details, for the ISBNs that were found
+        """
+        by_isbn = {}
+        for book in response.get('data') or response.get('books') or []:
+            for key in ('isbn13', 'isbn', 'isbn10'):
+                if book.get(key):
+                    by_isbn[self.format_isbn(str(book[key]))] = book
+        
+        found = {}
+        for isbn in chunk:
+            book = by_isbn.get(self.format_isbn(isbn))
+            if book is not None:
+                found[isbn] = {'book': book}
+                self._cache_put(self._cache_key(self._book_endpoint(isbn)), found[isbn], BOOK_DETAILS_TTL)
+        return found
+    
+    def get_books_batch(self, isbns: List[str], batch_size: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get details for many books with one POST to /books per ``batch_size`` ISBNs
+        
+        Args:
+            isbns (list): List of ISBNs
+            batch_size (int, optional): ISBNs per request (default: plan limit)
+            
+        Returns:
+            dict: Requested ISBN -> book details, for the ISBNs that were found
+        """
+        found = {}
+        for chunk in self._batch_chunks(isbns, batch_size):
+            response = self._make_request('POST', '/books', data={'isbns': chunk})
+            found.update(self._index_batch_response(chunk, response))
+        return found
+    
+    @staticmethod
+    def _fill_found_books(isbn_list: List[str], results: List, pending: List[int],
+                          found: Dict[str, Dict[str, Any]]) -> List[int]:
+        """
+        Record batch hits in ``results``
+        
+        Returns:
+            list: Indices that still need a per-ISBN lookup
+        """
+        still_pending = []
+        for index in pending:
+            isbn = isbn_list[index]
+            if isbn in found:
+                results[index] = {
                     'isbn': isbn,
-                    'success': False,
-                    'error': str(e)
-                })
+                    'success': True,
+                    'data': found[isbn]
+                }
+            else:
+                still_pending.append(index)
+        return still_pending
+    
+    def get_multiple_books(self, isbn_list: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details for multiple books by ISBN
+        
+        Cached ISBNs are answered up front so they never spend a rate-limit
+        token, the rest are fetched with batch POSTs to /books, and only ISBNs
+        missing from the batch responses fall back to individual lookups.
+        
+        When httpx is installed and no event loop is running, this delegates to
+        ``get_multiple_books_async``. Otherwise the individual lookups are
+        issued from a thread pool over the shared session. Either way the
+        number in flight follows the AIMD concurrency target (at most
+        ``self.max_workers``) and the rate limiter bounds the overall rate.
+        
+        Args:
+            isbn_list (list): List of ISBNs
+            
+        Returns:
+            list: List of book details, in the same order as ``isbn_list``
+        """
+        if httpx is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.get_multiple_books_async(isbn_list))
+        
+        results, pending = self._split_cached_books(isbn_list)
+        
+        found = {}
+        for chunk in self._batch_chunks([isbn_list[index] for index in pending]):
+            try:
+                response = self._make_request('POST', '/books', data={'isbns': chunk})
+            except ISBNdbAPIError:
+                continue  # fall back to individual lookups for this chunk
+            found.update(self._index_batch_response(chunk, response))
+        pending = self._fill_found_books(isbn_list, results, pending, found)
+        
+        if not pending:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=max(1, int(self._concurrency))) as executor:
+            future_to_index = {
+                executor.submit(self.get_book_details, isbn_list[index]): index
+                for index in pending
+            }
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                isbn = isbn_list[index]
+                try:
+                    results[index] = {
+                        'isbn': isbn,
+                        'success': True,
+                        'data': future.result()
+                    }
+                except ISBNdbAPIError as e:
+                    results[index] = {
+                        'isbn': isbn,
+                        'success': False,
+                        'error': str(e)
+                    }
+        return results
+    
+    async def get_multiple_books_async(self, isbn_list: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details for multiple books by ISBN using ``httpx.AsyncClient``
+        
+        Same cache/batch/fallback strategy as ``get_multiple_books``; all
+        requests share one client, multiplexed over a single HTTP/2
+        connection when the ``h2`` package is installed.
+        
+        Args:
+            isbn_list (list): List of ISBNs
+            
+        Returns:
+            list: List of book details, in the same order as ``isbn_list``
+            
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for get_multiple_books_async (pip install httpx[http2])")
+        
+        results, pending = self._split_cached_books(isbn_list)
+        if not pending:
+            return results
+        
+        concurrency = max(1, int(self._concurrency))
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency)
+        
+        async with httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=limits, headers=self.headers) as client:
+            async def fetch_batch(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+                async with semaphore:
+                    try:
+                        response = await self._amake_request(client, 'POST', '/books', data={'isbns': chunk})
+                    except ISBNdbAPIError:
+                        return {}  # fall back to individual lookups for this chunk
+                    return self._index_batch_response(chunk, response)
+            
+            found = {}
+            chunks = self._batch_chunks([isbn_list[index] for index in pending])
+            for batch_found in await asyncio.gather(*(fetch_batch(chunk) for chunk in chunks)):
+                found.update(batch_found)
+            pending = self._fill_found_books(isbn_list, results, pending, found)
+            
+            async def fetch(index: int):
+                isbn = isbn_list[index]
+                async with semaphore:
+                    try:
+                        data = await self._amake_request(client, 'GET', self._book_endpoint(isbn),
+                                                         cache_ttl=BOOK_DETAILS_TTL)
+                        results[index] = {
+                            'isbn': isbn,
+                            'success': True,
+                            'data': data
+                        }
+                    except ISBNdbAPIError as e:
+                        results[index] = {
+                            'isbn': isbn,
+                            'success': False,
+                            'error': str(e)
+                        }
+            
+            await asyncio.gather(*(fetch(index) for index in pending))
+        
         return results
     
     def advanced_book_search(self, title: str = None, author: str = None, 
@@ -407,21 +1181,13 @@ class ISBNdbAPI:
         Returns:
             dict: Search results
         """
+        values = (title, author, publisher, subject, year)
         search_criteria = {
-            'page': page,
-            'pageSize': page_size
+            field: self._normalize_value(value)
+            for field, value in zip(self._ADV_FIELDS, values) if value
         }
-        
-        if title:
-            search_criteria['title'] = title
-        if author:
-            search_criteria['author'] = author
-        if publisher:
-            search_criteria['publisher'] = publisher
-        if subject:
-            search_criteria['subject'] = subject
-        if year:
-            search_criteria['year'] = year
+        search_criteria['page'] = page
+        search_criteria['pageSize'] = page_size
         
         return self.search_books_post(search_criteria)
 
@@ -0,0 +1,50 @@
+"""
+Tests for the ISBNdb API client's reactive rate limiting and error type
+"""
+
+import pickle
+import time
+
+from isbn_api_class import ISBNdbAPI, ISBNdbAPIError, SubscriptionPlan, RATE_LIMIT_REMAINING_THRESHOLD
+
+
+class FakeResponse:
+    """Minimal stand-in for a ``requests`` response carrying only headers"""
+    
+    def __init__(self, headers):
+        self.headers = headers
+
+
+def test_low_remaining_without_retry_after_pauses_for_one_refill():
+    """A nearly spent quota with no Retry-After pauses the limiter for one token's refill time"""
+    with ISBNdbAPI("test-key", SubscriptionPlan.PREMIUM, prefetch_pages=False) as client:
+        before = time.monotonic()
+        client._apply_rate_limit_headers(
+            FakeResponse({'X-RateLimit-Remaining': str(RATE_LIMIT_REMAINING_THRESHOLD)})
+        )
+        pause = client.rate_limiter.paused_until - before
+        assert 0 < pause <= 1.0 / client.rate_limiter.refill_rate + 0.1
+
+
+def test_low_remaining_honours_retry_after():
+    """An explicit Retry-After header takes precedence over the refill-based fallback"""
+    with ISBNdbAPI("test-key", SubscriptionPlan.BASIC, prefetch_pages=False) as client:
+        before = time.monotonic()
+        client._apply_rate_limit_headers(
+            FakeResponse({'X-RateLimit-Remaining': '0', 'Retry-After': '5'})
+        )
+        assert client.rate_limiter.paused_until - before >= 5
+
+
+def test_plenty_remaining_does_not_pause():
+    """Responses with quota to spare leave the limiter untouched"""
+    with ISBNdbAPI("test-key", SubscriptionPlan.BASIC, prefetch_pages=False) as client:
+        client._apply_rate_limit_headers(FakeResponse({'X-RateLimit-Remaining': '100'}))
+        assert client.rate_limiter.paused_until == 0.0
+
+
+def test_api_error_survives_pickling():
+    """ISBNdbAPIError keeps its status code across a pickle round trip"""
+    error = pickle.loads(pickle.dumps(ISBNdbAPIError("Too many requests", 429)))
+    assert error.message == "Too many requests"
+    assert error.status_code == 429
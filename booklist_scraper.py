@@ -1,16 +1,25 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
 import time
 import os
-import json
+import gzip
+import sqlite3
+import hashlib
+import re
+import asyncio
+import aiohttp
+import lxml.html
+from lxml import etree
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qs, urlencode
+import orjson
 import sys
 import uuid
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from bs4 import BeautifulSoup
 
 # Add current directory to Python path for module imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -22,42 +31,237 @@ from zlibraryCrowler.config import *
 
 # Functions imported from local modules
 from zlibraryCrowler.login import perform_login
-from zlibraryCrowler.getSearchDownloadLinks import process_books_selenium_fallback
+from zlibraryCrowler.driver_factory import get_driver, quit_driver
+from zlibraryCrowler.getSearchDownloadLinks import process_books_selenium_fallback, fetch_page_content
 from zlibraryCrowler.getCookies import get_cookies_from_selenium
 
-class BooklistScraper:
-    def __init__(self):
-        self.chrome_options = Options()
-        if USE_HEADLESS_BROWSER:
-            self.chrome_options.add_argument('--headless')
+# Read every z-bookcard's fields in the browser so only this data crosses the
+# WebDriver wire instead of the whole serialized DOM
+BOOKCARDS_SCRIPT = """
+return Array.from(document.querySelectorAll('z-bookcard')).map(b => ({
+    id: b.getAttribute('id'),
+    href: b.getAttribute('href'),
+    title: b.querySelector('div[slot="title"]')?.textContent ?? null,
+    author: b.querySelector('div[slot="author"]')?.textContent ?? null,
+    language: b.getAttribute('language'),
+    extension: b.getAttribute('extension'),
+    filesize: b.getAttribute('filesize'),
+    year: b.getAttribute('year')
+}));
+"""
+# Start fetching the next booklist page in the background (not awaited) so it
+# is in the browser's HTTP cache by the time the next-page link is clicked
+PREFETCH_NEXT_PAGE_SCRIPT = """
+const next = document.querySelector('a[rel="next"]');
+if (!next || !next.href) {
+    return null;
+}
+fetch(next.href, {credentials: 'include'}).catch(() => {});
+return next.href;
+"""
+
+# XPath queries for booklist pages fetched over HTTP (server-rendered bookcards)
+BOOKCARDS_XPATH = etree.XPath('//z-bookcard')
+TITLE_SLOT_XPATH = etree.XPath('.//div[@slot="title"]')
+AUTHOR_SLOT_XPATH = etree.XPath('.//div[@slot="author"]')
+NEXT_LINK_XPATH = etree.XPath('//a[@rel="next"]/@href')
+# Only the paginator's links count towards the last page number
+PAGE_LINKS_XPATH = etree.XPath('//*[@id="paginator" or contains(concat(" ", normalize-space(@class), " "), " paginator ")]'
+                               '//a[contains(@href, "page=")]/@href')
+PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)')
+
+# Read the booklists index the same way: one script returns every booklist's
+# title, creator, stats blocks, label and carousel covers
+BOOKLISTS_SCRIPT = """
+return Array.from(document.querySelectorAll('div.content')).map(c => {
+    const t = c.querySelector('div.title a');
+    const acc = c.querySelector('z-account');
+    const blocks = Array.from(c.querySelectorAll('div.info-block')).map(b => ({
+        cls: b.querySelector('span.icon')?.className ?? null,
+        val: b.querySelector('span.value')?.textContent ?? null
+    }));
+    const books = c.querySelector('div.books');
+    const covers = books ? Array.from(books.querySelectorAll('z-cover')).map(z => ({
+        id: z.getAttribute('id'),
+        title: z.getAttribute('title'),
+        author: z.getAttribute('author'),
+        href: z.closest('a')?.getAttribute('href') ?? null
+    })) : null;
+    return {
+        title: t?.textContent ?? null,
+        href: t?.getAttribute('href') ?? null,
+        creator: acc?.textContent ?? null,
+        creator_id: acc?.getAttribute('id') ?? null,
+        creator_href: acc?.getAttribute('href') ?? null,
+        blocks: blocks,
+        covers: covers,
+        label: c.querySelector('div.editors-choice-label')?.textContent ?? null
+    };
+});
+"""
+
+
+def _slot_text(slots):
+    """textContent of the first slot element, or None (mirrors BOOKCARDS_SCRIPT)"""
+    return slots[0].text_content() if slots else None
+
+
+def parse_bookcards(tree):
+    """
+    Read z-bookcard records from a parsed booklist page
+    
+    Returns:
+        list: Records with the same keys BOOKCARDS_SCRIPT returns
+    """
+    return [{
+        'id': card.get('id'),
+        'href': card.get('href'),
+        'title': _slot_text(TITLE_SLOT_XPATH(card)),
+        'author': _slot_text(AUTHOR_SLOT_XPATH(card)),
+        'language': card.get('language'),
+        'extension': card.get('extension'),
+        'filesize': card.get('filesize'),
+        'year': card.get('year')
+    } for card in BOOKCARDS_XPATH(tree)]
+
+
+def page_url(url, page):
+    """Return ``url`` with its ``page`` query parameter set to ``page``"""
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    query['page'] = [str(page)]
+    return urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+
+
+class _SafeFilenameTable(dict):
+    """str.translate table keeping alphanumerics, spaces, '-' and '_'
+    
+    Entries are computed on first use per code point, so non-ASCII letters
+    are kept and non-ASCII punctuation dropped exactly as str.isalnum decides.
+    """
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = None if not (char.isalnum() or char in ' -_') else codepoint
+        self[codepoint] = value
+        return value
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+class ScrapedIndex:
+    """SQLite record of scraped booklists, shared by the scraper threads"""
+    
+    def __init__(self, path=SCRAPED_INDEX_FILE):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS scraped ('
+                'url TEXT PRIMARY KEY, ts INTEGER, n_books INTEGER, '
+                'book_count TEXT, content_hash TEXT)'
+            )
+    
+    def is_fresh(self, booklist_info, max_age=RESCRAPE_AFTER_SECONDS):
+        """
+        Check whether a booklist was scraped recently and looks unchanged
         
-        # Add all Chrome options from config
-        for option in CHROME_OPTIONS:
-            self.chrome_options.add_argument(option)
+        Returns:
+            bool: True if it was scraped within ``max_age`` seconds and its
+                book count on the index page is the same as it was then
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT ts, book_count FROM scraped WHERE url = ?', (booklist_info['url'],)
+            ).fetchone()
+        if row is None:
+            return False
+        scraped_at, book_count = row
+        return (time.time() - scraped_at < max_age
+                and book_count == booklist_info.get('stats', {}).get('book_count'))
+    
+    @staticmethod
+    def content_hash(books):
+        """Hash of a booklist's scraped books, taken before download links are added"""
+        return hashlib.blake2b(orjson.dumps(books, option=orjson.OPT_NON_STR_KEYS)).hexdigest()
+    
+    def is_unchanged(self, booklist_info, content_hash):
+        """
+        Check whether a booklist's books hash the same as when it was last saved
         
-        self.driver = webdriver.Chrome(options=self.chrome_options)
-        self.wait = WebDriverWait(self.driver, BROWSER_TIMEOUT)
+        Returns:
+            bool: True if the stored ``content_hash`` matches, so its saved
+                output is still current and need not be rewritten
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content_hash FROM scraped WHERE url = ?', (booklist_info['url'],)
+            ).fetchone()
+        return row is not None and row[0] == content_hash
+    
+    def record(self, booklist_info, books, content_hash):
+        """Store that a booklist was scraped now, with the hash of its books"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO scraped (url, ts, n_books, book_count, content_hash) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (booklist_info['url'], int(time.time()), len(books),
+                 booklist_info.get('stats', {}).get('book_count'), content_hash)
+            )
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class BooklistScraper:
+    def __init__(self, driver=None, wait=None, profile_id=0):
+        """
+        Args:
+            driver: Existing WebDriver to use; the factory's browser for
+                ``profile_id`` is used if None
+            wait: WebDriverWait for ``driver``; created if None
+            profile_id: Persistent Chrome profile of the factory browser
+        """
+        # Only the booklist markup is needed, so the factory's scrape-only
+        # browser (no images, plugins or extensions) is used
+        self.profile_id = None if driver is not None else profile_id
+        if driver is None:
+            driver = get_driver(profile_id)
+        self.driver = driver
+        self.wait = wait if wait is not None else WebDriverWait(self.driver, BROWSER_TIMEOUT)
         self.booklists_url = f"{ZLIBRARY_BASE_URL}/booklists"
+        self.cookies = None
         
     def login(self):
         """Perform login to Z-Library"""
         return perform_login(self.driver, self.wait, COOKIES_FILE, EMAIL, PASSWORD)
     
+    def wait_for_content(self, selector):
+        """
+        Wait until an element matching ``selector`` is present
+        
+        Returns:
+            bool: True if the element appeared before BROWSER_TIMEOUT
+        """
+        try:
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+            return True
+        except TimeoutException:
+            print(f"Timed out waiting for '{selector}' on {self.driver.current_url}")
+            return False
+    
     def get_booklist_elements(self):
         """Scrape all booklist elements from the booklists page"""
         try:
             print(f"Navigating to booklists page: {self.booklists_url}")
             self.driver.get(self.booklists_url)
             
-            # Wait for the page to load
-            time.sleep(3)
-            
-            # Get page source and parse with BeautifulSoup
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # Wait for the booklists to render
+            self.wait_for_content('div.content')
             
-            # Find all booklist content elements
-            booklist_elements = soup.find_all('div', class_='content')
+            # Read all booklist content elements in one script call
+            booklist_elements = self.driver.execute_script(BOOKLISTS_SCRIPT) or []
             
             print(f"Found {len(booklist_elements)} booklist elements")
             
@@ -79,54 +283,52 @@ class BooklistScraper:
             return []
     
     def extract_booklist_info(self, element):
-        """Extract information from a single booklist element"""
+        """Build booklist information from a record returned by BOOKLISTS_SCRIPT"""
         try:
+            base = ZLIBRARY_BASE_URL
             booklist_info = {}
             
             # Extract title and URL
-            title_element = element.find('div', class_='title')
-            if title_element:
-                title_link = title_element.find('a')
-                if title_link:
-                    booklist_info['title'] = title_link.text.strip()
-                    booklist_info['url'] = f"{ZLIBRARY_BASE_URL}{title_link.get('href')}"
-                else:
-                    return None
+            title = element.get('title')
+            if title is not None:
+                booklist_info['title'] = title.strip()
+                booklist_info['url'] = f"{base}{element.get('href')}"
             else:
                 return None
             
             # Extract author/creator information
-            account_element = element.find('z-account')
-            if account_element:
-                booklist_info['creator'] = account_element.text.strip()
-                booklist_info['creator_id'] = account_element.get('id')
-                booklist_info['creator_url'] = f"{ZLIBRARY_BASE_URL}{account_element.get('href')}" if account_element.get('href') else None
+            creator = element.get('creator')
+            if creator is not None:
+                creator_href = element.get('creator_href')
+                booklist_info['creator'] = creator.strip()
+                booklist_info['creator_id'] = element.get('creator_id')
+                booklist_info['creator_url'] = base + creator_href if creator_href else None
             
             # Extract statistics
-            info_blocks = element.find_all('div', class_='info-block')
             booklist_info['stats'] = {}
             
-            for block in info_blocks:
-                icon = block.find('span', class_='icon')
-                value = block.find('span', class_='value')
+            for block in element.get('blocks') or []:
+                icon_class = block.get('cls')
+                value = block.get('val')
                 
-                if icon and value:
-                    if 'zlibicon-bookmark' in icon.get('class', []):
-                        booklist_info['stats']['book_count'] = value.text.strip()
-                    elif 'zlibicon-eye' in icon.get('class', []):
-                        booklist_info['stats']['views'] = value.text.strip()
-                    elif 'zlibicon-comment' in icon.get('class', []):
-                        booklist_info['stats']['comments'] = value.text.strip()
+                if icon_class is not None and value is not None:
+                    icon_classes = icon_class.split()
+                    if 'zlibicon-bookmark' in icon_classes:
+                        booklist_info['stats']['book_count'] = value.strip()
+                    elif 'zlibicon-eye' in icon_classes:
+                        booklist_info['stats']['views'] = value.strip()
+                    elif 'zlibicon-comment' in icon_classes:
+                        booklist_info['stats']['comments'] = value.strip()
             
             # Extract labels (like "Editor's Choice")
-            label_element = element.find('div', class_='editors-choice-label')
-            if label_element:
-                booklist_info['label'] = label_element.text.strip()
+            label = element.get('label')
+            if label is not None:
+                booklist_info['label'] = label.strip()
             
             # Extract preview books from the carousel
-            books_element = element.find('div', class_='books')
-            if books_element:
-                booklist_info['preview_books'] = self.extract_preview_books(books_element)
+            covers = element.get('covers')
+            if covers is not None:
+                booklist_info['preview_books'] = self.extract_preview_books(covers)
             
             return booklist_info
             
@@ -134,42 +336,44 @@ class BooklistScraper:
             print(f"Error extracting booklist info from element: {e}")
             return None
     
-    def extract_preview_books(self, books_element):
-        """Extract preview books from the carousel"""
+    def extract_preview_books(self, covers):
+        """Build preview books from the carousel cover records"""
         preview_books = []
+        base = ZLIBRARY_BASE_URL
+        append = preview_books.append
         
         try:
-            # Find all z-cover elements
-            covers = books_element.find_all('z-cover')
-            
             for cover in covers:
-                book_info = {
-                    'id': cover.get('id'),
-                    'title': cover.get('title'),
-                    'author': cover.get('author'),
-                    'url': None
-                }
-                
-                # Get the parent link to extract URL
-                parent_link = cover.find_parent('a')
-                if parent_link:
-                    book_info['url'] = f"{ZLIBRARY_BASE_URL}{parent_link.get('href')}"
-                
-                preview_books.append(book_info)
+                get = cover.get
+                href = get('href')
+                append({
+                    'id': get('id'),
+                    'title': get('title'),
+                    'author': get('author'),
+                    'url': base + href if href else None
+                })
         
         except Exception as e:
             print(f"Error extracting preview books: {e}")
         
         return preview_books
     
-    def scrape_full_booklist(self, booklist_url):
-        """Scrape all books from a specific booklist"""
+    def scrape_full_booklist(self, booklist_url, records_path=None):
+        """
+        Scrape all books from a specific booklist
+        
+        Args:
+            booklist_url: URL of the booklist
+            records_path: If given, each page's books are appended to this file
+                as NDJSON as soon as they are scraped
+        """
+        records_file = open(records_path, 'ab') if records_path else None
         try:
             print(f"Scraping full booklist: {booklist_url}")
             self.driver.get(booklist_url)
             
-            # Wait for the page to load
-            time.sleep(3)
+            # Wait for the book cards to render
+            self.wait_for_content('z-bookcard, div.content')
             
             books = []
             page = 1
@@ -177,12 +381,11 @@ class BooklistScraper:
             while True:
                 print(f"Scraping page {page} of booklist...")
                 
-                # Get page source and parse
-                page_source = self.driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
+                # Let the next page download while this one is extracted
+                self.prefetch_next_page()
                 
-                # Find all book elements on the page
-                book_elements = soup.find_all('z-bookcard')
+                # Extract all book cards on the page in one script call
+                book_elements = self.driver.execute_script(BOOKCARDS_SCRIPT)
                 
                 if not book_elements:
                     print(f"No books found on page {page}, ending...")
@@ -191,17 +394,23 @@ class BooklistScraper:
                 print(f"Found {len(book_elements)} books on page {page}")
                 
                 # Extract book information
-                for book_element in book_elements:
-                    book_info = self.extract_book_info(book_element)
-                    if book_info:
-                        books.append(book_info)
+                page_books = [book_info for book_info in map(self.extract_book_info, book_elements) if book_info]
+                books.extend(page_books)
+                
+                # Persist the page so a crash later in the list keeps it
+                if records_file is not None and page_books:
+                    records_file.write(b''.join(orjson.dumps(book) + b'\n' for book in page_books))
+                    records_file.flush()
                 
                 # Check if there's a next page
                 try:
                     next_button = self.driver.find_element(By.CSS_SELECTOR, 'a[rel="next"]')
                     if next_button and next_button.is_enabled():
+                        first_card = self.driver.find_element(By.CSS_SELECTOR, 'z-bookcard')
                         next_button.click()
-                        time.sleep(3)
+                        # The next page has loaded once the old cards are detached
+                        self.wait.until(EC.staleness_of(first_card))
+                        self.wait_for_content('z-bookcard, div.content')
                         page += 1
                     else:
                         break
@@ -214,35 +423,115 @@ class BooklistScraper:
         except Exception as e:
             print(f"Error scraping full booklist: {e}")
             return []
+        
+        finally:
+            if records_file is not None:
+                records_file.close()
     
-    def extract_book_info(self, book_element):
-        """Extract information from a single book element"""
+    async def scrape_full_booklist_async(self, booklist_url, cookies, records_path=None):
+        """
+        Scrape all books from a booklist over HTTP using the browser's session cookies
+        
+        The first page is fetched alone; if its pagination links reveal the
+        last page number the remaining pages are fetched concurrently,
+        otherwise rel="next" links are followed one at a time. If any page
+        fails to load, [] is returned so the caller falls back to the browser
+        instead of saving a partial booklist.
+        
+        Args:
+            booklist_url: URL of the booklist
+            cookies: Session cookies copied from the logged-in browser
+            records_path: If given, the books are appended to this file as NDJSON
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async with aiohttp.ClientSession() as session:
+            async def fetch(url):
+                async with semaphore:
+                    return await fetch_page_content(session, url, cookies)
+            
+            first_page = await fetch(booklist_url)
+            if first_page is None:
+                return []
+            
+            trees = [lxml.html.fromstring(first_page)]
+            last_page = max((int(match.group(1)) for href in PAGE_LINKS_XPATH(trees[0])
+                             if (match := PAGE_PARAM_RE.search(href))), default=1)
+            
+            if last_page > 1:
+                print(f"Fetching pages 2-{last_page} of booklist concurrently...")
+                pages = await asyncio.gather(*(fetch(page_url(booklist_url, page))
+                                               for page in range(2, last_page + 1)))
+                if any(page is None for page in pages):
+                    print("Some booklist pages could not be fetched over HTTP")
+                    return []
+                trees.extend(lxml.html.fromstring(page) for page in pages)
+            else:
+                visited = {booklist_url}
+                next_hrefs = NEXT_LINK_XPATH(trees[0])
+                while next_hrefs:
+                    next_url = urljoin(booklist_url, next_hrefs[0])
+                    if next_url in visited:
+                        break
+                    visited.add(next_url)
+                    page = await fetch(next_url)
+                    if page is None:
+                        print(f"Could not fetch booklist page {next_url} over HTTP")
+                        return []
+                    trees.append(lxml.html.fromstring(page))
+                    next_hrefs = NEXT_LINK_XPATH(trees[-1])
+        
+        books = []
+        for page_number, tree in enumerate(trees, 1):
+            cards = parse_bookcards(tree)
+            print(f"Found {len(cards)} books on page {page_number}")
+            books.extend(book_info for book_info in map(self.extract_book_info, cards) if book_info)
+        
+        if records_path and books:
+            with open(records_path, 'ab', buffering=OUTPUT_BUFFER_SIZE) as records_file:
+                records_file.write(b''.join(orjson.dumps(book) + b'\n' for book in books))
+        
+        return books
+    
+    def scrape_full_booklist_http(self, booklist_url, records_path=None):
+        """Scrape a booklist over HTTP without driving the browser; returns [] on failure"""
+        try:
+            print(f"Fetching full booklist over HTTP: {booklist_url}")
+            if self.cookies is None:
+                self.cookies = get_cookies_from_selenium(self.driver)
+            return asyncio.run(self.scrape_full_booklist_async(booklist_url, self.cookies, records_path))
+        except Exception as e:
+            print(f"Error fetching booklist over HTTP: {e}")
+            return []
+    
+    def prefetch_next_page(self):
+        """Warm the browser cache with the next booklist page, if there is one"""
         try:
-            book_info = {
-                'id': book_element.get('id'),
-                'book_page_url': f"{ZLIBRARY_BASE_URL}{book_element.get('href')}" if book_element.get('href') else None,
-                'title': None,
-                'author': None,
-                'language': book_element.get('language'),
-                'file_type': book_element.get('extension'),
-                'file_size': book_element.get('filesize'),
-                'year': book_element.get('year'),
+            return self.driver.execute_script(PREFETCH_NEXT_PAGE_SCRIPT)
+        except WebDriverException as e:
+            print(f"Error prefetching next page: {e}")
+            return None
+    
+    def extract_book_info(self, card):
+        """Build book information from a z-bookcard record returned by BOOKCARDS_SCRIPT"""
+        try:
+            get = card.get
+            href = get('href')
+            title = get('title')
+            author = get('author')
+            return {
+                'id': get('id'),
+                'book_page_url': ZLIBRARY_BASE_URL + href if href else None,
+                'title': title.strip() if title is not None else None,
+                'author': author.strip() if author is not None else None,
+                'language': get('language'),
+                'file_type': get('extension'),
+                'file_size': get('filesize'),
+                'year': get('year'),
                 'download_url': None,
                 'download_links': []
             }
             
-            # Extract title
-            title_element = book_element.find('div', {"slot": "title"})
-            if title_element:
-                book_info['title'] = title_element.text.strip()
-            
-            # Extract author
-            author_element = book_element.find('div', {"slot": "author"})
-            if author_element:
-                book_info['author'] = author_element.text.strip()
-            
-            return book_info
-            
         except Exception as e:
             print(f"Error extracting book info: {e}")
             return None
@@ -257,31 +546,47 @@ class BooklistScraper:
             print(f"Error getting download links: {e}")
             return books
     
+    def booklist_filepath(self, booklist_info, extension, output_dir="output/json"):
+        """Build a timestamped output path for a booklist, creating ``output_dir``"""
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Generate filename
+        safe_title = booklist_info.get('title', 'unknown').translate(_SAFE_FILENAME_TABLE).rstrip()
+        safe_title = safe_title.replace(' ', '_')[:50]  # Limit length
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"booklist_{safe_title}_{timestamp}.{extension}"
+        return os.path.join(output_dir, filename)
+    
     def save_booklist_data(self, booklist_info, books, output_dir="output/json"):
-        """Save booklist data to JSON file"""
+        """
+        Save booklist data to a JSON file
+        
+        With COMPRESS_BOOKLIST_OUTPUT the file is gzipped NDJSON: a header
+        record holding everything except the books, then one book per line,
+        so readers can stream it without loading the whole booklist.
+        """
         try:
-            # Create output directory if it doesn't exist
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Generate filename
-            safe_title = "".join(c for c in booklist_info.get('title', 'unknown') if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_title = safe_title.replace(' ', '_')[:50]  # Limit length
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"booklist_{safe_title}_{timestamp}.json"
-            filepath = os.path.join(output_dir, filename)
-            
             # Prepare data structure
-            output_data = {
+            header = {
                 'booklist_info': booklist_info,
                 'total_books': len(books),
-                'books': books,
                 'scraped_at': datetime.now().isoformat(),
                 'scraper_version': '1.0'
             }
             
             # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, ensure_ascii=False, indent=4)
+            if COMPRESS_BOOKLIST_OUTPUT:
+                filepath = self.booklist_filepath(booklist_info, 'ndjson.gz', output_dir)
+                lines = [orjson.dumps(header, option=orjson.OPT_NON_STR_KEYS)]
+                lines.extend(orjson.dumps(book, option=orjson.OPT_NON_STR_KEYS) for book in books)
+                with gzip.open(filepath, 'wb') as f:
+                    f.write(b'\n'.join(lines) + b'\n')
+            else:
+                filepath = self.booklist_filepath(booklist_info, 'json', output_dir)
+                output_data = dict(header, books=books)
+                with open(filepath, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+                    f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             print(f"Saved booklist data to: {filepath}")
             return filepath
@@ -290,8 +595,88 @@ class BooklistScraper:
             print(f"Error saving booklist data: {e}")
             return None
     
-    def scrape_all_booklists(self, max_booklists=None, include_download_links=True):
-        """Scrape all booklists and their books"""
+    def process_booklist(self, booklist_info, index, total, include_download_links=True,
+                         scraped_index=None):
+        """Scrape, enrich and save a single booklist, recording it in ``scraped_index`` if given"""
+        try:
+            print(f"\n{'='*60}")
+            print(f"Processing booklist {index}/{total}: {booklist_info.get('title', 'Unknown')}")
+            print(f"{'='*60}")
+            
+            # Scrape all books from this booklist, checkpointing pages as NDJSON.
+            # Pages are fetched over HTTP with the session cookies first and
+            # only driven through the browser if that yields nothing
+            records_path = self.booklist_filepath(booklist_info, 'ndjson')
+            books = []
+            if USE_ASYNC_EXTRACTION:
+                books = self.scrape_full_booklist_http(booklist_info['url'], records_path)
+            if not books:
+                books = self.scrape_full_booklist(booklist_info['url'], records_path)
+            
+            content_hash = ScrapedIndex.content_hash(books) if books else None
+            if books and scraped_index is not None and scraped_index.is_unchanged(booklist_info, content_hash):
+                # Same books as the saved output: skip link extraction and keep that file
+                print(f"Booklist unchanged since it was last saved ({len(books)} books), skipping")
+                if os.path.exists(records_path):
+                    os.remove(records_path)
+                scraped_index.record(booklist_info, books, content_hash)
+            elif books:
+                print(f"Successfully scraped {len(books)} books from booklist")
+                
+                # Get download links if requested
+                if include_download_links and EXTRACT_DOWNLOAD_LINKS:
+                    print("Extracting download links...")
+                    books = self.get_download_links_for_books(books)
+                    books_with_links = sum(1 for book in books if book.get('download_links'))
+                    print(f"Successfully extracted download links for {books_with_links}/{len(books)} books")
+                
+                # Save the data; the checkpoint is only needed if this fails
+                if self.save_booklist_data(booklist_info, books):
+                    if os.path.exists(records_path):
+                        os.remove(records_path)
+                    if scraped_index is not None:
+                        scraped_index.record(booklist_info, books, content_hash)
+            else:
+                print(f"No books found in booklist: {booklist_info.get('title', 'Unknown')}")
+            
+            # Add delay between booklists
+            time.sleep(2)
+            
+        except Exception as e:
+            print(f"Error processing booklist {booklist_info.get('title', 'Unknown')}: {e}")
+    
+    def _start_workers(self, count):
+        """Start and log in up to ``count`` extra scrapers, each with its own browser"""
+        workers = []
+        first_profile = (self.profile_id or 0) + 1
+        for profile_id in range(first_profile, first_profile + count):
+            worker = None
+            try:
+                # Each browser needs its own profile directory
+                worker = BooklistScraper(profile_id=profile_id)
+                # Logs in from the cookies saved by this scraper's own login
+                if worker.login():
+                    workers.append(worker)
+                else:
+                    print("Worker browser login failed, continuing with fewer browsers")
+                    worker.close()
+            except Exception as e:
+                print(f"Error starting worker browser: {e}")
+                if worker is not None:
+                    worker.close()
+        return workers
+    
+    def scrape_all_booklists(self, max_booklists=None, include_download_links=True,
+                             max_workers=MAX_PARALLEL_BROWSERS, skip_scraped=True):
+        """
+        Scrape all booklists and their books
+        
+        Booklists are spread over up to ``max_workers`` browser instances (this
+        one plus extra logged-in scrapers) running in parallel threads. With
+        ``skip_scraped``, booklists the on-disk index shows as recently scraped
+        and unchanged are skipped.
+        """
+        scraped_index = None
         try:
             # Get all booklist elements
             booklists_data = self.get_booklist_elements()
@@ -307,45 +692,56 @@ class BooklistScraper:
                 booklists_data = booklists_data[:max_booklists]
                 print(f"Limited to first {max_booklists} booklists")
             
-            for i, booklist_info in enumerate(booklists_data, 1):
+            scraped_index = ScrapedIndex()
+            if skip_scraped:
+                fresh = [info for info in booklists_data if scraped_index.is_fresh(info)]
+                if fresh:
+                    print(f"Skipping {len(fresh)} booklists already scraped and unchanged")
+                    booklists_data = [info for info in booklists_data if info not in fresh]
+                if not booklists_data:
+                    print("All booklists are up to date!")
+                    return
+            
+            total = len(booklists_data)
+            worker_count = max(1, min(max_workers or 1, total))
+            workers = self._start_workers(worker_count - 1) if worker_count > 1 else []
+            
+            # Each task borrows an idle scraper (and its browser) from the pool
+            idle_scrapers = queue.Queue()
+            for scraper in [self] + workers:
+                idle_scrapers.put(scraper)
+            
+            def run(index, booklist_info):
+                scraper = idle_scrapers.get()
                 try:
-                    print(f"\n{'='*60}")
-                    print(f"Processing booklist {i}/{len(booklists_data)}: {booklist_info.get('title', 'Unknown')}")
-                    print(f"{'='*60}")
-                    
-                    # Scrape all books from this booklist
-                    books = self.scrape_full_booklist(booklist_info['url'])
-                    
-                    if books:
-                        print(f"Successfully scraped {len(books)} books from booklist")
-                        
-                        # Get download links if requested
-                        if include_download_links and EXTRACT_DOWNLOAD_LINKS:
-                            print("Extracting download links...")
-                            books = self.get_download_links_for_books(books)
-                            books_with_links = sum(1 for book in books if book.get('download_links'))
-                            print(f"Successfully extracted download links for {books_with_links}/{len(books)} books")
-                        
-                        # Save the data
-                        self.save_booklist_data(booklist_info, books)
-                    else:
-                        print(f"No books found in booklist: {booklist_info.get('title', 'Unknown')}")
-                    
-                    # Add delay between booklists
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    print(f"Error processing booklist {booklist_info.get('title', 'Unknown')}: {e}")
-                    continue
+                    scraper.process_booklist(booklist_info, index, total, include_download_links,
+                                             scraped_index)
+                finally:
+                    idle_scrapers.put(scraper)
+            
+            try:
+                with ThreadPoolExecutor(max_workers=1 + len(workers)) as executor:
+                    for index, booklist_info in enumerate(booklists_data, 1):
+                        executor.submit(run, index, booklist_info)
+            finally:
+                for worker in workers:
+                    worker.close()
         
         except Exception as e:
             print(f"Error in scrape_all_booklists: {e}")
+        
+        finally:
+            if scraped_index is not None:
+                scraped_index.close()
     
     def close(self):
         """Close the browser"""
         try:
             time.sleep(BROWSER_SLEEP_TIME)
-            self.driver.quit()
+            if self.profile_id is not None:
+                quit_driver(self.profile_id)
+            else:
+                self.driver.quit()
         except:
             pass
 
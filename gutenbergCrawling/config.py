@@ -2,10 +2,15 @@ MONGO_URI = "mongodb://localhost:27017/"
 MONGO_DATABASE = "gutenberg"
 MONGO_COLLECTION = "books"
 MONGO_PAIRS_COLLECTION = "translation_pairs"
+MONGO_STATE_COLLECTION = "crawl_state" # Resumable progress of long scans
 # Note: For a real application, the password should not be hardcoded.
 # It's included here as per the user's specific request.
 MONGO_USERNAME = "user" # Placeholder, will be used if authentication is set up on MongoDB
 MONGO_PASSWORD = "123456.a" # As requested by the user
+MONGO_MAX_POOL_SIZE = 64 # Connections shared by concurrent crawler tasks
+MONGO_MIN_POOL_SIZE = 8
+MONGO_BULK_BATCH_SIZE = 500 # Book upserts sent per bulk_write
+PAIRS_BATCH_SIZE = 100 # Translation pairs sent per insert_many
 
 TARGET_LANGUAGES = ["en", "zh"] # English and Chinese
 
@@ -20,5 +25,26 @@ GUTENBERG_SEARCH_URL = "https://www.gutenberg.org/ebooks/search/?query=&submit_s
 # Download settings
 DOWNLOAD_DIR = "downloaded_books"
 MAX_DOWNLOAD_THREADS = 5
+DOWNLOAD_CHUNK_SIZE = 256 * 1024 # Bytes read from the response per chunk
+WRITE_BATCH_SIZE = 1024 * 1024 # Chunks are gathered up to this many bytes and written with one writev call
+DOWNLOAD_LOG_LEVEL = "INFO" # Set to "DEBUG" to log every download attempt
+STATUS_BATCH_SIZE = 50 # Download status updates sent per bulk_write
+STATUS_FLUSH_INTERVAL = 1.0 # Max seconds a status update waits before being written
 MAX_TRANSLATION_PAIRS = 10 # Max pairs to find and download
 MAX_ENGLISH_SEARCH_PAGES_FOR_PAIRS = 10 # Max pages of English books to check for authors
+TRANSLATION_SEARCH_WORKERS = 2 # Authors searched for Chinese books at once while the English scan runs
+BOOKS_PER_LISTING_PAGE = 25 # Search results per page; used to build start_index pagination URLs
+LISTING_PAGE_BATCH_SIZE = 4 # Listing pages fetched at once; the next batch waits until these are processed
+
+# HTTP crawling settings (listing and detail pages are fetched without a browser)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.85 Safari/537.36"
+HTTP_CONCURRENCY = 16 # Max simultaneous connections to gutenberg.org
+DETAIL_FETCH_CONCURRENCY = 8 # Book detail pages fetched at once per listing page
+HTTP_TIMEOUT = 30 # Seconds per page request
+REQUEST_DELAY = 0.2 # Politeness gap after each detail page, per concurrent slot
+USE_SELENIUM_FALLBACK = False # Start Chrome to retry pages the HTTP fetch could not read
+DRIVER_POOL_SIZE = 2 # Chrome instances kept open for the Selenium fallback
+SELENIUM_WAIT_TIMEOUT = 10 # Max seconds to wait for a page's content to appear
+# Requests the fallback browser never makes (Chrome DevTools URL patterns)
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff*", "*.ttf", "*.css",
+                        "*google-analytics*", "*googletagmanager*", "*doubleclick*"]
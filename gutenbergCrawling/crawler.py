@@ -1,43 +1,101 @@
+import asyncio
+import hashlib
+import queue
 import time
+from collections import defaultdict
+from contextlib import contextmanager
 import re
+import aiohttp
+import bson
+import lxml.etree
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from pymongo import MongoClient, errors
-from urllib.parse import quote_plus # For encoding author names in URLs
+from pymongo import MongoClient, UpdateOne, WriteConcern, errors
+from urllib.parse import quote_plus, urljoin # For encoding author names in URLs
 
 import config
 
+# XPath equivalents of the CSS selectors used with Selenium
+TITLE_XPATH = '//div[@id="content"]//h1'
+CREATOR_XPATH = '//p[@itemprop="creator"]/a'
+BIBREC_AUTHOR_XPATH = "//th[text()='Author']/following-sibling::td"
+LANGUAGE_XPATH = "//tr[th[contains(text(),'Language')]]/td"
+LOC_CLASS_XPATH = "//tr[th[contains(text(),'LoC Class')]]/td"
+DOWNLOAD_LINKS_XPATH = '//table[@class="files"]//a[@class="link"]'
+BOOKLINK_HREF_XPATH = '//li[@class="booklink"]//a[@class="link"]/@href'
+NEXT_PAGE_HREF_XPATH = "//a[@title='Go to next page']/@href"
+
+# Fields of a stored book that the pair finder reads back
+BOOK_SUMMARY_PROJECTION = {"gutenberg_id": 1, "title": 1, "author": 1, "url": 1, "downloads": 1, "all_language_codes_crawled": 1}
+
+EBOOK_ID_RE = re.compile(r'/ebooks/(\d+)')
+# Titles or LoC classes containing any of these mark periodicals and other non-book items
+NON_BOOK_KEYWORDS = frozenset({"index", "journal", "magazine", "papers", "proceedings", "bulletin", "report", "gazette", "notes and queries", "periodical"})
+NON_BOOK_RE = re.compile("|".join(map(re.escape, sorted(NON_BOOK_KEYWORDS))))
+
+def ensure_indexes(db):
+    """Create the indexes behind the crawler's queries; create_index is a no-op for existing ones."""
+    books = db[config.MONGO_COLLECTION]
+    pairs = db[config.MONGO_PAIRS_COLLECTION]
+    index_specs = [
+        # One document per book, so this also covers lookups by (gutenberg_id, language)
+        (books, [("gutenberg_id", 1)], True),
+        (books, [("language_code_crawled", 1)], False),
+        (books, [("author", 1)], False),
+        (pairs, [("eng_gutenberg_id", 1), ("zh_gutenberg_id", 1)], True),
+    ]
+    for collection, keys, unique in index_specs:
+        try:
+            collection.create_index(keys, unique=unique)
+        except errors.PyMongoError as e:
+            print(f"Could not create index {keys} on {collection.name}: {e}")
+
 def get_db_client():
     try:
-        client = MongoClient(config.MONGO_URI, username=config.MONGO_USERNAME, password=config.MONGO_PASSWORD)
+        client = MongoClient(config.MONGO_URI, username=config.MONGO_USERNAME, password=config.MONGO_PASSWORD,
+                             maxPoolSize=config.MONGO_MAX_POOL_SIZE, minPoolSize=config.MONGO_MIN_POOL_SIZE, retryWrites=True)
         client.admin.command('ping')
         print("MongoDB connection successful.")
-        return client[config.MONGO_DATABASE]
+        db = client[config.MONGO_DATABASE]
+        ensure_indexes(db)
+        return db
     except errors.ConnectionFailure as e:
         print(f"MongoDB connection failed: {e}")
         return None
     except errors.OperationFailure as e:
         print(f"MongoDB authentication/operation failed: {e}. Trying connection without explicit auth...")
         try:
-            client = MongoClient(config.MONGO_URI)
+            client = MongoClient(config.MONGO_URI, maxPoolSize=config.MONGO_MAX_POOL_SIZE,
+                                 minPoolSize=config.MONGO_MIN_POOL_SIZE, retryWrites=True)
             client.admin.command('ping')
             print("MongoDB connection successful (without explicit auth).")
-            return client[config.MONGO_DATABASE]
+            db = client[config.MONGO_DATABASE]
+            ensure_indexes(db)
+            return db
         except Exception as e_no_auth:
             print(f"MongoDB connection failed (without explicit auth either): {e_no_auth}")
             return None
 
 def init_driver():
     chrome_options = Options()
-    # chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.85 Safari/537.36")
+    # The crawler only reads text and links, so skip images and stylesheets
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "permissions.default.stylesheet": 2,
+    })
+    chrome_options.page_load_strategy = "eager" # Return from driver.get at DOMContentLoaded
+    chrome_options.add_argument(f"user-agent={config.USER_AGENT}")
 
     if config.CHROME_DRIVER_PATH:
         service = Service(executable_path=config.CHROME_DRIVER_PATH)
@@ -48,125 +106,350 @@ def init_driver():
         except Exception as e:
             print(f"Error initializing WebDriver: {e}")
             return None
+
+    # Only the HTML document is read; block subresources and trackers at the network layer
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": config.BLOCKED_URL_PATTERNS})
+    except WebDriverException as e:
+        print(f"Could not enable request blocking: {e}")
     return driver
 
-def get_book_details(book_url, driver, language_hint=None):
-    print(f"Fetching details for: {book_url}")
-    driver.get(book_url)
-    time.sleep(2) 
+class DriverPool:
+    """Pre-started Chrome drivers that concurrent workers check out and return."""
 
-    details = {"url": book_url, "title": "", "author": "", "language": "", "downloads": {}, "gutenberg_id": ""}
-    
-    try:
-        details["title"] = driver.find_element(By.CSS_SELECTOR, "div#content h1").text.strip()
-    except NoSuchElementException:
-        print(f"Could not find title for {book_url}")
+    def __init__(self, size=None):
+        self._idle = queue.Queue()
+        self._drivers = []
+        for _ in range(size or config.DRIVER_POOL_SIZE):
+            driver = init_driver()
+            if driver:
+                self._drivers.append(driver)
+                self._idle.put(driver)
 
-    try:
-        author_elements = driver.find_elements(By.CSS_SELECTOR, "p[itemprop='creator'] a")
-        if author_elements:
-            details["author"] = ", ".join(sorted(list(set(elem.text.strip() for elem in author_elements if elem.text.strip())))) # Unique, sorted authors
-        else:
-            bibrec_author = driver.find_elements(By.XPATH, "//th[text()='Author']/following-sibling::td")
-            if bibrec_author:
-                details["author"] = bibrec_author[0].text.strip()
-    except NoSuchElementException:
-        print(f"Could not find author for {book_url}")
+    def __len__(self):
+        return len(self._drivers)
+
+    def get(self):
+        """Check out a driver, waiting until one is free."""
+        return self._idle.get()
+
+    def put(self, driver):
+        """Return a driver to the pool with a clean cookie jar."""
+        try:
+            driver.delete_all_cookies()
+        except WebDriverException as e:
+            print(f"Error clearing cookies on returned driver: {e}")
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self):
+        driver = self.get()
+        try:
+            yield driver
+        finally:
+            self.put(driver)
 
+    def get_book_details(self, book_url, language_hint=None):
+        with self.driver() as driver:
+            return get_book_details_selenium(book_url, driver, language_hint)
+
+    def close(self):
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                print(f"Error quitting driver: {e}")
+        self._drivers.clear()
+
+def open_session():
+    """Create the HTTP session used for all listing and detail page requests."""
+    return aiohttp.ClientSession(
+        headers={"User-Agent": config.USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=config.HTTP_TIMEOUT),
+        connector=aiohttp.TCPConnector(limit=config.HTTP_CONCURRENCY),
+    )
+
+async def fetch_html(session, url):
+    """Return the HTML of a page, or None if the request failed."""
     try:
-        lang_element = driver.find_element(By.XPATH, "//tr[th[contains(text(),'Language')]]/td")
-        details["language"] = lang_element.text.strip()
-    except NoSuchElementException:
-        if language_hint: # If language is passed as a hint (e.g. from search query)
-            details["language"] = language_hint
-        else:
-            print(f"Could not find language for {book_url}")
-    
-    match = re.search(r'/ebooks/(\d+)', book_url)
-    if match:
-        details["gutenberg_id"] = match.group(1)
+        async with session.get(url) as response:
+            response.raise_for_status()
+            return await response.text()
+    except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError) as e: # Decode errors: wrong declared charset
+        print(f"Error fetching {url}: {e}")
+        return None
 
+def parse_html(html, url):
+    """Parse a page's HTML, or return None if it is empty or unparseable."""
+    if not html:
+        return None
     try:
-        download_table = driver.find_element(By.CSS_SELECTOR, "table.files")
-        links = download_table.find_elements(By.CSS_SELECTOR, "a.link")
-        for link_elem in links:
-            href = link_elem.get_attribute("href")
-            text = link_elem.text.lower()
-            if not href: continue
-            if not href.startswith("http"):
-                href = config.GUTENBERG_BASE_URL + href
-
-            if "plain text" in text and "utf-8" in text:
-                details["downloads"]["text_utf8"] = href
-            elif "epub (no images)" in text:
-                details["downloads"]["epub_no_images"] = href
-            elif "epub (with images)" in text:
-                details["downloads"]["epub_with_images"] = href
-            elif "kindle (no images)" in text: # Mobi is often Kindle
-                details["downloads"]["mobi_no_images"] = href
-            elif "kindle (with images)" in text:
-                details["downloads"]["mobi_with_images"] = href
-            elif "read this book online (html)" in text:
-                details["downloads"]["html"] = href
-        
-        # Prioritize specific epub/mobi if general ones are also there
-        if "epub_with_images" in details["downloads"] and "epub_no_images" not in details["downloads"]:
-            details["downloads"]["epub"] = details["downloads"]["epub_with_images"]
-        elif "epub_no_images" in details["downloads"]:
-             details["downloads"]["epub"] = details["downloads"]["epub_no_images"]
-        
-        if "mobi_with_images" in details["downloads"] and "mobi_no_images" not in details["downloads"]:
-            details["downloads"]["mobi"] = details["downloads"]["mobi_with_images"]
-        elif "mobi_no_images" in details["downloads"]:
-            details["downloads"]["mobi"] = details["downloads"]["mobi_no_images"]
+        return lxml.html.fromstring(html)
+    except (lxml.etree.ParserError, ValueError) as e: # e.g. a whitespace-only body
+        print(f"Error parsing {url}: {e}")
+        return None
 
-    except NoSuchElementException:
-        print(f"Could not find download links table for {book_url}")
-    
-    non_book_keywords = ["index", "journal", "magazine", "papers", "proceedings", "bulletin", "report", "gazette", "notes and queries", "periodical"]
+def _text(element):
+    return element.text_content().strip()
+
+def parse_book_details(tree, book_url, language_hint=None):
+    """Extract book details from a parsed detail page; None if the book should be skipped."""
+    details = {"url": book_url, "title": "", "author": "", "language": "", "downloads": {}, "gutenberg_id": ""}
+
+    title_elements = tree.xpath(TITLE_XPATH)
+    if title_elements:
+        details["title"] = _text(title_elements[0])
+    else:
+        print(f"Could not find title for {book_url}")
+
+    # Periodicals are common in search results; drop them before any other extraction
     title_lower = details["title"].lower()
-    if any(keyword in title_lower for keyword in non_book_keywords):
+    if NON_BOOK_RE.search(title_lower):
         print(f"Skipping '{details['title']}' as it appears to be a non-book item based on title.")
         return None
-    try:
-        loc_class_element = driver.find_element(By.XPATH, "//tr[th[contains(text(),'LoC Class')]]/td")
-        if any(keyword in loc_class_element.text.lower() for keyword in non_book_keywords):
-            print(f"Skipping '{details['title']}' due to LoC Class: {loc_class_element.text}")
+
+    author_elements = tree.xpath(CREATOR_XPATH)
+    if author_elements:
+        details["author"] = ", ".join(sorted(set(_text(elem) for elem in author_elements if _text(elem)))) # Unique, sorted authors
+    else:
+        bibrec_author = tree.xpath(BIBREC_AUTHOR_XPATH)
+        if bibrec_author:
+            details["author"] = _text(bibrec_author[0])
+        else:
+            print(f"Could not find author for {book_url}")
+
+    lang_elements = tree.xpath(LANGUAGE_XPATH)
+    if lang_elements:
+        details["language"] = _text(lang_elements[0])
+    elif language_hint: # If language is passed as a hint (e.g. from search query)
+        details["language"] = language_hint
+    else:
+        print(f"Could not find language for {book_url}")
+
+    match = EBOOK_ID_RE.search(book_url)
+    if match:
+        details["gutenberg_id"] = match.group(1)
+
+    link_elements = tree.xpath(DOWNLOAD_LINKS_XPATH)
+    if not link_elements:
+        print(f"Could not find download links table for {book_url}")
+    for link_elem in link_elements:
+        href = link_elem.get("href")
+        text = link_elem.text_content().lower()
+        if not href: continue
+        href = urljoin(config.GUTENBERG_BASE_URL, href)
+
+        if "plain text" in text and "utf-8" in text:
+            details["downloads"]["text_utf8"] = href
+        elif "epub (no images)" in text:
+            details["downloads"]["epub_no_images"] = href
+        elif "epub (with images)" in text:
+            details["downloads"]["epub_with_images"] = href
+        elif "kindle (no images)" in text: # Mobi is often Kindle
+            details["downloads"]["mobi_no_images"] = href
+        elif "kindle (with images)" in text:
+            details["downloads"]["mobi_with_images"] = href
+        elif "read this book online (html)" in text:
+            details["downloads"]["html"] = href
+
+    # Prioritize specific epub/mobi if general ones are also there
+    if "epub_with_images" in details["downloads"] and "epub_no_images" not in details["downloads"]:
+        details["downloads"]["epub"] = details["downloads"]["epub_with_images"]
+    elif "epub_no_images" in details["downloads"]:
+        details["downloads"]["epub"] = details["downloads"]["epub_no_images"]
+
+    if "mobi_with_images" in details["downloads"] and "mobi_no_images" not in details["downloads"]:
+        details["downloads"]["mobi"] = details["downloads"]["mobi_with_images"]
+    elif "mobi_no_images" in details["downloads"]:
+        details["downloads"]["mobi"] = details["downloads"]["mobi_no_images"]
+
+    loc_class_elements = tree.xpath(LOC_CLASS_XPATH)
+    if loc_class_elements:
+        loc_class = _text(loc_class_elements[0])
+        if NON_BOOK_RE.search(loc_class.lower()):
+            print(f"Skipping '{details['title']}' due to LoC Class: {loc_class}")
             return None
-    except NoSuchElementException:
-        pass # No LoC class, proceed
 
     if not details["downloads"]:
         print(f"No suitable download links found for '{details['title']}'. Skipping.")
         return None
-        
+
     return details
 
-def save_book_to_db(book_data, db, language_code_crawled):
-    if not book_data or not book_data.get("gutenberg_id"):
-        return False
-    collection = db[config.MONGO_COLLECTION]
-    book_data["language_code_crawled"] = language_code_crawled
+async def get_book_details(book_url, session, language_hint=None, driver_pool=None):
+    """
+    Fetch and parse a book's detail page over HTTP.
+
+    The page is static HTML, so no browser is needed. If the request fails or the
+    page has no title (e.g. an interstitial that needs JavaScript) and a driver
+    pool is given, the page is read through a pooled browser instead.
+    """
+    print(f"Fetching details for: {book_url}")
+    html = await fetch_html(session, book_url)
+    tree = parse_html(html, book_url)
+    if tree is None or not tree.xpath(TITLE_XPATH):
+        if driver_pool is not None:
+            print(f"Falling back to Selenium for: {book_url}")
+            return await asyncio.to_thread(driver_pool.get_book_details, book_url, language_hint)
+        if tree is None:
+            return None
+    return parse_book_details(tree, book_url, language_hint)
+
+async def get_all_book_details(book_urls, session, language_hint=None, driver_pool=None):
+    """Fetch several detail pages concurrently, at most DETAIL_FETCH_CONCURRENCY at a time.
+
+    A page that fails for any other reason is logged and returned as None, so one
+    bad page doesn't abort the crawl while the rest of the batch is in flight.
+    """
+    semaphore = asyncio.Semaphore(config.DETAIL_FETCH_CONCURRENCY)
+
+    async def bounded_fetch(book_url):
+        async with semaphore:
+            book_data = await get_book_details(book_url, session, language_hint=language_hint, driver_pool=driver_pool)
+            await asyncio.sleep(config.REQUEST_DELAY) # Politeness delay, applied per slot
+            return book_data
+
+    results = await asyncio.gather(*(bounded_fetch(book_url) for book_url in book_urls), return_exceptions=True)
+    for book_url, result in zip(book_urls, results):
+        if isinstance(result, BaseException):
+            print(f"Error getting details for {book_url}: {result!r}")
+    return [None if isinstance(result, BaseException) else result for result in results]
+
+def listing_page_url(search_url, page_num):
+    """Return the URL of a 1-based page of search results."""
+    if page_num == 1:
+        return search_url
+    return f"{search_url}&start_index={1 + (page_num - 1) * config.BOOKS_PER_LISTING_PAGE}"
+
+async def get_listing_page(session, url):
+    """Return the book page URLs on a search results page and the next page's URL (or None)."""
+    tree = parse_html(await fetch_html(session, url), url)
+    if tree is None:
+        return [], None
+    book_page_urls = []
+    for href in tree.xpath(BOOKLINK_HREF_XPATH):
+        book_url = urljoin(config.GUTENBERG_BASE_URL, href)
+        if book_url.startswith(config.GUTENBERG_BASE_URL + "/ebooks/"):
+            book_page_urls.append(book_url)
+    next_hrefs = tree.xpath(NEXT_PAGE_HREF_XPATH)
+    next_url = urljoin(url, next_hrefs[0]) if next_hrefs else None
+    return book_page_urls, next_url
+
+async def iter_listing_pages(session, search_url, pages, stop_event=None):
+    """Yield (page number, listing) for pages, fetching LISTING_PAGE_BATCH_SIZE of them at a time.
+
+    A batch is only requested once the previous one has been consumed, and not at all
+    once stop_event is set, so a crawl that finishes early doesn't download the rest.
+    """
+    pages = list(pages)
+    for start in range(0, len(pages), config.LISTING_PAGE_BATCH_SIZE):
+        if stop_event is not None and stop_event.is_set():
+            return
+        batch = pages[start:start + config.LISTING_PAGE_BATCH_SIZE]
+        listings = await asyncio.gather(*(get_listing_page(session, listing_page_url(search_url, n)) for n in batch))
+        for page_num, listing in zip(batch, listings):
+            yield page_num, listing
+
+def get_book_details_selenium(book_url, driver, language_hint=None):
+    """Read a book's detail page through the browser, then parse it like an HTTP fetch."""
+    print(f"Fetching details for: {book_url}")
+    driver.get(book_url)
     try:
-        update_filter = {"gutenberg_id": book_data["gutenberg_id"]}
+        WebDriverWait(driver, config.SELENIUM_WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div#content h1")))
+    except TimeoutException:
+        print(f"Timed out waiting for {book_url} to load")
+    # One page_source read instead of a chromedriver round trip per field
+    tree = lxml.html.fromstring(driver.page_source)
+    return parse_book_details(tree, book_url, language_hint)
+
+def load_seen_ids(collection, language_code):
+    """Return the ids of books already crawled under a language, in a single query.
+
+    Lookups against this set are answered in-process; only ids found in it go on
+    to a MongoDB read, and ids missing from it are definitely new. A plain set is
+    exact, so unlike a Bloom filter it never sends a new id to MongoDB by mistake.
+    Gutenberg's catalogue (~75k ids) fits in a few MB.
+    """
+    return set(collection.distinct("gutenberg_id", {"language_code_crawled": language_code}))
+
+def find_crawled_book(collection, gid, language_code):
+    """Return the stored summary of a book crawled under language_code, or None, in one round trip."""
+    book_data = collection.find_one({"gutenberg_id": gid}, BOOK_SUMMARY_PROJECTION)
+    if book_data and language_code in book_data.get("all_language_codes_crawled", []):
+        return book_data
+    return None
+
+class BookWriter:
+    """Buffers book upserts and sends them to MongoDB in unordered bulk writes.
+
+    Book metadata can always be re-crawled, so by default the writes are
+    unacknowledged (w=0) and do not wait for a server round trip. Pass
+    acknowledged=True when a checkpoint depends on the books being stored.
+    """
+
+    def __init__(self, db, batch_size=None, acknowledged=False):
+        collection = db[config.MONGO_COLLECTION]
+        self.collection = collection if acknowledged else collection.with_options(write_concern=WriteConcern(w=0))
+        self.batch_size = batch_size or config.MONGO_BULK_BATCH_SIZE
+        self.ops = []
+        # gutenberg_id -> content_hash of every stored book, so unchanged re-crawls skip the write
+        self.known_hashes = {}
+        try:
+            for doc in collection.find({"content_hash": {"$exists": True}}, {"_id": 0, "gutenberg_id": 1, "content_hash": 1}):
+                self.known_hashes[doc["gutenberg_id"]] = doc["content_hash"]
+        except errors.PyMongoError as e:
+            print(f"Could not load stored book hashes; every book will be written: {e}")
+
+    def save(self, book_data, language_code_crawled):
+        """Queue an upsert for a book; flushes once a full batch is queued."""
+        if not book_data or not book_data.get("gutenberg_id"):
+            return False
+        book_data["language_code_crawled"] = language_code_crawled
+        book_data.pop("content_hash", None)
+        content_hash = hashlib.blake2b(bson.encode(book_data), digest_size=16).hexdigest()
+        book_data["content_hash"] = content_hash
+        # A re-crawled book whose stored hash matches is left alone. The hash covers
+        # language_code_crawled, so it is already in all_language_codes_crawled too.
+        gid = book_data["gutenberg_id"]
+        if self.known_hashes.get(gid) == content_hash:
+            return True
+        self.known_hashes[gid] = content_hash
         # Add language_code_crawled to $addToSet to track all languages it was found under
-        update_operation = {
-            "$set": book_data,
-            "$addToSet": {"all_language_codes_crawled": language_code_crawled}
-        }
-        result = collection.update_one(update_filter, update_operation, upsert=True)
-        if result.upserted_id or result.modified_count:
-            print(f"Saved/Updated book: {book_data.get('title', 'N/A')} (ID: {book_data['gutenberg_id']})")
+        self.ops.append(UpdateOne(
+            {"gutenberg_id": gid},
+            {"$set": book_data, "$addToSet": {"all_language_codes_crawled": language_code_crawled}},
+            upsert=True,
+        ))
+        if len(self.ops) >= self.batch_size:
+            self.flush()
+        return True
+
+    def flush(self):
+        """Write all queued upserts in one round trip; returns False if any of them failed."""
+        if not self.ops:
             return True
-        elif result.matched_count:
-            print(f"Book already exists and data is consistent: {book_data.get('title', 'N/A')} (ID: {book_data['gutenberg_id']})")
-            return True # Considered success as it's there
-    except errors.PyMongoError as e:
-        print(f"MongoDB error saving book {book_data.get('title', 'N/A')}: {e}")
-    return False
+        ops, self.ops = self.ops, []
+        try:
+            result = self.collection.bulk_write(ops, ordered=False)
+            if result.acknowledged:
+                print(f"Saved {len(ops)} books: {result.upserted_count} new, {result.modified_count} updated.")
+            else:
+                print(f"Sent {len(ops)} book saves to MongoDB.")
+            return True
+        except errors.BulkWriteError as e:
+            print(f"MongoDB bulk write saved {e.details.get('nUpserted', 0) + e.details.get('nModified', 0)} of {len(ops)} books; "
+                  f"{len(e.details.get('writeErrors', []))} failed.")
+        except errors.PyMongoError as e:
+            print(f"MongoDB error saving {len(ops)} books: {e}")
+        return False
 
-def search_books_by_author_and_language(author_name, language_code, driver, db):
-    """Searches for books by a given author in a specific language."""
+async def search_books_by_author_and_language(author_name, language_code, session, db, book_writer, seen_ids, driver_pool=None):
+    """Searches for books by a given author in a specific language.
+
+    seen_ids holds the ids already crawled under language_code (see load_seen_ids).
+    """
     books_found = []
     # Gutenberg search URL: https://www.gutenberg.org/ebooks/search/?query=AUTHOR&submit_search=Search&languages[]=LANG_CODE
     # The query parameter for author seems to be just the author's name.
@@ -183,264 +466,328 @@ def search_books_by_author_and_language(author_name, language_code, driver, db):
     search_url = f"https://www.gutenberg.org/ebooks/search/?query={encoded_author}&languages={language_code}"
     
     print(f"Searching for author '{author_name}' in language '{language_code}' at {search_url}")
-    driver.get(search_url)
-    time.sleep(3)
 
     # Limit to first page of results for an author to keep it focused
-    book_elements = driver.find_elements(By.CSS_SELECTOR, "li.booklink")
-    if not book_elements:
+    book_page_urls, _ = await get_listing_page(session, search_url)
+    if not book_page_urls:
         print(f"No books found for author '{author_name}' in language '{language_code}'.")
         return books_found
 
-    book_page_urls = []
-    for book_elem in book_elements:
-        try:
-            ebook_link_tag = book_elem.find_element(By.CSS_SELECTOR, "a.link")
-            book_url_path = ebook_link_tag.get_attribute("href")
-            if book_url_path and book_url_path.startswith(config.GUTENBERG_BASE_URL + "/ebooks/"):
-                book_page_urls.append(book_url_path)
-        except NoSuchElementException:
-            continue
-    
+    urls_to_fetch = []
     for book_url in book_page_urls:
         # Check if book already processed to avoid re-crawling
-        gid_match = re.search(r'/ebooks/(\d+)', book_url)
+        gid_match = EBOOK_ID_RE.search(book_url)
         gid = gid_match.group(1) if gid_match else None
 
-        if gid and db[config.MONGO_COLLECTION].count_documents({"gutenberg_id": gid, "language_code_crawled": language_code}) > 0:
+        if gid and gid in seen_ids:
             # Fetch from DB if already crawled under this language
-            book_data = db[config.MONGO_COLLECTION].find_one({"gutenberg_id": gid})
+            book_data = find_crawled_book(db[config.MONGO_COLLECTION], gid, language_code)
             if book_data: # Ensure it was actually found
                  print(f"Book ID {gid} by '{author_name}' in '{language_code}' already in DB. Using existing data.")
                  books_found.append(book_data)
                  continue # Continue to next book_url
-            # If not found in DB (should not happen if count_documents > 0), proceed to fetch
+            # If not found in DB (e.g. its save is still queued or it was skipped), proceed to fetch
         
         # If not in DB or GID couldn't be extracted for check, fetch details
-        book_details = get_book_details(book_url, driver, language_hint=language_code) # Pass language_code as hint
+        if gid:
+            seen_ids.add(gid)
+        urls_to_fetch.append(book_url)
+
+    target_lang_name_lower = "" # Get full name for comparison e.g. "english" for "en"
+    if language_code == "en": target_lang_name_lower = "english"
+    elif language_code == "zh": target_lang_name_lower = "chinese"
+
+    for book_details in await get_all_book_details(urls_to_fetch, session, language_hint=language_code, driver_pool=driver_pool): # Pass language_code as hint
         if book_details:
             # Ensure the fetched book's language matches the target language, or is very generic
             # Gutenberg's language metadata can sometimes be broad.
             # The search itself should filter by language, but double check.
             fetched_lang_lower = book_details.get("language", "").lower()
-            target_lang_name_lower = "" # Get full name for comparison e.g. "english" for "en"
-            if language_code == "en": target_lang_name_lower = "english"
-            elif language_code == "zh": target_lang_name_lower = "chinese"
-
             if target_lang_name_lower in fetched_lang_lower or not fetched_lang_lower : # Accept if matches or if language field is empty (rely on search)
-                save_book_to_db(book_details, db, language_code)
+                book_writer.save(book_details, language_code)
                 books_found.append(book_details)
             else:
                 print(f"Skipping book '{book_details.get('title')}' - language '{fetched_lang_lower}' does not match target '{target_lang_name_lower}'.")
-        time.sleep(1)
     return books_found
 
 
-def crawl_books_for_authors(language_code, driver, db, max_pages_to_scan_for_authors):
-    """Crawls books in a language, extracts authors, and stores books."""
+async def crawl_books_for_authors(language_code, session, db, book_writer, max_pages_to_scan_for_authors, driver_pool=None,
+                                  book_queue=None, stop_event=None):
+    """Crawls books in a language, extracts authors, and stores books.
+
+    Progress is checkpointed to the crawl_state collection after every page, so a
+    rerun resumes after the last finished page instead of rescanning; delete the
+    "<lang>_author_scan" document to start over.
+
+    If book_queue is given, every book with an author is also put on it as soon as
+    it is found, so consumers can start on it while the scan goes on. The scan
+    stops before the next page once stop_event is set.
+    """
     collection = db[config.MONGO_COLLECTION]
+    state_collection = db[config.MONGO_STATE_COLLECTION]
+    state_id = f"{language_code}_author_scan"
     search_url = config.GUTENBERG_SEARCH_URL.format(lang=language_code)
     print(f"Scanning for authors in language: {language_code} at {search_url}")
-    driver.get(search_url)
     
-    authors_found = set()
+    state = state_collection.find_one({"_id": state_id}) or {}
+    authors_found = set(state.get("authors", []))
     books_processed_this_run = []
+    seen_ids = load_seen_ids(collection, language_code)
+
+    # Listing URLs are computed from the page number, so each batch of remaining pages loads in parallel
+    pages = [] if state.get("complete") else range(state.get("last_page", 0) + 1, max_pages_to_scan_for_authors + 1)
+    if state:
+        print(f"Resuming author scan for {language_code} after page {state['last_page']} with {len(authors_found)} authors.")
+        # Books from the pages scanned in earlier runs
+        books_processed_this_run = list(collection.find({"language_code_crawled": language_code, "author": {"$in": list(authors_found)}}, BOOK_SUMMARY_PROJECTION))
+        if book_queue is not None:
+            for book_data in books_processed_this_run:
+                await book_queue.put(book_data)
+
+    async def add_book(book_data):
+        books_processed_this_run.append(book_data) # Add to list of books from this language
+        if book_data.get("author"):
+            authors_found.add(book_data["author"])
+            if book_queue is not None:
+                await book_queue.put(book_data)
     
-    page_num = 1
-    while page_num <= max_pages_to_scan_for_authors:
+    async for page_num, (book_page_urls, next_page_url) in iter_listing_pages(session, search_url, pages, stop_event):
+        if stop_event is not None and stop_event.is_set():
+            break
         print(f"Scanning page {page_num} for authors in {language_code}...")
-        time.sleep(3)
 
-        book_elements = driver.find_elements(By.CSS_SELECTOR, "li.booklink")
-        if not book_elements:
+        if not book_page_urls:
             print("No more books found on this page.")
             break
         
-        book_page_urls = []
-        for book_elem in book_elements:
-            try:
-                ebook_link_tag = book_elem.find_element(By.CSS_SELECTOR, "a.link")
-                book_url_path = ebook_link_tag.get_attribute("href")
-                if book_url_path and book_url_path.startswith(config.GUTENBERG_BASE_URL + "/ebooks/"):
-                    book_page_urls.append(book_url_path)
-            except NoSuchElementException:
-                continue
-        
+        urls_to_fetch = []
         for book_url in book_page_urls:
-            gid_match = re.search(r'/ebooks/(\d+)', book_url)
+            gid_match = EBOOK_ID_RE.search(book_url)
             gid = gid_match.group(1) if gid_match else None
 
             # Check if book already processed to avoid re-crawling for details if only author needed
-            if gid and collection.count_documents({"gutenberg_id": gid, "language_code_crawled": language_code}) > 0:
-                book_data = collection.find_one({"gutenberg_id": gid})
+            if gid and gid in seen_ids:
+                book_data = find_crawled_book(collection, gid, language_code)
                 if book_data and book_data.get("author"):
-                    authors_found.add(book_data["author"])
-                    books_processed_this_run.append(book_data) # Add to list of books from this language
+                    await add_book(book_data)
                 continue 
-            
-            book_data = get_book_details(book_url, driver, language_hint=language_code)
+            if gid:
+                seen_ids.add(gid)
+            urls_to_fetch.append(book_url)
+
+        for book_data in await get_all_book_details(urls_to_fetch, session, language_hint=language_code, driver_pool=driver_pool):
             if book_data:
-                if save_book_to_db(book_data, db, language_code):
-                    books_processed_this_run.append(book_data)
-                    if book_data.get("author"):
-                        authors_found.add(book_data["author"])
-            time.sleep(1)
+                if book_writer.save(book_data, language_code):
+                    await add_book(book_data)
 
-        try:
-            next_page_link = driver.find_element(By.CSS_SELECTOR, "a[title='Go to next page']")
-            if next_page_link.is_displayed() and next_page_link.is_enabled():
-                driver.execute_script("arguments[0].click();", next_page_link)
-                page_num += 1
-            else:
-                break
-        except (NoSuchElementException, TimeoutException):
-            print("No 'next page' link found or timeout.")
+        # Make the page's books durable before recording the page as done;
+        # only an acknowledged book_writer guarantees they were stored
+        if not book_writer.flush():
+            print(f"Could not save the books of page {page_num}; stopping so the next run rescans it.")
+            break
+        state_collection.update_one(
+            {"_id": state_id},
+            {"$set": {"last_page": page_num, "complete": not next_page_url, "authors": sorted(authors_found)}},
+            upsert=True,
+        )
+
+        if not next_page_url:
+            print("No 'next page' link found.")
             break
             
     return list(authors_found), books_processed_this_run
 
 
-def find_translation_pairs(driver, db):
-    pairs_collection = db[config.MONGO_PAIRS_COLLECTION]
-    found_pairs_count = pairs_collection.count_documents({})
-    
-    # Step 1: Get a list of authors from English books
-    print("Step 1: Finding authors from English books...")
-    # We limit the number of pages to scan for English authors to keep this manageable
-    english_authors, english_books_scanned = crawl_books_for_authors("en", driver, db, config.MAX_ENGLISH_SEARCH_PAGES_FOR_PAIRS)
-    if not english_authors:
-        print("No English authors found. Cannot proceed to find pairs.")
+def save_pairs_to_db(pending_pairs, pairs_collection):
+    """Insert the buffered translation pairs in one unordered batch and clear the buffer."""
+    if not pending_pairs:
         return
-    print(f"Found {len(english_authors)} unique English authors from {len(english_books_scanned)} books scanned.")
-
-    # Step 2: For each English author, search for their books in Chinese
-    print("\nStep 2: Searching for Chinese translations by these authors...")
-    for author_name in english_authors:
-        if not author_name: continue # Skip if author name is empty
-
-        if found_pairs_count >= config.MAX_TRANSLATION_PAIRS:
-            print(f"Reached maximum of {config.MAX_TRANSLATION_PAIRS} translation pairs. Stopping search.")
-            break
-
-        print(f"Searching for Chinese books by author: {author_name}")
-        chinese_books_by_author = search_books_by_author_and_language(author_name, "zh", driver, db)
-
-        if chinese_books_by_author:
-            # We have potential translations. Find the original English books by this author from our scanned list.
-            original_english_books = [b for b in english_books_scanned if b.get("author") == author_name]
-
-            for eng_book in original_english_books:
-                if found_pairs_count >= config.MAX_TRANSLATION_PAIRS: break
-                for zh_book in chinese_books_by_author:
-                    if found_pairs_count >= config.MAX_TRANSLATION_PAIRS: break
-                    
-                    # Basic check: ensure they are not the exact same book ID (unlikely across languages but good check)
-                    if eng_book["gutenberg_id"] == zh_book["gutenberg_id"]:
-                        continue
-
-                    # Check if this pair (by IDs) already exists
-                    if pairs_collection.count_documents({
-                        "eng_gutenberg_id": eng_book["gutenberg_id"],
-                        "zh_gutenberg_id": zh_book["gutenberg_id"]
-                    }) > 0:
-                        print(f"Pair Eng:{eng_book['gutenberg_id']}/Zh:{zh_book['gutenberg_id']} already exists.")
-                        continue
-                    
-                    pair_data = {
-                        "author": author_name,
-                        "eng_book_title": eng_book.get("title"),
-                        "eng_gutenberg_id": eng_book["gutenberg_id"],
-                        "eng_book_url": eng_book.get("url"),
-                        "eng_downloads": eng_book.get("downloads"),
-                        "zh_book_title": zh_book.get("title"),
-                        "zh_gutenberg_id": zh_book["gutenberg_id"],
-                        "zh_book_url": zh_book.get("url"),
-                        "zh_downloads": zh_book.get("downloads"),
-                        "found_at": time.time()
-                    }
-                    try:
-                        pairs_collection.insert_one(pair_data)
-                        print(f"Found and saved translation pair: Eng='{eng_book.get('title')}' (ID:{eng_book.get('gutenberg_id')}) <-> Zh='{zh_book.get('title')}' (ID:{zh_book.get('gutenberg_id')}) by {author_name}")
-                        found_pairs_count += 1
-                    except errors.PyMongoError as e:
-                        print(f"MongoDB error saving pair: {e}")
-        if found_pairs_count >= config.MAX_TRANSLATION_PAIRS: break
-        time.sleep(2) # Politeness delay between authors
+    try:
+        result = pairs_collection.insert_many(pending_pairs, ordered=False)
+        print(f"Saved {len(result.inserted_ids)} translation pairs.")
+    except errors.BulkWriteError as e:
+        print(f"MongoDB bulk insert saved {e.details.get('nInserted', 0)} of {len(pending_pairs)} pairs.")
+    except errors.PyMongoError as e:
+        print(f"MongoDB error saving pairs: {e}")
+    pending_pairs.clear()
+
+async def find_translation_pairs(session, db, book_writer, driver_pool=None):
+    """Scan English books for authors and search each author's Chinese books, storing translation pairs.
+
+    The English scan produces books onto a queue while TRANSLATION_SEARCH_WORKERS
+    consumers search Chinese books for each new author, so Chinese searches start
+    with the first English author instead of after the whole scan. Everything
+    stops once MAX_TRANSLATION_PAIRS pairs exist.
+    """
+    # Pairs are the crawler's result, so their writes wait for a majority of the replica set
+    pairs_collection = db[config.MONGO_PAIRS_COLLECTION].with_options(write_concern=WriteConcern("majority"))
+    found_pairs_count = pairs_collection.count_documents({})
+    pending_pairs = []
+    existing_pairs = {
+        (pair["eng_gutenberg_id"], pair["zh_gutenberg_id"])
+        for pair in pairs_collection.find({}, {"_id": 0, "eng_gutenberg_id": 1, "zh_gutenberg_id": 1})
+    }
+    seen_zh_ids = load_seen_ids(db[config.MONGO_COLLECTION], "zh")
+
+    eng_book_queue = asyncio.Queue()
+    enough_pairs = asyncio.Event()
+    author_to_eng_books = defaultdict(list)
+    zh_books_by_author = {}
+    if found_pairs_count >= config.MAX_TRANSLATION_PAIRS:
+        enough_pairs.set()
+
+    def record_pairs(author_name):
+        nonlocal found_pairs_count
+        for eng_book in author_to_eng_books[author_name]:
+            for zh_book in zh_books_by_author.get(author_name, []):
+                if enough_pairs.is_set(): return
+
+                # Basic check: ensure they are not the exact same book ID (unlikely across languages but good check)
+                if eng_book["gutenberg_id"] == zh_book["gutenberg_id"]:
+                    continue
+
+                # Check if this pair (by IDs) already exists
+                pair_key = (eng_book["gutenberg_id"], zh_book["gutenberg_id"])
+                if pair_key in existing_pairs:
+                    continue
+                existing_pairs.add(pair_key)
+
+                pair_data = {
+                    "author": author_name,
+                    "eng_book_title": eng_book.get("title"),
+                    "eng_gutenberg_id": eng_book["gutenberg_id"],
+                    "eng_book_url": eng_book.get("url"),
+                    "eng_downloads": eng_book.get("downloads"),
+                    "zh_book_title": zh_book.get("title"),
+                    "zh_gutenberg_id": zh_book["gutenberg_id"],
+                    "zh_book_url": zh_book.get("url"),
+                    "zh_downloads": zh_book.get("downloads"),
+                    "found_at": time.time()
+                }
+                pending_pairs.append(pair_data)
+                print(f"Found translation pair: Eng='{eng_book.get('title')}' (ID:{eng_book.get('gutenberg_id')}) <-> Zh='{zh_book.get('title')}' (ID:{zh_book.get('gutenberg_id')}) by {author_name}")
+                found_pairs_count += 1
+                if len(pending_pairs) >= config.PAIRS_BATCH_SIZE:
+                    save_pairs_to_db(pending_pairs, pairs_collection)
+                if found_pairs_count >= config.MAX_TRANSLATION_PAIRS:
+                    print(f"Reached maximum of {config.MAX_TRANSLATION_PAIRS} translation pairs. Stopping search.")
+                    enough_pairs.set()
+
+    async def search_translations():
+        while True:
+            eng_book = await eng_book_queue.get()
+            try:
+                author_name = eng_book.get("author")
+                if author_name and not enough_pairs.is_set():
+                    author_to_eng_books[author_name].append(eng_book)
+                    if author_name not in zh_books_by_author:
+                        # Claim the author so other workers pair later books without searching again
+                        zh_books_by_author[author_name] = []
+                        print(f"Searching for Chinese books by author: {author_name}")
+                        zh_books_by_author[author_name] = await search_books_by_author_and_language(
+                            author_name, "zh", session, db, book_writer, seen_zh_ids, driver_pool)
+                        await asyncio.sleep(2) # Politeness delay between authors
+                    record_pairs(author_name)
+            except Exception as e:
+                print(f"Error searching translations for '{eng_book.get('author')}': {e}")
+            finally:
+                eng_book_queue.task_done()
+
+    workers = [asyncio.create_task(search_translations()) for _ in range(config.TRANSLATION_SEARCH_WORKERS)]
+    try:
+        # We limit the number of pages to scan for English authors to keep this manageable
+        print("Scanning English books for authors and searching for their Chinese translations...")
+        english_authors, english_books_scanned = await crawl_books_for_authors(
+            "en", session, db, book_writer, config.MAX_ENGLISH_SEARCH_PAGES_FOR_PAIRS, driver_pool,
+            book_queue=eng_book_queue, stop_event=enough_pairs)
+        if not english_authors:
+            print("No English authors found. Cannot proceed to find pairs.")
+        else:
+            print(f"Found {len(english_authors)} unique English authors from {len(english_books_scanned)} books scanned.")
+        await eng_book_queue.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        # Keep the pairs found so far even if the crawl failed or was interrupted
+        save_pairs_to_db(pending_pairs, pairs_collection)
 
     print(f"\nFinished searching for translation pairs. Found {pairs_collection.count_documents({})} pairs in total.")
 
 
 # --- Original Crawling Functionality (can be run independently) ---
-def crawl_language_general(language_code, driver, db, max_pages_general_crawl):
-    collection = db[config.MONGO_COLLECTION]
+async def crawl_language_general(language_code, session, db, book_writer, max_pages_general_crawl, driver_pool=None):
     search_url = config.GUTENBERG_SEARCH_URL.format(lang=language_code)
     print(f"Starting general crawl for language: {language_code} at {search_url}")
-    driver.get(search_url)
-    
-    page_num = 1
-    while page_num <= max_pages_general_crawl: # Use a specific limit for general crawl
+
+    pages = range(1, max_pages_general_crawl + 1) # Use a specific limit for general crawl
+    async for page_num, (book_page_urls, next_page_url) in iter_listing_pages(session, search_url, pages):
         print(f"Processing page {page_num} for language {language_code} (General Crawl)...")
-        time.sleep(3) 
 
-        book_elements = driver.find_elements(By.CSS_SELECTOR, "li.booklink")
-        if not book_elements:
+        if not book_page_urls:
             print("No more books found on this page or page structure changed.")
             break
-        
-        book_page_urls = []
-        for book_elem in book_elements:
-            try:
-                ebook_link_tag = book_elem.find_element(By.CSS_SELECTOR, "a.link")
-                book_url_path = ebook_link_tag.get_attribute("href")
-                if book_url_path and book_url_path.startswith(config.GUTENBERG_BASE_URL + "/ebooks/"):
-                    book_page_urls.append(book_url_path)
-            except NoSuchElementException:
-                continue
-        
-        for book_url in book_page_urls:
-            book_data = get_book_details(book_url, driver, language_hint=language_code)
+
+        for book_data in await get_all_book_details(book_page_urls, session, language_hint=language_code, driver_pool=driver_pool):
             if book_data:
-                save_book_to_db(book_data, db, language_code)
-            time.sleep(1)
+                book_writer.save(book_data, language_code)
 
-        try:
-            next_page_link = driver.find_element(By.CSS_SELECTOR, "a[title='Go to next page']")
-            if next_page_link.is_displayed() and next_page_link.is_enabled():
-                driver.execute_script("arguments[0].click();", next_page_link)
-                page_num += 1
-            else:
-                break
-        except (NoSuchElementException, TimeoutException):
-            print("No 'next page' link found or timeout (General Crawl).")
+        if not next_page_url:
+            print("No 'next page' link found (General Crawl).")
             break
             
     print(f"Finished general crawling for language: {language_code}")
 
+def init_driver_pool():
+    """Start the Selenium fallback drivers if the fallback is enabled in the config."""
+    if not config.USE_SELENIUM_FALLBACK:
+        return None
+    driver_pool = DriverPool()
+    if not driver_pool:
+        print("No WebDriver could be started; continuing without the Selenium fallback.")
+        return None
+    return driver_pool
+
+async def _run_general_crawl(db, driver_pool, max_pages):
+    book_writer = BookWriter(db)
+    try:
+        async with open_session() as session:
+            for lang_code in config.TARGET_LANGUAGES:
+                await crawl_language_general(lang_code, session, db, book_writer, max_pages, driver_pool)
+    finally:
+        book_writer.flush()
+
+async def _run_find_pairs(db, driver_pool):
+    # The author scan checkpoints pages as done, so their books must really be stored
+    book_writer = BookWriter(db, acknowledged=True)
+    try:
+        async with open_session() as session:
+            await find_translation_pairs(session, db, book_writer, driver_pool)
+    finally:
+        book_writer.flush()
+
 def main_general_crawl():
     db = get_db_client()
-    if not db: return
-    driver = init_driver()
-    if not driver: return
+    if db is None: return
+    driver_pool = init_driver_pool()
 
     # Example: Crawl first 2 pages for each target language in general mode
     MAX_PAGES_GENERAL = 2 
     try:
-        for lang_code in config.TARGET_LANGUAGES:
-            crawl_language_general(lang_code, driver, db, MAX_PAGES_GENERAL)
+        asyncio.run(_run_general_crawl(db, driver_pool, MAX_PAGES_GENERAL))
     finally:
-        if driver: driver.quit()
-        if db.client: db.client.close()
+        if driver_pool: driver_pool.close()
+        db.client.close()
 
 def main_find_pairs():
     db = get_db_client()
-    if not db: return
-    driver = init_driver()
-    if not driver: return
+    if db is None: return
+    driver_pool = init_driver_pool()
     try:
-        find_translation_pairs(driver, db)
+        asyncio.run(_run_find_pairs(db, driver_pool))
     finally:
-        if driver: driver.quit()
-        if db.client: db.client.close()
+        if driver_pool: driver_pool.close()
+        db.client.close()
 
 if __name__ == "__main__":
     # Choose which main function to run:
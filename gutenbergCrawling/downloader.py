@@ -1,10 +1,20 @@
 import os
+import sys
+import atexit
+import asyncio
 import threading
-import requests
-from pymongo import MongoClient, errors
+import queue
+import logging
+import functools
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
+import aiohttp
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
+from pymongo import MongoClient, UpdateOne, errors
 from urllib.parse import urlparse
 import re
-import time
+import shutil
 
 import config
 
@@ -12,206 +22,496 @@ import config
 if not os.path.exists(config.DOWNLOAD_DIR):
     os.makedirs(config.DOWNLOAD_DIR)
 
-def get_db_client():
+_http_client = None
+_http_client_lock = threading.Lock()
+_mongo_client = None
+_mongo_client_lock = threading.Lock()
+
+log = logging.getLogger("downloader")
+log.setLevel(config.DOWNLOAD_LOG_LEVEL)
+log.propagate = False
+# Writes records directly outside the entry points (e.g. get_client() called from main.py)
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+log.addHandler(_stdout_handler)
+
+def with_queued_logging(func):
+    """Run a downloader entry point with its log records written by a single listener thread.
+
+    Download tasks and threads only enqueue records, so they never contend for the stdout lock.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        records = queue.SimpleQueue()
+        queue_handler = QueueHandler(records)
+        listener = QueueListener(records, _stdout_handler)
+        log.removeHandler(_stdout_handler)
+        log.addHandler(queue_handler)
+        listener.start()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            listener.stop()
+            log.removeHandler(queue_handler)
+            log.addHandler(_stdout_handler)
+    return wrapper
+
+# Only the fields the downloaders read
+PAIR_DOWNLOAD_PROJECTION = {
+    f"{lang_prefix}_{field}": 1
+    for lang_prefix in ("eng", "zh")
+    for field in ("book_title", "gutenberg_id", "downloads", "download_status")
+}
+PAIR_DOWNLOAD_PROJECTION["author"] = 1
+BOOK_DOWNLOAD_PROJECTION = {"title": 1, "gutenberg_id": 1, "language_code_crawled": 1, "downloads": 1}
+
+def get_http_client():
+    """Return the HTTP client shared by all download threads, creating it on first use.
+
+    HTTP/2 multiplexes concurrent downloads from the same mirror over one connection,
+    so parallel books neither block each other nor pay for extra TLS handshakes.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            limits = httpx.Limits(max_connections=config.MAX_DOWNLOAD_THREADS,
+                                  max_keepalive_connections=config.MAX_DOWNLOAD_THREADS)
+            # retries covers failed connection attempts only, not HTTP error statuses
+            transport = httpx.HTTPTransport(http2=True, limits=limits, retries=3)
+            _http_client = httpx.Client(transport=transport, timeout=90.0, follow_redirects=True)
+        return _http_client
+
+def _open_client():
     try:
-        client = MongoClient(config.MONGO_URI, username=config.MONGO_USERNAME, password=config.MONGO_PASSWORD)
+        client = MongoClient(config.MONGO_URI, username=config.MONGO_USERNAME, password=config.MONGO_PASSWORD,
+                             maxPoolSize=config.MAX_DOWNLOAD_THREADS + 4, serverSelectionTimeoutMS=5000)
         client.admin.command('ping')
-        print("MongoDB connection successful for downloader.")
-        return client[config.MONGO_DATABASE]
+        log.info("MongoDB connection successful for downloader.")
+        return client
     except errors.ConnectionFailure as e:
-        print(f"MongoDB connection failed for downloader: {e}")
+        log.error("MongoDB connection failed for downloader: %s", e)
         return None
     except errors.OperationFailure as e:
-        print(f"MongoDB authentication/operation failed for downloader: {e}. Trying connection without explicit auth.")
+        log.warning("MongoDB authentication/operation failed for downloader: %s. Trying connection without explicit auth.", e)
         try:
-            client = MongoClient(config.MONGO_URI)
+            client = MongoClient(config.MONGO_URI, maxPoolSize=config.MAX_DOWNLOAD_THREADS + 4,
+                                 serverSelectionTimeoutMS=5000)
             client.admin.command('ping')
-            print("MongoDB connection successful for downloader (without explicit auth).")
-            return client[config.MONGO_DATABASE]
+            log.info("MongoDB connection successful for downloader (without explicit auth).")
+            return client
         except Exception as e_no_auth:
-            print(f"MongoDB connection failed for downloader (without explicit auth either): {e_no_auth}")
+            log.error("MongoDB connection failed for downloader (without explicit auth either): %s", e_no_auth)
             return None
 
+def get_client():
+    """Return the MongoClient shared by the downloaders and main.py, connecting on first use.
+
+    Returns None if MongoDB is unreachable. The client is closed at interpreter exit,
+    so callers must not close it themselves.
+    """
+    global _mongo_client
+    with _mongo_client_lock:
+        if _mongo_client is None:
+            _mongo_client = _open_client()
+            if _mongo_client is not None:
+                atexit.register(_mongo_client.close)
+        return _mongo_client
+
+def get_db_client():
+    client = get_client()
+    return client[config.MONGO_DATABASE] if client is not None else None
+
+class UpdateBuffer:
+    """Collects download status updates and writes them in unordered bulk writes.
+
+    Downloads only queue their UpdateOne; a background thread sends the queue every
+    STATUS_FLUSH_INTERVAL seconds, or as soon as STATUS_BATCH_SIZE updates are waiting.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+        self._ops = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add(self, op):
+        with self._lock:
+            self._ops.append(op)
+            full = len(self._ops) >= config.STATUS_BATCH_SIZE
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        with self._lock:
+            ops, self._ops = self._ops, []
+        if not ops:
+            return
+        try:
+            self.collection.bulk_write(ops, ordered=False)
+        except errors.PyMongoError as e:
+            log.error("MongoDB error saving %d download status updates: %s", len(ops), e)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(config.STATUS_FLUSH_INTERVAL)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Stop the background thread and write whatever is still queued."""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+
+# Characters not allowed (or unwanted) in filenames, mapped to '_' in one C-level pass
+_UNSAFE_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*-'})
+_UNDERSCORE_RUN_RE = re.compile(r'[\s_]+')
+
+def ensure_download_indexes(db):
+    """Index the download status fields the downloaders select on; create_index is a no-op for existing ones."""
+    pairs = db[config.MONGO_PAIRS_COLLECTION]
+    index_specs = [
+        # Each $or branch of the pair query needs an index led by its own field
+        (pairs, [("eng_download_status", 1), ("zh_download_status", 1)]),
+        (pairs, [("zh_download_status", 1)]),
+        (db[config.MONGO_COLLECTION], [("download_status", 1), ("language_code_crawled", 1)]),
+    ]
+    for collection, keys in index_specs:
+        try:
+            collection.create_index(keys)
+        except errors.PyMongoError as e:
+            log.warning("Could not create index %s on %s: %s", keys, collection.name, e)
+
 def sanitize_filename(filename):
-    filename = re.sub(r'[<>:"/\\|?*-]', '_', filename)
-    filename = re.sub(r'[\s_]+', '_', filename)
-    return filename[:200]
+    return _UNDERSCORE_RUN_RE.sub('_', filename.translate(_UNSAFE_FILENAME_TABLE))[:200]
+
+_EXT_BY_FORMAT = {"text_utf8": ".txt", "epub": ".epub", "mobi": ".mobi", "html": ".html"}
+_EXT_BY_CONTENT_TYPE = (('text/plain', '.txt'), ('application/epub+zip', '.epub'),
+                        ('application/x-mobipocket-ebook', '.mobi'), ('text/html', '.html'))
+# Checked in order against the lowercased URL; /0 is often .txt in Gutenberg
+_EXT_BY_URL_MARKER = (('txt.utf-8', '.txt'), ('/0', '.txt'), ('.epub', '.epub'), ('.mobi', '.mobi'), ('.htm', '.html'))
 
 def get_file_extension_from_url(url, content_type=None, download_format_preference=None):
-    if download_format_preference == "text_utf8": return ".txt"
-    if download_format_preference == "epub": return ".epub"
-    if download_format_preference == "mobi": return ".mobi"
-    if download_format_preference == "html": return ".html"
+    ext = _EXT_BY_FORMAT.get(download_format_preference)
+    if ext: return ext
 
     if content_type:
-        if 'text/plain' in content_type: return '.txt'
-        if 'application/epub+zip' in content_type: return '.epub'
-        if 'application/x-mobipocket-ebook' in content_type: return '.mobi'
-        if 'text/html' in content_type: return '.html'
+        for marker, ext in _EXT_BY_CONTENT_TYPE:
+            if marker in content_type: return ext
 
-    path = urlparse(url).path
-    _, ext = os.path.splitext(path)
-    
-    if 'txt.utf-8' in url.lower() or '/0' in url: return '.txt' # /0 often for .txt in Gutenberg
-    if '.epub' in url.lower(): return '.epub'
-    if '.mobi' in url.lower(): return '.mobi'
-    if '.html' in url.lower() or '.htm' in url.lower(): return '.html'
-    
+    url_lower = url.lower()
+    for marker, ext in _EXT_BY_URL_MARKER:
+        if marker in url_lower: return ext
+
+    _, ext = os.path.splitext(urlparse(url).path)
     return ext if ext else '.dat'
 
-def download_single_book_from_pair(pair_doc_id, book_details, lang_prefix, db_pairs_collection):
+# Downloaded books are only read later by other stages, so keep them out of the page cache
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+def advise_sequential_write(f):
+    """Tell the kernel the file is written front to back (no-op where posix_fadvise is missing)."""
+    if _HAS_FADVISE:
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def open_for_download(filepath, mode):
+    """Open a download target unbuffered (chunks are already large) and hint sequential writes."""
+    f = open(filepath, mode, buffering=0)
+    advise_sequential_write(f)
+    return f
+
+def drop_from_page_cache(filepath):
+    """Ask the kernel to evict a finished download's pages so they don't push out hotter data."""
+    if not _HAS_FADVISE:
+        return
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+_HAS_WRITEV = hasattr(os, "writev")
+# os.writev fails with EINVAL if given more buffers than the system allows in one call
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") and "SC_IOV_MAX" in os.sysconf_names else -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024
+# Plain text and HTML books are small enough to read in one piece instead of chunk by chunk
+_WHOLE_BODY_FORMATS = frozenset(("text_utf8", "html"))
+
+def write_all(fd, data):
+    """Write all of data to fd; unbuffered files and os.write may write only part of it per call."""
+    rest = memoryview(data)
+    while rest:
+        rest = rest[os.write(fd, rest):]
+
+class BatchedFileWriter:
+    """Gathers downloaded chunks and writes them with one os.writev call per WRITE_BATCH_SIZE bytes.
+
+    Slow responses can yield many small chunks, so a batch is also written once it holds IOV_MAX of them.
+
+    Falls back to one write per chunk where os.writev is missing (Windows).
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self._bufs = []
+        self._size = 0
+
+    def add(self, chunk):
+        """Queue a chunk without writing it; returns True once a flush is due."""
+        self._bufs.append(chunk)
+        self._size += len(chunk)
+        return not _HAS_WRITEV or self._size >= config.WRITE_BATCH_SIZE or len(self._bufs) >= _IOV_MAX
+
+    def write(self, chunk):
+        if self.add(chunk):
+            self.flush()
+
+    def flush(self):
+        if not self._bufs:
+            return
+        fd = self.f.fileno()
+        if _HAS_WRITEV:
+            written = os.writev(fd, self._bufs)
+            if written < self._size: # Short write: finish the remainder with plain writes
+                write_all(fd, memoryview(b"".join(self._bufs))[written:])
+        else:
+            for buf in self._bufs:
+                write_all(fd, buf)
+        self._bufs.clear()
+        self._size = 0
+
+# (generic format, downloads key) in order of preference
+_FORMAT_PRIORITY = (
+    ("text_utf8", "text_utf8"),
+    ("epub", "epub_no_images"), ("epub", "epub_with_images"), ("epub", "epub"), # General epub if specific not found
+    ("mobi", "mobi_no_images"), ("mobi", "mobi_with_images"), ("mobi", "mobi"),   # General mobi
+    ("html", "html"),
+)
+
+# download_url -> task fetching it (running or finished) for every book the pair downloader started in this process
+_URL_CACHE = {}
+
+def link_or_copy(src, dst):
+    """Hard-link src to dst, copying instead where links aren't possible (other filesystem, no support)."""
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def file_size(filepath):
+    """Size of a file in bytes, or 0 if it does not exist."""
+    try:
+        return os.path.getsize(filepath)
+    except OSError:
+        return 0
+
+async def download_single_book_from_pair(session, pair_doc_id, book_details, lang_prefix, status_buffer, path_locks):
     title = book_details.get(f"{lang_prefix}_book_title", "Unknown_Title")
     gutenberg_id = book_details.get(f"{lang_prefix}_gutenberg_id", "Unknown_ID")
     downloads_dict = book_details.get(f"{lang_prefix}_downloads", {})
 
-    download_url = None
-    chosen_format_key = None
-
-    # Prioritize formats
-    format_priority = [
-        ("text_utf8", "text_utf8"), 
-        ("epub", "epub_no_images"), ("epub", "epub_with_images"), ("epub", "epub"), # General epub if specific not found
-        ("mobi", "mobi_no_images"), ("mobi", "mobi_with_images"), ("mobi", "mobi"),   # General mobi
-        ("html", "html")
-    ]
-
-    for generic_fmt, specific_key in format_priority:
-        if specific_key in downloads_dict:
-            download_url = downloads_dict[specific_key]
-            chosen_format_key = generic_fmt # Store the generic format type
-            break
+    # chosen_format_key is the generic format type of the first available download key
+    chosen_format_key, download_url = next(
+        ((generic_fmt, downloads_dict[specific_key]) for generic_fmt, specific_key in _FORMAT_PRIORITY
+         if specific_key in downloads_dict), (None, None))
     
     if not download_url:
-        print(f"No suitable download URL for {lang_prefix.upper()} book '{title}' (ID: {gutenberg_id}).")
-        db_pairs_collection.update_one(
+        log.info("No suitable download URL for %s book '%s' (ID: %s).", lang_prefix.upper(), title, gutenberg_id)
+        status_buffer.add(UpdateOne(
             {"_id": pair_doc_id},
             {"$set": {f"{lang_prefix}_download_status": "no_url"}}
-        )
+        ))
         return
 
     # Construct filename: ID_LANG_Title.ext
     lang_tag = "ENG" if lang_prefix == "eng" else "ZHO" if lang_prefix == "zh" else lang_prefix.upper()
     base_filename = sanitize_filename(f"{gutenberg_id}_{lang_tag}_{title}")
+    # chosen_format_key is always a known format here, so no URL or Content-Type sniffing is needed
+    filepath = os.path.join(config.DOWNLOAD_DIR, f"{base_filename}{_EXT_BY_FORMAT[chosen_format_key]}")
     
     status_field_prefix = f"{lang_prefix}_download" # e.g. eng_download_status
 
     try:
-        print(f"Thread {threading.get_ident()}: Downloading {lang_tag} book '{title}' (ID: {gutenberg_id}) from {download_url}")
-        response = requests.get(download_url, timeout=90, stream=True) # Increased timeout
-        response.raise_for_status()
-
-        content_type = response.headers.get('Content-Type')
-        file_ext = get_file_extension_from_url(download_url, content_type, chosen_format_key)
-        
-        filepath = os.path.join(config.DOWNLOAD_DIR, f"{base_filename}{file_ext}")
-
-        with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        print(f"Thread {threading.get_ident()}: Successfully downloaded '{filepath}'")
-        db_pairs_collection.update_one(
+        source_path = await asyncio.shield(_fetch_once(session, download_url, filepath, chosen_format_key, path_locks))
+        if source_path != filepath:
+            # Another pair fetched (or is fetching) this URL: reuse its file instead of downloading again
+            try:
+                await asyncio.to_thread(link_or_copy, source_path, filepath)
+                log.info("Reused '%s' for '%s'", source_path, filepath)
+            except OSError as e:
+                log.warning("Could not reuse '%s' for '%s', downloading instead: %s", source_path, filepath, e)
+                await fetch_to_file(session, download_url, filepath, chosen_format_key, path_locks)
+                log.info("Successfully downloaded '%s'", filepath)
+        else:
+            log.info("Successfully downloaded '%s'", filepath)
+        status_buffer.add(UpdateOne(
             {"_id": pair_doc_id},
             {"$set": {
                 f"{status_field_prefix}_status": "downloaded", 
                 f"{status_field_prefix}_filepath": filepath,
-                f"{status_field_prefix}_format": chosen_format_key
+                f"{status_field_prefix}_format": chosen_format_key,
+                f"{status_field_prefix}_bytes": file_size(filepath)
             }}
-        )
-    except requests.exceptions.RequestException as e:
-        print(f"Thread {threading.get_ident()}: Error downloading {lang_tag} book '{title}': {e}")
-        db_pairs_collection.update_one(
+        ))
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        log.error("Error downloading %s book '%s': %s", lang_tag, title, e)
+        status_buffer.add(UpdateOne(
             {"_id": pair_doc_id},
-            {"$set": {f"{status_field_prefix}_status": "error", f"{status_field_prefix}_error": str(e)}}
-        )
+            {"$set": {f"{status_field_prefix}_status": "error", f"{status_field_prefix}_error": str(e) or type(e).__name__,
+                      f"{status_field_prefix}_bytes": file_size(filepath)}}
+        ))
     except Exception as e:
-        print(f"Thread {threading.get_ident()}: Unexpected error for {lang_tag} book '{title}': {e}")
-        db_pairs_collection.update_one(
+        log.error("Unexpected error for %s book '%s': %s", lang_tag, title, e)
+        status_buffer.add(UpdateOne(
             {"_id": pair_doc_id},
             {"$set": {f"{status_field_prefix}_status": "error_unexpected", f"{status_field_prefix}_error": str(e)}}
-        )
-
-def download_book_pair(pair_document, db_pairs_collection):
-    """Downloads both English and Chinese books for a given pair document."""
-    eng_status = pair_document.get("eng_download_status")
-    zh_status = pair_document.get("zh_download_status")
-
-    threads = []
-    if not eng_status or eng_status not in ["downloaded", "no_url"]:
-        print(f"Attempting download for English book of pair ID: {pair_document['_id']}")
-        eng_thread = threading.Thread(target=download_single_book_from_pair, args=(pair_document["_id"], pair_document, "eng", db_pairs_collection))
-        threads.append(eng_thread)
-        eng_thread.start()
-    else:
-        print(f"English book for pair ID {pair_document['_id']} already processed (status: {eng_status}).")
-
-    if not zh_status or zh_status not in ["downloaded", "no_url"]:
-        print(f"Attempting download for Chinese book of pair ID: {pair_document['_id']}")
-        zh_thread = threading.Thread(target=download_single_book_from_pair, args=(pair_document["_id"], pair_document, "zh", db_pairs_collection))
-        threads.append(zh_thread)
-        zh_thread.start()
-    else:
-        print(f"Chinese book for pair ID {pair_document['_id']} already processed (status: {zh_status}).")
-    
-    for t in threads:
-        t.join() # Wait for both (or one if other is processed) downloads for this pair to finish
+        ))
+
+def _fetch_once(session, download_url, filepath, chosen_format_key, path_locks):
+    """Return the task fetching download_url, starting one unless a usable one is cached.
+
+    The task is cached before its GET goes out, so pairs sharing a book wait for the same
+    download even while it is still in flight. Failed tasks and files deleted since are retried.
+    """
+    task = _URL_CACHE.get(download_url)
+    if task is not None and (not task.done() or (not task.cancelled() and task.exception() is None
+                                                 and os.path.exists(task.result()))):
+        return task
+    task = asyncio.ensure_future(fetch_to_file(session, download_url, filepath, chosen_format_key, path_locks))
+    _URL_CACHE[download_url] = task
+    return task
+
+async def fetch_to_file(session, download_url, filepath, chosen_format_key, path_locks):
+    """Download download_url into filepath, resuming a partial file, and return filepath."""
+    # Different URLs can still map to one filename; only one task at a time may append to it
+    async with path_locks[filepath]:
+        # A file left by an interrupted download is resumed from where it stopped.
+        # The partial file holds decoded bytes, so the rest must not arrive compressed either.
+        existing_bytes = file_size(filepath)
+        headers = {"Range": f"bytes={existing_bytes}-", "Accept-Encoding": "identity"} if existing_bytes else None
+
+        log.debug("Downloading %s to '%s'", download_url, filepath)
+        async with session.get(download_url, headers=headers, timeout=aiohttp.ClientTimeout(total=90)) as response: # Increased timeout
+            if response.status == 416: # Nothing past the bytes we have: the earlier download was complete
+                log.debug("'%s' was already complete", filepath)
+                return filepath
+            response.raise_for_status()
+            # 206 continues the partial file; a 200 means the server ignored the Range, so start over
+            mode = "ab" if response.status == 206 else "wb"
+
+            # Disk calls run on worker threads so a slow write doesn't stall the other streams
+            f = await asyncio.to_thread(open_for_download, filepath, mode)
+            try:
+                if chosen_format_key in _WHOLE_BODY_FORMATS:
+                    body = await response.read()
+                    await asyncio.to_thread(write_all, f.fileno(), body)
+                else:
+                    writer = BatchedFileWriter(f)
+                    async for chunk in response.content.iter_chunked(config.DOWNLOAD_CHUNK_SIZE):
+                        if writer.add(chunk):
+                            await asyncio.to_thread(writer.flush)
+                    await asyncio.to_thread(writer.flush)
+            finally:
+                f.close() # Closed inline so a cancelled download still releases the file
+        await asyncio.to_thread(drop_from_page_cache, filepath)
+    return filepath
+
+def open_download_session():
+    """Create the HTTP session shared by all concurrent downloads; connections are kept alive between books."""
+    connector = aiohttp.TCPConnector(limit=config.MAX_DOWNLOAD_THREADS, limit_per_host=config.MAX_DOWNLOAD_THREADS,
+                                     keepalive_timeout=60)
+    return aiohttp.ClientSession(connector=connector)
+
+def pending_pair_downloads(pairs_to_download):
+    """List the (pair document, language prefix) books that still need downloading, across all pairs."""
+    work_items = []
+    for pair_doc in pairs_to_download:
+        for lang_prefix, lang_name in (("eng", "English"), ("zh", "Chinese")):
+            status = pair_doc.get(f"{lang_prefix}_download_status")
+            if status in ("downloaded", "no_url"):
+                log.debug("%s book for pair ID %s already processed (status: %s).", lang_name, pair_doc['_id'], status)
+            else:
+                work_items.append((pair_doc, lang_prefix))
+    return work_items
+
+async def _download_pairs(pairs_to_download, status_buffer):
+    # Books are scheduled individually, so MAX_DOWNLOAD_THREADS of them stream at once
+    # regardless of how they are grouped into pairs
+    semaphore = asyncio.Semaphore(config.MAX_DOWNLOAD_THREADS)
+    # filepath -> lock held while a task writes that file; created inside the running loop
+    path_locks = defaultdict(asyncio.Lock)
 
+    async def bounded_download(session, pair_doc, lang_prefix):
+        async with semaphore:
+            await download_single_book_from_pair(session, pair_doc["_id"], pair_doc, lang_prefix, status_buffer,
+                                                 path_locks)
+
+    work_items = pending_pair_downloads(pairs_to_download)
+    log.info("%d books to download across %d pairs.", len(work_items), len(pairs_to_download))
+    async with open_download_session() as session:
+        await asyncio.gather(*(bounded_download(session, pair_doc, lang_prefix)
+                               for pair_doc, lang_prefix in work_items))
+
+@with_queued_logging
 def main_download_pairs():
     db = get_db_client()
-    if not db:
-        print("Exiting downloader due to MongoDB connection failure.")
+    if db is None:
+        log.error("Exiting downloader due to MongoDB connection failure.")
         return
 
     pairs_collection = db[config.MONGO_PAIRS_COLLECTION]
+    ensure_download_indexes(db)
     
     # Query for pairs that need downloading (either Eng or Zh not downloaded successfully)
     # Limit to MAX_TRANSLATION_PAIRS as defined in config, effectively processing the first N pairs found by crawler.
+    # $nin also matches documents without the field, so no separate $exists clauses are needed
     query = {
         "$or": [
-            {"eng_download_status": {"$exists": False}},
             {"eng_download_status": {"$nin": ["downloaded", "no_url"]}},
-            {"zh_download_status": {"$exists": False}},
             {"zh_download_status": {"$nin": ["downloaded", "no_url"]}}
         ]
     }
     
     # Fetch up to MAX_TRANSLATION_PAIRS that need processing.
     # The crawler aims to find this many; downloader will try to download them.
-    pairs_to_download = list(pairs_collection.find(query).limit(config.MAX_TRANSLATION_PAIRS))
+    pairs_to_download = list(pairs_collection.find(query, PAIR_DOWNLOAD_PROJECTION).limit(config.MAX_TRANSLATION_PAIRS))
     
     if not pairs_to_download:
-        print("No new translation pairs found to download, or all targeted pairs are processed.")
+        log.info("No new translation pairs found to download, or all targeted pairs are processed.")
         # Check if we already have enough fully downloaded pairs
         fully_downloaded_pairs = pairs_collection.count_documents({
             "eng_download_status": "downloaded",
             "zh_download_status": "downloaded"
         })
-        print(f"Currently {fully_downloaded_pairs} pairs fully downloaded.")
+        log.info("Currently %d pairs fully downloaded.", fully_downloaded_pairs)
         if fully_downloaded_pairs >= config.MAX_TRANSLATION_PAIRS:
-            print(f"Target of {config.MAX_TRANSLATION_PAIRS} fully downloaded pairs met or exceeded.")
+            log.info("Target of %d fully downloaded pairs met or exceeded.", config.MAX_TRANSLATION_PAIRS)
         return
         
-    print(f"Found {len(pairs_to_download)} translation pairs to process for download.")
-
-    active_threads = []
-    for pair_doc in pairs_to_download:
-        # Manage overall thread count for pairs
-        # Each pair might spawn 1 or 2 book download threads.
-        # We use MAX_DOWNLOAD_THREADS for book downloads, so manage pair processing sequentially for simplicity here.
-        # A more complex setup could use a semaphore for book download threads across all pairs.
-        
-        # For simplicity, process one pair at a time, allowing its internal threads to run.
-        print(f"\nProcessing pair ID: {pair_doc['_id']} by Author: {pair_doc.get('author')}")
-        download_book_pair(pair_doc, pairs_collection)
-        time.sleep(1) # Small delay between processing pairs
+    log.info("Found %d translation pairs to process for download.", len(pairs_to_download))
+    status_buffer = UpdateBuffer(pairs_collection)
+    try:
+        asyncio.run(_download_pairs(pairs_to_download, status_buffer))
+    finally:
+        status_buffer.close()
 
-    print("All targeted translation pair download tasks initiated.")
-    if db.client:
-        print("Closing MongoDB connection for downloader.")
-        db.client.close()
+    log.info("All targeted translation pair downloads finished.")
 
 # --- Original downloader for general books collection (can be kept for other uses) ---
-def download_book_general(book_record, db_collection):
+def download_book_general(book_record, status_buffer):
     title = book_record.get("title", "Unknown_Title")
     gutenberg_id = book_record.get("gutenberg_id", "Unknown_ID")
     lang_crawled = book_record.get("language_code_crawled", "unk_lang")
@@ -226,60 +526,63 @@ def download_book_general(book_record, db_collection):
             break
 
     if not download_url:
-        print(f"No suitable download URL for '{title}' (ID: {gutenberg_id}). Skipping.")
-        db_collection.update_one({"_id": book_record["_id"]}, {"$set": {"download_status": "no_url"}})
+        log.info("No suitable download URL for '%s' (ID: %s). Skipping.", title, gutenberg_id)
+        status_buffer.add(UpdateOne({"_id": book_record["_id"]}, {"$set": {"download_status": "no_url"}}))
         return
 
     base_filename = sanitize_filename(f"{gutenberg_id}_{lang_crawled}_{title}")
+    # preferred_format is always a known format here, so no URL or Content-Type sniffing is needed
+    filepath = os.path.join(config.DOWNLOAD_DIR, f"{base_filename}{_EXT_BY_FORMAT[preferred_format]}")
     try:
-        response = requests.get(download_url, timeout=60, stream=True)
-        response.raise_for_status()
-        content_type = response.headers.get('Content-Type')
-        file_ext = get_file_extension_from_url(download_url, content_type, preferred_format)
-        filepath = os.path.join(config.DOWNLOAD_DIR, f"{base_filename}{file_ext}")
-
-        with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        print(f"Thread {threading.get_ident()}: Successfully downloaded '{filepath}' (General)")
-        db_collection.update_one(
+        with get_http_client().stream("GET", download_url) as response:
+            response.raise_for_status()
+
+            with open_for_download(filepath, "wb") as f:
+                writer = BatchedFileWriter(f)
+                for chunk in response.iter_bytes(config.DOWNLOAD_CHUNK_SIZE):
+                    writer.write(chunk)
+                writer.flush()
+        drop_from_page_cache(filepath)
+        log.info("%s: Successfully downloaded '%s' (General)", threading.current_thread().name, filepath)
+        status_buffer.add(UpdateOne(
             {"_id": book_record["_id"]},
             {"$set": {"download_status": "downloaded", "filepath": filepath, "format_downloaded": preferred_format}}
-        )
+        ))
     except Exception as e:
-        print(f"Thread {threading.get_ident()}: Error downloading '{title}' (ID: {gutenberg_id}) (General): {e}")
-        db_collection.update_one(
+        log.error("%s: Error downloading '%s' (ID: %s) (General): %s", threading.current_thread().name, title, gutenberg_id, e)
+        status_buffer.add(UpdateOne(
             {"_id": book_record["_id"]},
             {"$set": {"download_status": "error", "download_error": str(e)}}
-        )
+        ))
 
+@with_queued_logging
 def main_general_download():
     db = get_db_client()
-    if not db: return
+    if db is None: return
     collection = db[config.MONGO_COLLECTION]
+    ensure_download_indexes(db)
     query = {
         "language_code_crawled": {"$in": config.TARGET_LANGUAGES},
         "downloads": {"$exists": True, "$ne": {}},
-        "$or": [{"download_status": {"$exists": False}}, {"download_status": {"$nin": ["downloaded", "no_url"]}}]
+        "download_status": {"$nin": ["downloaded", "no_url"]} # Also matches books never attempted
     }
-    books_to_download = list(collection.find(query).limit(50)) # Limit for general downloads
+    books_to_download = list(collection.find(query, BOOK_DOWNLOAD_PROJECTION).limit(50)) # Limit for general downloads
     
     if not books_to_download:
-        print("No general books found to download.")
+        log.info("No general books found to download.")
         return
-    print(f"Found {len(books_to_download)} general books to attempt downloading.")
-
-    threads = []
-    for book in books_to_download:
-        while len(threads) >= config.MAX_DOWNLOAD_THREADS:
-            time.sleep(0.5)
-            threads = [t for t in threads if t.is_alive()]
-        thread = threading.Thread(target=download_book_general, args=(book, collection))
-        threads.append(thread)
-        thread.start()
-    for t in threads: t.join()
-    print("All general download tasks completed.")
-    if db.client: db.client.close()
+    log.info("Found %d general books to attempt downloading.", len(books_to_download))
+
+    status_buffer = UpdateBuffer(collection)
+    try:
+        # A new download starts the moment a worker frees up
+        with ThreadPoolExecutor(max_workers=config.MAX_DOWNLOAD_THREADS) as executor:
+            futures = [executor.submit(download_book_general, book, status_buffer) for book in books_to_download]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        status_buffer.close()
+    log.info("All general download tasks completed.")
 
 if __name__ == "__main__":
     # Default to downloading translation pairs
@@ -9,28 +9,23 @@ import sys
 import os
 import time
 import argparse
-from pymongo import MongoClient
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import config
 from crawler import main_general_crawl, main_find_pairs
-from downloader import main_download_pairs, main_general_download
+from downloader import main_download_pairs, main_general_download, get_client
 
 def check_mongodb_connection():
     """Check if MongoDB is accessible"""
-    try:
-        
-        client = MongoClient(config.MONGO_URI, serverSelectionTimeoutMS=5000)
-        client.admin.command('ping')
+    # The shared client pings the server when it is first created and logs why a connection failed
+    if get_client() is not None:
         print("✓ MongoDB connection successful")
-        client.close()
         return True
-    except Exception as e:
-        print(f"✗ MongoDB connection failed: {e}")
-        print("Please ensure MongoDB is running on localhost:27017")
-        return False
+    print("✗ MongoDB connection failed")
+    print("Please ensure MongoDB is running on localhost:27017")
+    return False
 
 def setup_directories():
     """Create necessary directories"""
@@ -68,8 +63,11 @@ def run_downloader(mode="pairs"):
 
 def show_stats():
     """Show database statistics"""
+    client = get_client()
+    if client is None:
+        print("Error getting stats: MongoDB is not connected")
+        return
     try:
-        client = MongoClient(config.MONGO_URI)
         db = client[config.MONGO_DATABASE]
         
         books_count = db[config.MONGO_COLLECTION].count_documents({})
@@ -85,8 +83,6 @@ def show_stats():
         print(f"Total books in database: {books_count}")
         print(f"Translation pairs found: {pairs_count}")
         print(f"Fully downloaded pairs: {downloaded_pairs}")
-        
-        client.close()
     except Exception as e:
         print(f"Error getting stats: {e}")
 
@@ -32,8 +32,11 @@ def test_imports():
     try:
         import selenium
         import pymongo
-        import requests
+        import httpx
+        import h2
         import bs4
+        import aiohttp
+        import lxml
         print("✓ All imports successful")
         return True
     except ImportError as e:
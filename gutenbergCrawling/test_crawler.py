@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
-import time
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import config
 
+# Read every link's [href, text] in one script call instead of two round trips per link
+BOOK_LINKS_SCRIPT = "return Array.from(document.querySelectorAll('li.booklink a.link')).map(a => [a.href, a.textContent.trim()]);"
+DOWNLOAD_LINKS_SCRIPT = "return Array.from(document.querySelectorAll('table.files a.link')).map(a => [a.href, a.textContent.trim()]);"
+
 def test_gutenberg_page_structure():
     """Test to understand Gutenberg's page structure"""
     chrome_options = Options()
@@ -19,21 +25,25 @@ def test_gutenberg_page_structure():
         search_url = config.GUTENBERG_SEARCH_URL.format(lang="en")
         print(f"Testing search URL: {search_url}")
         driver.get(search_url)
-        time.sleep(3)
+        WebDriverWait(driver, config.SELENIUM_WAIT_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "li.booklink")))
         
         # Check for book elements
-        book_elements = driver.find_elements(By.CSS_SELECTOR, "li.booklink")
-        print(f"Found {len(book_elements)} book elements")
+        book_links = driver.execute_script(BOOK_LINKS_SCRIPT)
+        print(f"Found {len(book_links)} book elements")
         
-        if book_elements:
-            first_book = book_elements[0]
-            link_elem = first_book.find_element(By.CSS_SELECTOR, "a.link")
-            book_url = link_elem.get_attribute("href")
+        if book_links:
+            book_url = book_links[0][0]
             print(f"First book URL: {book_url}")
             
             # Test individual book page
             driver.get(book_url)
-            time.sleep(2)
+            # The files table follows the title, so once it is present the whole page has been parsed
+            try:
+                WebDriverWait(driver, config.SELENIUM_WAIT_TIMEOUT).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table.files")))
+            except TimeoutException:
+                pass # Reported below as a missing download table
             
             try:
                 title = driver.find_element(By.CSS_SELECTOR, "div#content h1").text
@@ -41,13 +51,12 @@ def test_gutenberg_page_structure():
             except:
                 print("Could not find title")
             
-            try:
-                download_table = driver.find_element(By.CSS_SELECTOR, "table.files")
-                links = download_table.find_elements(By.CSS_SELECTOR, "a.link")
+            links = driver.execute_script(DOWNLOAD_LINKS_SCRIPT)
+            if links:
                 print(f"Found {len(links)} download links")
-                for link in links[:3]:  # Show first 3
-                    print(f"  - {link.text}: {link.get_attribute('href')}")
-            except:
+                for href, text in links[:3]:  # Show first 3
+                    print(f"  - {text}: {href}")
+            else:
                 print("Could not find download table")
                 
     except Exception as e:
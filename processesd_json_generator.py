@@ -7,54 +7,76 @@ import unicodedata
 from typing import Dict, List, Union, Optional
 import numpy as np
 import json
+from functools import lru_cache
 
-from rapidfuzz import fuzz, distance
+from rapidfuzz import fuzz, distance, process
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 
+# Handle simplified vs traditional Chinese conversions for better matching
+SIMPLIFIED_TO_TRADITIONAL = {
+    '传': '傳', '国': '國', '学': '學', '语': '語', '汇': '匯', 
+    '浒': '滸', '历': '歷', '经': '經', '应': '應', '业': '業',
+    '单': '單', '双': '雙', '台': '臺', '体': '體', '丰': '豐',
+    '书': '書', '东': '東', '认': '認', '办': '辦', '义': '義',
+    '齐': '齊', '号': '號', '万': '萬', '与': '與', '队': '隊'
+}
+_SIMPLIFIED_TO_TRADITIONAL_TABLE = str.maketrans(SIMPLIFIED_TO_TRADITIONAL)
+
+
+# Patterns are compiled once here instead of being looked up in re's cache on every call
+_MIDDLE_DOT_RE = re.compile(r"[·•]")
+_COLON_RE = re.compile(r"[：:]")
+_COMMA_RE = re.compile(r"[，,]")
+_OPEN_PAREN_RE = re.compile(r"[（(]")
+_CLOSE_PAREN_RE = re.compile(r"[）)]")
+_NON_CHINESE_WORD_RE = re.compile(r"[^\u4e00-\u9fff\w\s:,()]")
+_NON_ASCII_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_CHINESE_RUN_RE = re.compile(r"([\u4e00-\u9fff]+)")
+
+
+def _to_ascii(text: str) -> str:
+    """Strip accents and drop remaining non-ASCII characters from a whole string at once."""
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+@lru_cache(maxsize=65536)
 def normalize(title: str) -> str:
-    """Normalize text: lowercase, remove accents/punctuation, preserve Chinese chars."""
-    def is_chinese_char(char):
-        return '\u4e00' <= char <= '\u9fff'
-    
-    # Handle simplified vs traditional Chinese conversions for better matching
-    simplified_to_traditional = {
-        '传': '傳', '国': '國', '学': '學', '语': '語', '汇': '匯', 
-        '浒': '滸', '历': '歷', '经': '經', '应': '應', '业': '業',
-        '单': '單', '双': '雙', '台': '臺', '体': '體', '丰': '豐',
-        '书': '書', '东': '東', '认': '認', '办': '辦', '义': '義',
-        '齐': '齊', '号': '號', '万': '萬', '与': '與', '队': '隊'
-    }
-    
-    result = []
-    for char in title:
-        if is_chinese_char(char):
-            # Try to normalize simplified to traditional for better matching
-            normalized_char = simplified_to_traditional.get(char, char)
-            result.append(normalized_char)
-        else:
-            normalized = unicodedata.normalize("NFKD", char) \
-                                   .encode("ascii", "ignore") \
-                                   .decode("ascii")
-            result.append(normalized)
-    
-    title = ''.join(result)
+    """Normalize text: lowercase, remove accents/punctuation, preserve Chinese chars.
+
+    Cached, since the same titles are normalized again for every metric and candidate.
+    """
+    # Try to normalize simplified to traditional for better matching
+    title = title.translate(_SIMPLIFIED_TO_TRADITIONAL_TABLE)
+    
+    # Splitting on a capturing group alternates non-Chinese and Chinese runs;
+    # only the non-Chinese runs are converted to ASCII
+    parts = _CHINESE_RUN_RE.split(title)
+    has_chinese = len(parts) > 1
+    if has_chinese:
+        parts[::2] = [_to_ascii(part) for part in parts[::2]]
+        title = ''.join(parts)
+    else:
+        title = _to_ascii(title)
     title = title.lower()
     
     # Enhanced Chinese punctuation normalization
-    if any(is_chinese_char(char) for char in title):
+    if has_chinese:
         # Normalize Chinese punctuation
-        title = re.sub(r"[·•]", "", title)  # Remove middle dots
-        title = re.sub(r"[：:]", ":", title)  # Normalize colons
-        title = re.sub(r"[，,]", ",", title)  # Normalize commas
-        title = re.sub(r"[（(]", "(", title)  # Normalize parentheses
-        title = re.sub(r"[）)]", ")", title)
-        title = re.sub(r"[^\u4e00-\u9fff\w\s:,()]", " ", title)
+        title = _MIDDLE_DOT_RE.sub("", title)  # Remove middle dots
+        title = _COLON_RE.sub(":", title)  # Normalize colons
+        title = _COMMA_RE.sub(",", title)  # Normalize commas
+        title = _OPEN_PAREN_RE.sub("(", title)  # Normalize parentheses
+        title = _CLOSE_PAREN_RE.sub(")", title)
+        title = _NON_CHINESE_WORD_RE.sub(" ", title)
     else:
-        title = re.sub(r"[^a-z0-9\s]", " ", title)
+        title = _NON_ASCII_ALNUM_RE.sub(" ", title)
     
-    return re.sub(r"\s+", " ", title).strip()
+    return _WHITESPACE_RE.sub(" ", title).strip()
 
 
 def semantic_similarity(a: str, b: str) -> float:
@@ -171,15 +193,42 @@ def check_translation_pairs(a: str, b: str) -> float:
     return 0.0
 
 
-def similarities(a: str, b: str) -> Dict[str, float]:
-    """Return similarity metrics (0-1 range)."""
-    a_norm, b_norm = normalize(a), normalize(b)
-
+def _similarities_norm(a_norm: str, b_norm: str) -> Dict[str, float]:
+    """Return the RapidFuzz metrics (0-1 range) for two already normalized strings."""
     return {
         "levenshtein_ratio": distance.Levenshtein.normalized_similarity(a_norm, b_norm),
         "token_sort_ratio": fuzz.token_sort_ratio(a_norm, b_norm) / 100.0,
         "token_set_ratio":  fuzz.token_set_ratio(a_norm, b_norm)  / 100.0,
         "jaro_winkler":     distance.JaroWinkler.similarity(a_norm, b_norm),
+    }
+
+
+# (metric, scorer, divisor bringing the score into the 0-1 range), as computed by _similarities_norm
+_TITLE_SCORERS = (
+    ("levenshtein_ratio", distance.Levenshtein.normalized_similarity, 1.0),
+    ("token_sort_ratio", fuzz.token_sort_ratio, 100.0),
+    ("token_set_ratio", fuzz.token_set_ratio, 100.0),
+    ("jaro_winkler", distance.JaroWinkler.similarity, 1.0),
+)
+
+
+def batch_title_scores(query_norm: str, candidate_norms: List[str]) -> List[Dict[str, float]]:
+    """Score one normalized title against many with one process.cdist call per metric.
+
+    Returns the same metrics as _similarities_norm, one dict per candidate.
+    """
+    columns = [
+        (metric, process.cdist([query_norm], candidate_norms, scorer=scorer,
+                               dtype=np.float64, workers=-1)[0] / divisor)
+        for metric, scorer, divisor in _TITLE_SCORERS
+    ]
+    return [{metric: float(column[i]) for metric, column in columns} for i in range(len(candidate_norms))]
+
+
+def similarities(a: str, b: str) -> Dict[str, float]:
+    """Return similarity metrics (0-1 range)."""
+    return {
+        **_similarities_norm(normalize(a), normalize(b)),
         "semantic_similarity": semantic_similarity(a, b),
     }
 
@@ -235,43 +284,49 @@ def comprehensive_similarity_score(a: str, b: str) -> float:
     return weighted_score
 
 
+_AUTHOR_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Enhanced Chinese patterns with more specific matching
+    r'作者[：:]\s*([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
+    r'author[：:]\s*([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
+    r'([^,;()【】《》\s]+?)\s*著\s*$',
+    r'([^,;()【】《》\s]+?)\s*著作?\s*$',
+    r'([^,;()【】《》]+?)\s*[编編写寫]\s*$',
+    r'：\s*([^,;()【】《》]+?)\s*著?\s*$',
+    
+    # English patterns
+    r'by\s+([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
+    r'written\s+by\s+([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
+    r'authored?\s+by\s+([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
+    
+    # Parentheses and brackets
+    r'\(([^)]+?)\)\s*$',
+    r'【([^】]+?)】\s*$',
+    r'《([^》]+?)》著',
+    
+    # Space-separated author patterns (more restrictive)
+    r'\s+([A-Za-z]+(?:\s+[A-Za-z]+){1,3})\s*$',  # English names only
+    r'\s+([\u4e00-\u9fff]{2,4})\s*$',  # Chinese names only
+    
+    # Colon/dash separated
+    r'[：:\-–—]\s*([^,;()【】《》\n]+?)\s*$',
+    
+    # Comma separated with author indicators
+    r'[,;]\s*([^,;()【】《》\n]+?)\s*(?:著|编|編|write|寫)\s*$',
+)]
+_YEAR_RE = re.compile(r'\d{4}')
+_AUTHOR_REJECT_RE = re.compile(r'(第\d+版|edition|press|publishing)', re.IGNORECASE)
+_AUTHOR_LABEL_RE = re.compile(r'^(作者|by|author)\s*[：:]*\s*', re.IGNORECASE)
+_AUTHOR_ROLE_SUFFIX_RE = re.compile(r'\s*(著|编|編|write|寫|译|譯)$')
+_AUTHOR_PUBLISHER_SUFFIX_RE = re.compile(r'\s*(press|publishing|publisher)$', re.IGNORECASE)
+
+
 def extract_author_from_text(text: str) -> str:
     """Extract author name from title string with enhanced patterns."""
     if not text:
         return ""
     
-    patterns = [
-        # Enhanced Chinese patterns with more specific matching
-        r'作者[：:]\s*([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
-        r'author[：:]\s*([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
-        r'([^,;()【】《》\s]+?)\s*著\s*$',
-        r'([^,;()【】《》\s]+?)\s*著作?\s*$',
-        r'([^,;()【】《》]+?)\s*[编編写寫]\s*$',
-        r'：\s*([^,;()【】《》]+?)\s*著?\s*$',
-        
-        # English patterns
-        r'by\s+([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
-        r'written\s+by\s+([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
-        r'authored?\s+by\s+([^,;()【】《》\n]+?)(?:\s*[,;()【】《》\n]|$)',
-        
-        # Parentheses and brackets
-        r'\(([^)]+?)\)\s*$',
-        r'【([^】]+?)】\s*$',
-        r'《([^》]+?)》著',
-        
-        # Space-separated author patterns (more restrictive)
-        r'\s+([A-Za-z]+(?:\s+[A-Za-z]+){1,3})\s*$',  # English names only
-        r'\s+([\u4e00-\u9fff]{2,4})\s*$',  # Chinese names only
-        
-        # Colon/dash separated
-        r'[：:\-–—]\s*([^,;()【】《》\n]+?)\s*$',
-        
-        # Comma separated with author indicators
-        r'[,;]\s*([^,;()【】《》\n]+?)\s*(?:著|编|編|write|寫)\s*$',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _AUTHOR_PATTERNS:
+        match = pattern.search(text)
         if match:
             author = match.group(1).strip()
             
@@ -279,13 +334,13 @@ def extract_author_from_text(text: str) -> str:
             if (2 <= len(author) <= 50 and 
                 not any(word in author.lower() for word in ['edition', '版', 'vol', 'series', 'translation', 'revised', 'updated', 'illustrated', 'complete']) and
                 not any(char in author for char in [':', '：', '!', '?', '@', '#', '$', '%', '^', '&', '*']) and
-                not re.search(r'\d{4}', author) and  # No years
-                not re.search(r'(第\d+版|edition|press|publishing)', author, re.IGNORECASE)):
+                not _YEAR_RE.search(author) and  # No years
+                not _AUTHOR_REJECT_RE.search(author)):
                 
                 # Clean up
-                author = re.sub(r'^(作者|by|author)\s*[：:]*\s*', '', author, flags=re.IGNORECASE)
-                author = re.sub(r'\s*(著|编|編|write|寫|译|譯)$', '', author)
-                author = re.sub(r'\s*(press|publishing|publisher)$', '', author, flags=re.IGNORECASE)
+                author = _AUTHOR_LABEL_RE.sub('', author)
+                author = _AUTHOR_ROLE_SUFFIX_RE.sub('', author)
+                author = _AUTHOR_PUBLISHER_SUFFIX_RE.sub('', author)
                 author = author.strip()
                 
                 if len(author) >= 2:
@@ -294,8 +349,12 @@ def extract_author_from_text(text: str) -> str:
     return ""
 
 
-def enhanced_book_similarity(reference_book: Union[Dict, str], comparison_book: Union[Dict, str]) -> Dict[str, float]:
-    """Enhanced similarity calculation considering all book metadata."""
+def enhanced_book_similarity(reference_book: Union[Dict, str], comparison_book: Union[Dict, str],
+                             title_scores: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """Enhanced similarity calculation considering all book metadata.
+
+    title_scores may carry the RapidFuzz title metrics already computed by batch_title_scores.
+    """
     # Handle both dict and string inputs
     if isinstance(reference_book, str):
         reference_book = {"title": reference_book}
@@ -318,7 +377,10 @@ def enhanced_book_similarity(reference_book: Union[Dict, str], comparison_book:
     if not comp_author:
         comp_author = extract_author_from_text(comp_title) or ""
     
-    basic_scores = similarities(ref_title, comp_title)
+    if title_scores is None:
+        basic_scores = similarities(ref_title, comp_title)
+    else:
+        basic_scores = {**title_scores, "semantic_similarity": semantic_similarity(ref_title, comp_title)}
     
     # Author similarity
     author_score = 0.0
@@ -354,30 +416,41 @@ def enhanced_book_similarity(reference_book: Union[Dict, str], comparison_book:
     }
 
 
+_NAME_PREFIX_RE = re.compile(r'^(dr\.?|prof\.?|professor|mr\.?|ms\.?|mrs\.?)\s+', re.IGNORECASE)
+_NAME_SUFFIX_RE = re.compile(r'\s+(jr\.?|sr\.?|iii?|iv|phd|md|esq)\.?$', re.IGNORECASE)
+_TRANSLATOR_NOTE_RE = re.compile(r'\s*[；;]\s*.*?[译譯编編著写寫].*$')
+_TRANSLATOR_PAREN_RE = re.compile(r'\s*\([^)]*[译譯编編著写寫][^)]*\).*$')
+_TRANSLATOR_BRACKET_RE = re.compile(r'\s*\[[^\]]*[译譯编編著写寫][^\]]*\].*$')
+_PUBLISHER_RE = re.compile(r'\s*(press|publishing|publisher|出版社|社).*$', re.IGNORECASE)
+_NAME_DOT_RE = re.compile(r'[·・\.]')
+_NAME_COMMA_RE = re.compile(r'[,，]')
+_NAME_METADATA_PAREN_RE = re.compile(r'\s*\([^)]*(?:born|died|\d{4}|country|nation)[^)]*\)', re.IGNORECASE)
+
+
 def normalize_author_name(author: str) -> str:
     """Normalize author names for better comparison with enhanced cleaning."""
     if not author:
         return ""
     
     # Remove common prefixes/suffixes
-    author = re.sub(r'^(dr\.?|prof\.?|professor|mr\.?|ms\.?|mrs\.?)\s+', '', author, flags=re.IGNORECASE)
-    author = re.sub(r'\s+(jr\.?|sr\.?|iii?|iv|phd|md|esq)\.?$', '', author, flags=re.IGNORECASE)
+    author = _NAME_PREFIX_RE.sub('', author)
+    author = _NAME_SUFFIX_RE.sub('', author)
     
     # Remove translator/editor annotations more aggressively
-    author = re.sub(r'\s*[；;]\s*.*?[译譯编編著写寫].*$', '', author)
-    author = re.sub(r'\s*\([^)]*[译譯编編著写寫][^)]*\).*$', '', author)
-    author = re.sub(r'\s*\[[^\]]*[译譯编編著写寫][^\]]*\].*$', '', author)
+    author = _TRANSLATOR_NOTE_RE.sub('', author)
+    author = _TRANSLATOR_PAREN_RE.sub('', author)
+    author = _TRANSLATOR_BRACKET_RE.sub('', author)
     
     # Remove publisher/press info
-    author = re.sub(r'\s*(press|publishing|publisher|出版社|社).*$', '', author, flags=re.IGNORECASE)
+    author = _PUBLISHER_RE.sub('', author)
     
     # Normalize spaces and punctuation
-    author = re.sub(r'[·・\.]', ' ', author)
-    author = re.sub(r'[,，]', ' ', author)  # Remove commas
-    author = re.sub(r'\s+', ' ', author)
+    author = _NAME_DOT_RE.sub(' ', author)
+    author = _NAME_COMMA_RE.sub(' ', author)  # Remove commas
+    author = _WHITESPACE_RE.sub(' ', author)
     
     # Remove extra parentheses content if it looks like metadata
-    author = re.sub(r'\s*\([^)]*(?:born|died|\d{4}|country|nation)[^)]*\)', '', author, flags=re.IGNORECASE)
+    author = _NAME_METADATA_PAREN_RE.sub('', author)
     
     return author.strip()
 
@@ -476,15 +549,16 @@ def is_likely_transliteration(name1: str, name2: str) -> bool:
     return False
 
 
+_TRANSLATION_PATTERNS = [re.compile(p) for p in (
+    r'=\s*[^=]+$', r'：[^：]+$', r'\([^)]*[a-zA-Z][^)]*\)$', r'\[[^\]]*[a-zA-Z][^\]]*\]$'
+)]
+
+
 def detect_translation_pair(title1: str, title2: str, lang1: str = "", lang2: str = "") -> float:
     """Detect if two titles are likely translations. Returns bonus score (0.0 to 0.5)."""
     lang1, lang2 = (lang1 or "").strip().lower(), (lang2 or "").strip().lower()
     
-    translation_patterns = [
-        r'=\s*[^=]+$', r'：[^：]+$', r'\([^)]*[a-zA-Z][^)]*\)$', r'\[[^\]]*[a-zA-Z][^\]]*\]$'
-    ]
-    
-    has_pattern = any(re.search(p, title1) or re.search(p, title2) for p in translation_patterns)
+    has_pattern = any(p.search(title1) or p.search(title2) for p in _TRANSLATION_PATTERNS)
     different_langs = (lang1 and lang2 and lang1 != lang2)
     
     def has_chinese(text): return any('\u4e00' <= char <= '\u9fff' for char in text)
@@ -501,26 +575,28 @@ def detect_translation_pair(title1: str, title2: str, lang1: str = "", lang2: st
     return min(bonus, 0.5)
 
 
+_EDITION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'第\d+版', r'\d+th\s+edition', r'\d+nd\s+edition', r'\d+rd\s+edition', r'\d+st\s+edition',
+    r'revised\s+edition', r'updated\s+edition', r'新版', r'修订版', r'增订版',
+    r'anniversary\s+edition', r'纪念版', r'commemorative',
+    r'illustrated\s+edition', r'插图版', r'图解版',
+    r'deluxe\s+edition', r'精装版', r'豪华版'
+)]
+_BRACKET_RE = re.compile(r'\s*[\(\[\)]\s*')
+
+
 def detect_edition_variation(title1: str, title2: str) -> float:
     """Detect if titles are different editions of the same book."""
-    edition_keywords = [
-        r'第\d+版', r'\d+th\s+edition', r'\d+nd\s+edition', r'\d+rd\s+edition', r'\d+st\s+edition',
-        r'revised\s+edition', r'updated\s+edition', r'新版', r'修订版', r'增订版',
-        r'anniversary\s+edition', r'纪念版', r'commemorative',
-        r'illustrated\s+edition', r'插图版', r'图解版',
-        r'deluxe\s+edition', r'精装版', r'豪华版'
-    ]
-    
     title1_core, title2_core = title1, title2
     
-    for pattern in edition_keywords:
-        title1_core = re.sub(pattern, '', title1_core, flags=re.IGNORECASE)
-        title2_core = re.sub(pattern, '', title2_core, flags=re.IGNORECASE)
+    for pattern in _EDITION_PATTERNS:
+        title1_core = pattern.sub('', title1_core)
+        title2_core = pattern.sub('', title2_core)
     
-    title1_core = re.sub(r'\s*[\(\[\)]\s*', ' ', title1_core)
-    title2_core = re.sub(r'\s*[\(\[\)]\s*', ' ', title2_core)
-    title1_core = re.sub(r'\s+', ' ', title1_core).strip()
-    title2_core = re.sub(r'\s+', ' ', title2_core).strip()
+    title1_core = _BRACKET_RE.sub(' ', title1_core)
+    title2_core = _BRACKET_RE.sub(' ', title2_core)
+    title1_core = _WHITESPACE_RE.sub(' ', title1_core).strip()
+    title2_core = _WHITESPACE_RE.sub(' ', title2_core).strip()
     
     if title1_core and title2_core:
         core_similarity = get_best_match_score(title1_core, title2_core)
@@ -530,6 +606,21 @@ def detect_edition_variation(title1: str, title2: str) -> float:
     return 0.0
 
 
+# (US pattern, UK pattern, US replacement, UK replacement)
+_REGIONAL_VARIATIONS = [
+    (re.compile(us, re.IGNORECASE), re.compile(uk, re.IGNORECASE), us.replace('\\b', ''), uk.replace('\\b', ''))
+    for us, uk in (
+        (r"philosopher'?s?\s+stone", r"sorcerer'?s?\s+stone"),
+        (r"\bcolor\b", r"\bcolour\b"), (r"\bfavor\b", r"\bfavour\b"),
+        (r"\bhonor\b", r"\bhonour\b"), (r"\blabor\b", r"\blabour\b"),
+        (r"organize", r"organise"), (r"realize", r"realise"), (r"analyze", r"analyse"),
+        (r"\bcenter\b", r"\bcentre\b"), (r"\btheater\b", r"\btheatre\b"),
+        (r"\bgray\b", r"\bgrey\b"), (r"\btires?\b", r"\btyres?\b"),
+        (r"\bdefense\b", r"\bdefence\b"), (r"\blicense\b", r"\blicence\b"),
+    )
+]
+
+
 def detect_regional_variation(title1: str, title2: str) -> float:
     """Detect regional variations (US vs UK). Returns penalty (0.0 to 0.15)."""
     # Skip penalty for identical matches
@@ -542,24 +633,12 @@ def detect_regional_variation(title1: str, title2: str) -> float:
     if title1_norm == title2_norm:
         return 0.0
     
-    regional_variations = [
-        (r"philosopher'?s?\s+stone", r"sorcerer'?s?\s+stone"),
-        (r"\bcolor\b", r"\bcolour\b"), (r"\bfavor\b", r"\bfavour\b"),
-        (r"\bhonor\b", r"\bhonour\b"), (r"\blabor\b", r"\blabour\b"),
-        (r"organize", r"organise"), (r"realize", r"realise"), (r"analyze", r"analyse"),
-        (r"\bcenter\b", r"\bcentre\b"), (r"\btheater\b", r"\btheatre\b"),
-        (r"\bgray\b", r"\bgrey\b"), (r"\btires?\b", r"\btyres?\b"),
-        (r"\bdefense\b", r"\bdefence\b"), (r"\blicense\b", r"\blicence\b"),
-    ]
-    
     # Check if differences are due to regional variations
-    for pattern1, pattern2 in regional_variations:
+    for pattern1, pattern2, replacement1, replacement2 in _REGIONAL_VARIATIONS:
         # Convert pattern1 in title1 to pattern2 and see if it matches title2
-        temp1_converted = re.sub(pattern1, lambda m: re.sub(pattern1, pattern2.replace('\\b', ''), m.group(0), flags=re.IGNORECASE), 
-                               title1_norm, flags=re.IGNORECASE)
+        temp1_converted = pattern1.sub(lambda m: pattern1.sub(replacement2, m.group(0)), title1_norm)
         # Convert pattern2 in title2 to pattern1 and see if it matches title1  
-        temp2_converted = re.sub(pattern2, lambda m: re.sub(pattern2, pattern1.replace('\\b', ''), m.group(0), flags=re.IGNORECASE), 
-                               title2_norm, flags=re.IGNORECASE)
+        temp2_converted = pattern2.sub(lambda m: pattern2.sub(replacement1, m.group(0)), title2_norm)
         
         if ((temp1_converted != title1_norm and temp1_converted == title2_norm) or
             (temp2_converted != title2_norm and temp2_converted == title1_norm)):
@@ -578,9 +657,10 @@ def detect_regional_variation(title1: str, title2: str) -> float:
     return 0.0
 
 
-def comprehensive_book_similarity_score(reference_book: Union[Dict, str], comparison_book: Union[Dict, str]) -> float:
+def comprehensive_book_similarity_score(reference_book: Union[Dict, str], comparison_book: Union[Dict, str],
+                                        title_scores: Optional[Dict[str, float]] = None) -> float:
     """Calculate comprehensive similarity score with enhanced author-centric approach and higher bar."""
-    scores = enhanced_book_similarity(reference_book, comparison_book)
+    scores = enhanced_book_similarity(reference_book, comparison_book, title_scores)
     
     # Adjusted weights - reduced base text weights to make room for stricter logic
     base_weights = {
@@ -679,21 +759,36 @@ def comprehensive_book_similarity_score(reference_book: Union[Dict, str], compar
     return total_score
 
 
+def _book_title(book: Union[Dict, str]) -> str:
+    """Title of a book given as a dict or a bare title, as enhanced_book_similarity reads it."""
+    if isinstance(book, str):
+        return book
+    return book.get("title", "") or ""
+
+
 def find_best_book_matches(query_book: Union[Dict, str], candidate_books: List[Dict], 
                           top_k: int = 5, min_score: float = 0.4) -> List[Dict]:
     """Find the best matching books from candidates with enhanced filtering."""
     if not candidate_books:
         return []
     
+    # The query's author is the same for every candidate
+    query_author = ""
+    if isinstance(query_book, dict):
+        query_author = query_book.get("author") or extract_author_from_text(query_book.get("title", ""))
+    
+    # Title metrics for all candidates at once, instead of four scorer calls per candidate
+    all_title_scores = batch_title_scores(
+        normalize(_book_title(query_book)), [normalize(_book_title(candidate)) for candidate in candidate_books])
+    
     matches = []
-    for candidate in candidate_books:
-        score = comprehensive_book_similarity_score(query_book, candidate)
+    for candidate, title_scores in zip(candidate_books, all_title_scores):
+        score = comprehensive_book_similarity_score(query_book, candidate, title_scores)
         
         # Enhanced filtering with author consideration
         if score >= min_score:
             # Additional quality check
             if isinstance(query_book, dict) and isinstance(candidate, dict):
-                query_author = query_book.get("author") or extract_author_from_text(query_book.get("title", ""))
                 candidate_author = candidate.get("author") or extract_author_from_text(candidate.get("title", ""))
                 
                 # If both have authors and they conflict strongly, lower the threshold
@@ -33,6 +33,7 @@ from zlibraryCrowler.config import (
 )
 from zlibraryCrowler.login import perform_login, handle_login_session_loss, verify_login_status
 from zlibraryCrowler.getCookies import get_cookies_from_selenium
+from zlibraryCrowler.runScript import run_script_streaming
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -49,6 +50,8 @@ SHOW_DETAILED_CATEGORY_STATUS = True    # Set to False to reduce log verbosity
 START_YEAR = 1990
 END_YEAR = 2025
 
+GENERATOR_TIMEOUT = 1500  # 25 minute timeout
+
 def extract_categories(driver, wait):
     """
     Extract all categories from the Z-Library categories page.
@@ -85,7 +88,7 @@ def extract_categories(driver, wait):
         
         # Get page source and parse with BeautifulSoup
         page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        soup = BeautifulSoup(page_source, 'lxml')
         
         # Find all category elements
         category_elements = soup.find_all('li', class_='subcategory-name')
@@ -286,21 +289,16 @@ def run_unprocessed_json_generator():
         else:
             env['PYTHONPATH'] = current_dir
         
-        # Run the script using Python with proper environment
-        result = subprocess.run([sys.executable, script_path], 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=1500,  # 25 minute timeout
-                              env=env,
-                              cwd=current_dir)
-        
-        # Print output for debugging
-        if result.stdout:
-            logger.info(f"Generator STDOUT:\n{result.stdout}")
-        if result.stderr:
-            logger.warning(f"Generator STDERR:\n{result.stderr}")
-        
-        return result.returncode == 0
+        # Run the script using Python with proper environment, streaming its output
+        returncode = run_script_streaming([sys.executable, script_path],
+                                         timeout=GENERATOR_TIMEOUT,
+                                         env=env,
+                                         cwd=current_dir)
+        
+        if returncode != 0:
+            logger.warning(f"Generator exited with code {returncode}")
+        
+        return returncode == 0
         
     except subprocess.TimeoutExpired:
         logger.error("JSON generator script timed out after 25 minutes")
@@ -11,6 +11,10 @@ import sys
 import os
 import time
 from zlibraryCrowler.config import update_preferred_year, PREFERRED_YEAR
+from zlibraryCrowler.runScript import run_script_streaming
+
+GENERATOR_TIMEOUT = 1500  # 25 minute timeout
+
 
 def run_unprocessed_json_generator():
     """
@@ -21,34 +25,26 @@ def run_unprocessed_json_generator():
     """
     try:
         # Get the path to the unprocessed JSON generator
-        script_path = os.path.join(os.path.dirname(__file__), 'unprocessesd_json_generator.py')
+        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'unprocessesd_json_generator.py')
         
         # Set up environment to include current directory in Python path
         env = os.environ.copy()
-        current_dir = os.path.dirname(__file__)
+        current_dir = os.path.dirname(os.path.abspath(__file__))
         if 'PYTHONPATH' in env:
             env['PYTHONPATH'] = f"{current_dir}{os.pathsep}{env['PYTHONPATH']}"
         else:
             env['PYTHONPATH'] = current_dir
         
-        # Run the script using Python with proper environment
-        result = subprocess.run([sys.executable, script_path], 
-                              capture_output=True, 
-                              text=True, 
-                              timeout=1500,  # 5 minute timeout
-                              env=env,      # Pass the modified environment
-                              cwd=current_dir)  # Set working directory
-        
-        # Print output for debugging
-        if result.stdout:
-            print(f"STDOUT:\n{result.stdout}")
-        if result.stderr:
-            print(f"STDERR:\n{result.stderr}")
+        # Run the script using Python with proper environment, streaming its output
+        returncode = run_script_streaming([sys.executable, script_path],
+                                         timeout=GENERATOR_TIMEOUT,
+                                         env=env,      # Pass the modified environment
+                                         cwd=current_dir)  # Set working directory
         
-        return result.returncode == 0
+        return returncode == 0
         
     except subprocess.TimeoutExpired:
-        print("❌ Script timed out after 5 minutes")
+        print(f"❌ Script timed out after {GENERATOR_TIMEOUT // 60} minutes")
         return False
     except Exception as e:
         print(f"❌ Error running unprocessed JSON generator: {e}")
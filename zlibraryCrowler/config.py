@@ -1,4 +1,7 @@
 import os
+import re
+import hashlib
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -39,6 +42,7 @@ ZLIBRARY_BASE_URL = "https://zh.z-lib.fm"
 EXTRACT_DOWNLOAD_LINKS = True  # Set to False to skip download link extraction
 USE_ASYNC_EXTRACTION = True    # Set to False to use Selenium method only
 MAX_CONCURRENT_REQUESTS = 3    # Reduce if you get rate limited
+MAX_JSON_CONCURRENCY = 3       # JSON link files downloaded from at the same time
 
 # ============================================================================
 # BROWSER CONFIGURATION
@@ -46,6 +50,10 @@ MAX_CONCURRENT_REQUESTS = 3    # Reduce if you get rate limited
 USE_HEADLESS_BROWSER = True    # Set to False to see browser window
 BROWSER_TIMEOUT = 100           # Timeout for WebDriverWait
 BROWSER_SLEEP_TIME = 2         # Sleep time before closing browser
+MAX_PARALLEL_BROWSERS = 4      # Browser instances used to scrape booklists concurrently
+# Persistent Chrome profile per browser (formatted with a profile id) so logins survive restarts
+CHROME_PROFILE_DIR = os.path.join(tempfile.gettempdir(), 'zlib-profile-{}')
+WEBDRIVER_POOL_MAXSIZE = 20    # urllib3 connections kept open to chromedriver per browser
 
 # Browser options
 CHROME_OPTIONS = [
@@ -55,6 +63,18 @@ CHROME_OPTIONS = [
     '--disable-blink-features=AutomationControlled'
 ]
 
+# Extra options for scrape-only browsers that never need images, plugins or extensions
+SCRAPE_ONLY_CHROME_OPTIONS = [
+    '--blink-settings=imagesEnabled=false',
+    '--disable-extensions',
+    '--disable-plugins'
+]
+SCRAPE_ONLY_CHROME_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2
+}
+PAGE_LOAD_STRATEGY = 'eager'   # driver.get returns at DOMContentLoaded instead of full load
+
 # ============================================================================
 # FILE AND OUTPUT CONFIGURATION
 # ============================================================================
@@ -64,6 +84,10 @@ OUTPUT_FOLDERS = {
     'auth': './output/auth/',           # For passwords, emails, and cookies
     'downloads': './output/downloads/'  # For downloaded files
 }
+OUTPUT_BUFFER_SIZE = 1024 * 1024  # Write buffer for JSON output files (bytes)
+COMPRESS_BOOKLIST_OUTPUT = True   # Save booklists as gzipped NDJSON; False for indented JSON
+SCRAPED_INDEX_FILE = './output/index.sqlite'  # Record of booklists already scraped
+RESCRAPE_AFTER_SECONDS = 7 * 24 * 3600        # Scrape an unchanged booklist again after this long
 
 # Process name for downloaded file naming
 PROCESS_NAME = "zlibrary_crawler"  # Downloaded files will be named with this prefix
@@ -202,6 +226,10 @@ def get_search_params_string():
     
     return '_'.join(params)
 
+# Characters replaced with '_' when search parameters become file names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"|?*/\\ ]')
+_UNSAFE_SHORT_NAME_CHARS = re.compile(r'[<>:"|?*/\\]')
+
 def get_output_filename(suffix=""):
     """
     Generate output filename based on search parameters.
@@ -212,21 +240,15 @@ def get_output_filename(suffix=""):
     Returns:
         str: Complete output filename
     """
-    # Get base name and clean it for filename use
-    base_name = get_search_params_string().replace(' ', '_').replace('/', '_').replace('\\', '_')
-    
-    # Remove any problematic characters for filenames
-    import re
-    base_name = re.sub(r'[<>:"|?*]', '_', base_name)
+    # Get base name and clean it for filename use (spaces, path separators
+    # and other problematic characters)
+    base_name = _UNSAFE_FILENAME_CHARS.sub('_', get_search_params_string())
     
     # Ensure the base name isn't too long (max 200 chars before extension)
     if len(base_name) > 200:
         base_name = base_name[:200]
     
-    if suffix:
-        return f"{OUTPUT_DIR}{base_name}_{suffix}.json"
-    else:
-        return f"{OUTPUT_DIR}{base_name}_books.json"
+    return os.path.join(OUTPUT_DIR, f"{base_name}_{suffix or 'books'}.json")
 
 def get_short_output_filename(suffix=""):
     """
@@ -238,8 +260,6 @@ def get_short_output_filename(suffix=""):
     Returns:
         str: Complete output filename with shortened parameters
     """
-    import hashlib
-    
     # Create a hash of the full search parameters for uniqueness
     full_params = get_search_params_string()
     param_hash = hashlib.md5(full_params.encode()).hexdigest()[:8]
@@ -251,8 +271,7 @@ def get_short_output_filename(suffix=""):
     if BOOK_NAME_TO_SEARCH:
         book_name = BOOK_NAME_TO_SEARCH[:30]
         # Clean the book name for filename use
-        import re
-        book_name = re.sub(r'[<>:"|?*/\\]', '_', book_name)
+        book_name = _UNSAFE_SHORT_NAME_CHARS.sub('_', book_name)
         short_parts.append(book_name)
     
     # Add language if exists (truncated)
@@ -268,10 +287,7 @@ def get_short_output_filename(suffix=""):
     
     short_name = '_'.join(short_parts)
     
-    if suffix:
-        return f"{OUTPUT_DIR}{short_name}_{suffix}.json"
-    else:
-        return f"{OUTPUT_DIR}{short_name}_books.json"
+    return os.path.join(OUTPUT_DIR, f"{short_name}_{suffix or 'books'}.json")
 
 def get_download_filename(original_filename):
     """
@@ -287,7 +303,7 @@ def get_download_filename(original_filename):
     name, ext = os.path.splitext(original_filename)
     # Create new filename with process name prefix
     new_filename = f"{PROCESS_NAME}_{name}{ext}"
-    return f"{DOWNLOADS_DIR}{new_filename}"
+    return os.path.join(DOWNLOADS_DIR, new_filename)
 
 def get_cookies_filepath():
     """
@@ -296,7 +312,7 @@ def get_cookies_filepath():
     Returns:
         str: Complete cookies file path
     """
-    return f"{COOKIES_DIR}{COOKIES_FILE}"
+    return os.path.join(COOKIES_DIR, COOKIES_FILE)
 
 def create_output_directories():
     """
@@ -1,4 +1,4 @@
-import json
+import orjson
 import os
 import asyncio
 import aiohttp
@@ -147,8 +147,8 @@ class ZLibraryDownloader:
             max_books (int): Maximum number of books to download (default: 1)
         """
         # Load book data
-        with open(json_file, 'r', encoding='utf-8') as f:
-            all_books = json.load(f)
+        with open(json_file, 'rb') as f:
+            all_books = orjson.loads(f.read())
         
         # Limit to first n books
         books = all_books[:max_books] if max_books > 0 else all_books
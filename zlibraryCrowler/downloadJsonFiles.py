@@ -0,0 +1,240 @@
+"""
+Download books from the JSON link files in the output directory.
+
+Finds the JSON files whose names end with a given suffix and hold books with
+download links, downloads from them concurrently and removes each file once
+its downloads are done. Entry scripts call run() with their filename suffix.
+"""
+
+import os
+import orjson
+import asyncio
+import logging
+from operator import methodcaller
+
+from .config import OUTPUT_DIR, DOWNLOADS_DIR, MAX_JSON_CONCURRENCY
+from .downloadFiles import download_books
+
+logger = logging.getLogger(__name__)
+
+
+# Number of candidate JSON files loaded at once while looking for download links
+JSON_VALIDATION_CONCURRENCY = 8
+
+# book.get('download_links', ()) without a Python-level call per book
+_get_download_links = methodcaller('get', 'download_links', ())
+
+# Smallest file that can hold a book list with a download link
+MIN_JSON_FILE_SIZE = 10
+
+# Names given to files written by the download link extraction step
+LINK_FILE_SUFFIXES = ('_with_links.json', '_downloadLinks.json')
+
+# Per-file lines shown from each category of the directory scan report
+MAX_REPORTED_FILES = 10
+
+# Bytes read from each candidate before deciding whether to parse it
+QUICKCHECK_BYTES = 64 * 1024
+
+
+def scan_json_dir(json_dir, suffix='.json'):
+    """
+    List the JSON files in a directory in a single pass
+    
+    Args:
+        json_dir: Directory to scan
+        suffix: Filename suffix (or tuple of suffixes) the files must end with
+    
+    Returns:
+        dict: File path -> os.stat_result cached on the DirEntry, or None if
+            the directory does not exist
+    """
+    try:
+        with os.scandir(json_dir) as it:
+            # DirEntry carries the file type from readdir, so only the
+            # matching files pay for a stat
+            return {entry.path: entry.stat() for entry in it
+                    if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)}
+    except FileNotFoundError:
+        return None
+
+
+def load_json(file_path):
+    """Read and parse a JSON file with orjson"""
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def quickcheck_json_file(file_path):
+    """
+    Cheaply classify a candidate file from its first QUICKCHECK_BYTES
+    
+    Book lists are written with a uniform schema, so a list with download
+    links names the key within its first few books.
+    
+    Returns:
+        bool or None: None if the file does not start with a JSON list,
+            False if the head has no "download_links" key, True otherwise
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(QUICKCHECK_BYTES)
+    if not head.lstrip().startswith(b'['):
+        return None
+    return b'"download_links"' in head
+
+
+def validate_json_file(file_path):
+    """
+    Load a JSON file and check whether it is a book list with download links
+    
+    Returns:
+        tuple: (file_path, has_download_links, error) where has_download_links
+            is None if the file is not a non-empty list and error is the load
+            exception, if any
+    """
+    try:
+        # Only files that can match are fully parsed
+        quickcheck = quickcheck_json_file(file_path)
+        if not quickcheck:
+            return file_path, quickcheck, None
+        data = load_json(file_path)
+    except (orjson.JSONDecodeError, IOError) as e:
+        return file_path, None, e
+    
+    if not (isinstance(data, list) and len(data) > 0):
+        return file_path, None, None
+    
+    # Check if any book has download links
+    has_download_links = any(map(_get_download_links, data))
+    return file_path, has_download_links, None
+
+
+async def find_all_json_files(suffix='.json'):
+    """Find all valid JSON files with download links in the json directory"""
+    json_files = []
+    json_dir = OUTPUT_DIR
+    
+    dir_cache = scan_json_dir(json_dir, suffix)
+    if dir_cache is None:
+        print(f"❌ JSON directory does not exist: {json_dir}")
+        return []
+    
+    # Files too small to hold any books are skipped without opening them.
+    # Files named by the link extraction step are checked (and listed) first
+    link_candidates, other_json = [], []
+    for path, stat in dir_cache.items():
+        if stat.st_size <= MIN_JSON_FILE_SIZE:
+            continue
+        (link_candidates if path.endswith(LINK_FILE_SUFFIXES) else other_json).append(path)
+    candidates = link_candidates + other_json
+    
+    # Load the candidates in worker threads so their reads overlap
+    semaphore = asyncio.Semaphore(JSON_VALIDATION_CONCURRENCY)
+    
+    async def validate(file_path):
+        async with semaphore:
+            return await asyncio.to_thread(validate_json_file, file_path)
+    
+    results = await asyncio.gather(*(validate(file_path) for file_path in candidates))
+    
+    invalid, without_links = [], []
+    for file_path, has_download_links, error in results:
+        filename = os.path.basename(file_path)
+        if error is not None:
+            invalid.append(f"  {filename} - {error}")
+        elif has_download_links:
+            json_files.append(file_path)
+        elif has_download_links is not None:
+            without_links.append(f"  {filename}")
+    
+    # Report each category with one (capped) log call instead of a line per file
+    _log_files(logging.INFO, "✅ Found valid JSON files with download links",
+               [f"  {os.path.basename(path)}" for path in json_files])
+    _log_files(logging.WARNING, "⚠️ No download links found in (skipping)", without_links)
+    _log_files(logging.WARNING, "⚠️ Invalid JSON files", invalid)
+    
+    return json_files
+
+
+def _log_files(level, title, lines):
+    """Log a titled list of files, showing at most MAX_REPORTED_FILES of them"""
+    if not lines:
+        return
+    shown = lines[:MAX_REPORTED_FILES]
+    if len(lines) > MAX_REPORTED_FILES:
+        shown.append(f"  ... and {len(lines) - MAX_REPORTED_FILES} more")
+    logger.log(level, "%s (%d):\n%s", title, len(lines), "\n".join(shown))
+
+
+async def process_json_file(json_file, output_dir):
+    """
+    Process a single JSON file and download books
+    
+    Returns:
+        tuple: (json_file, ok) where ok is True if the downloads finished
+            and the file can be removed
+    """
+    try:
+        books_data = load_json(json_file)
+        
+        total_expected_downloads = sum(map(len, map(_get_download_links, books_data)))
+        
+        print(f"📂 Processing: {os.path.basename(json_file)}")
+        print(f"📊 Expected downloads: {total_expected_downloads}")
+        
+        # Download books from this JSON file
+        await download_books(json_file, output_dir)
+        return json_file, True
+            
+    except Exception as e:
+        print(f"❌ Error processing {json_file}: {e}")
+        return json_file, False
+
+
+def remove_json_files(json_files):
+    """Remove processed JSON files, reporting each removal"""
+    for json_file in json_files:
+        try:
+            os.remove(json_file)
+            print(f"🗑️ Removed: {os.path.basename(json_file)}")
+        except Exception as e:
+            print(f"❌ Error removing {json_file}: {e}")
+
+
+async def run(suffix='.json', *, single=False):
+    """
+    Download books from every valid JSON link file in OUTPUT_DIR
+    
+    Args:
+        suffix: Filename suffix (or tuple of suffixes) of the JSON files to process
+        single: Only process the first valid file found, preferring files
+            named by the link extraction step
+    """
+    output_dir = os.path.normpath(DOWNLOADS_DIR)
+    
+    # Find all JSON files with download links
+    json_files = await find_all_json_files(suffix)
+    
+    if not json_files:
+        print("❌ No valid JSON files found with download links")
+        return
+    
+    if single:
+        json_files = json_files[:1]
+    
+    print(f"🚀 Found {len(json_files)} JSON files to process")
+    
+    # Process the JSON files concurrently, a few at a time
+    semaphore = asyncio.Semaphore(MAX_JSON_CONCURRENCY)
+    
+    async def process(i, json_file):
+        async with semaphore:
+            print(f"\n--- Processing file {i}/{len(json_files)} ---")
+            return await process_json_file(json_file, output_dir)
+    
+    results = await asyncio.gather(*(process(i, json_file) for i, json_file in enumerate(json_files, 1)))
+    
+    # Remove the JSON files after successful download, once every file is done
+    await asyncio.to_thread(remove_json_files, [json_file for json_file, ok in results if ok])
+    
+    print(f"\n✅ Completed processing all {len(json_files)} JSON files")
@@ -0,0 +1,174 @@
+"""
+Shared Chrome WebDriver construction for the Z-Library scrapers.
+
+All browsers run as sessions on one chromedriver service. Each profile id gets
+its own persistent Chrome user-data-dir, so a login (and its cookies) carries
+over between runs, and its driver is kept so later callers in the same
+process reuse the open browser instead of launching a new one.
+"""
+
+import atexit
+import threading
+from typing import Dict, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Public way to size the connection pool to chromedriver (Selenium 4.26+)
+try:
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:
+    ClientConfig = None
+
+from .config import (
+    USE_HEADLESS_BROWSER, CHROME_OPTIONS, CHROME_PROFILE_DIR, WEBDRIVER_POOL_MAXSIZE,
+    SCRAPE_ONLY_CHROME_OPTIONS, SCRAPE_ONLY_CHROME_PREFS, PAGE_LOAD_STRATEGY
+)
+
+# One chromedriver process shared by every driver in this process
+_chromedriver_service: Optional[Service] = None
+_drivers: Dict[int, webdriver.Remote] = {}
+_lock = threading.Lock()
+
+
+def get_service() -> Service:
+    """
+    Start the shared chromedriver service on first use.
+
+    Returns:
+        Running chromedriver service; stopped automatically at exit
+    """
+    global _chromedriver_service
+    with _lock:
+        if _chromedriver_service is None:
+            service = Service(ChromeDriverManager().install())
+            service.start()
+            # atexit runs last-registered first: quit the browsers, then the service
+            atexit.register(service.stop)
+            atexit.register(quit_all_drivers)
+            _chromedriver_service = service
+        return _chromedriver_service
+
+
+def build_chrome_options(profile_id: Optional[int] = None, scrape_only: bool = True) -> Options:
+    """
+    Build Chrome options from the configuration.
+
+    Args:
+        profile_id: Persistent profile to use; a throwaway profile if None
+        scrape_only: Skip images, plugins and extensions and return from
+            page loads at DOMContentLoaded
+
+    Returns:
+        Configured Chrome options
+    """
+    options = Options()
+    if USE_HEADLESS_BROWSER:
+        options.add_argument('--headless')
+
+    for option in CHROME_OPTIONS:
+        options.add_argument(option)
+
+    if scrape_only:
+        for option in SCRAPE_ONLY_CHROME_OPTIONS:
+            options.add_argument(option)
+        options.add_experimental_option('prefs', SCRAPE_ONLY_CHROME_PREFS)
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+
+    if profile_id is not None:
+        options.add_argument(f'--user-data-dir={CHROME_PROFILE_DIR.format(profile_id)}')
+
+    return options
+
+
+def build_client_config(service_url: str, maxsize: int = WEBDRIVER_POOL_MAXSIZE):
+    """
+    Build a ClientConfig whose urllib3 pool keeps ``maxsize`` connections to chromedriver.
+
+    Selenium's PoolManager keeps a single connection per host by default, so
+    concurrent commands against one driver queue behind each other and log
+    "connection pool is full" warnings.
+
+    Args:
+        service_url: URL of the chromedriver service
+        maxsize: Number of connections to keep per host
+
+    Returns:
+        ClientConfig, or None if this Selenium version has no ClientConfig
+    """
+    if ClientConfig is None:
+        return None
+    # RemoteConnection reads the PoolManager arguments from this nested key
+    return ClientConfig(remote_server_addr=service_url,
+                        init_args_for_pool_manager={'init_args_for_pool_manager': {'maxsize': maxsize}})
+
+
+def enlarge_webdriver_pool(driver, maxsize: int = WEBDRIVER_POOL_MAXSIZE) -> None:
+    """
+    Raise the pool size of an existing driver's connection to chromedriver.
+
+    Fallback for Selenium versions without ClientConfig. It adjusts the
+    command executor's private PoolManager, so it checks the attributes it
+    needs and leaves the pool unchanged (with a message) if they are missing.
+
+    Args:
+        driver: WebDriver whose command executor should be adjusted
+        maxsize: Number of connections to keep per host
+    """
+    pool_manager = getattr(driver.command_executor, '_conn', None)
+    pool_kw = getattr(pool_manager, 'connection_pool_kw', None)
+    if not isinstance(pool_kw, dict) or not hasattr(pool_manager, 'clear'):
+        print("Could not enlarge the WebDriver connection pool: unsupported Selenium version")
+        return
+    pool_kw['maxsize'] = maxsize
+    # Drop pools created with the old size; they are rebuilt on the next command
+    pool_manager.clear()
+
+
+def get_driver(profile_id: int = 0, scrape_only: bool = True) -> webdriver.Remote:
+    """
+    Return the browser for a profile, starting it on first use.
+
+    Two browsers cannot share a user-data-dir, so concurrent scrapers must use
+    different profile ids.
+
+    Args:
+        profile_id: Persistent profile whose browser to return
+        scrape_only: Passed to build_chrome_options when a browser is started
+
+    Returns:
+        WebDriver session on the shared chromedriver service
+    """
+    service_url = get_service().service_url
+    with _lock:
+        driver = _drivers.get(profile_id)
+        if driver is None:
+            options = build_chrome_options(profile_id, scrape_only)
+            client_config = build_client_config(service_url)
+            if client_config is not None:
+                driver = webdriver.Remote(command_executor=service_url, options=options,
+                                          client_config=client_config)
+            else:
+                driver = webdriver.Remote(command_executor=service_url, options=options)
+                enlarge_webdriver_pool(driver)
+            _drivers[profile_id] = driver
+        return driver
+
+
+def quit_driver(profile_id: int = 0) -> None:
+    """Quit a profile's browser, if running; its profile directory is kept."""
+    with _lock:
+        driver = _drivers.pop(profile_id, None)
+    if driver is not None:
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error quitting browser for profile {profile_id}: {e}")
+
+
+def quit_all_drivers() -> None:
+    """Quit every browser started by get_driver."""
+    for profile_id in list(_drivers):
+        quit_driver(profile_id)
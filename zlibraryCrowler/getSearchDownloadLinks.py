@@ -60,7 +60,7 @@ def extract_download_links_from_page(html_content: str, book_id: str) -> List[Di
     download_links = []
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         # Look for the main download button first
         main_download_btn = soup.find('a', class_='addDownloadedBook')
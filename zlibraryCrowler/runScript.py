@@ -0,0 +1,53 @@
+"""
+Run helper scripts in a child Python process.
+
+The year and category traversals launch the JSON generator once per year;
+run_script_streaming() echoes its output line by line as it arrives.
+"""
+
+import subprocess
+import sys
+import threading
+
+
+def run_script_streaming(command, timeout, env=None, cwd=None):
+    """
+    Run a command, echoing its stdout/stderr line by line as they arrive.
+    
+    Args:
+        command (list): Command and arguments
+        timeout (int): Timeout in seconds; the process is killed when it expires
+        env (dict): Environment for the child process
+        cwd (str): Working directory for the child process
+    
+    Returns:
+        int: The process's return code
+    
+    Raises:
+        subprocess.TimeoutExpired: If the process runs longer than ``timeout``
+    """
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, bufsize=1, env=env, cwd=cwd)
+    
+    def pump(stream, sink):
+        for line in stream:
+            sink.write(line)
+            sink.flush()
+        stream.close()
+    
+    readers = [
+        threading.Thread(target=pump, args=(process.stdout, sys.stdout), daemon=True),
+        threading.Thread(target=pump, args=(process.stderr, sys.stderr), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    
+    try:
+        return process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
@@ -105,7 +105,7 @@ def search_and_extract_books(driver, wait, search_url, book_name_for_file, max_p
                     search_page_source = driver.page_source
                     
                     # Parse the page with BeautifulSoup
-                    soup = BeautifulSoup(search_page_source, 'html.parser')
+                    soup = BeautifulSoup(search_page_source, 'lxml')
 
                     # Find all book items
                     book_items = soup.find_all('div', class_='book-item')
@@ -224,7 +224,7 @@ def search_and_extract_books(driver, wait, search_url, book_name_for_file, max_p
             # Check if we've reached the end of results using proper termination indicators
             # Look for actual "no more results" or pagination end indicators
             try:
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
+                soup = BeautifulSoup(driver.page_source, 'lxml')
                 next_page_link = soup.find('a', href=lambda href: href and f'page={current_page + 1}' in href)
                 
                 if not next_page_link and current_page < max_pages:
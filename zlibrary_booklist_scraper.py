@@ -9,8 +9,12 @@ import os
 import json
 import sys
 import uuid
+import re
+import html
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from lxml import etree
 
 # Add current directory to Python path for module imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +29,31 @@ from zlibraryCrowler.login import perform_login
 from zlibraryCrowler.getSearchDownloadLinks import process_books_selenium_fallback
 from zlibraryCrowler.getCookies import get_cookies_from_selenium
 
+# Only build parse trees for the subtrees we extract from
+BOOKLIST_STRAINER = SoupStrainer('z-booklist')
+
+# Raw-markup patterns for the machine-generated z-booklist carousel: each
+# z-cover sits directly inside the <a> linking to its book
+Z_BOOKLIST_RE = re.compile(r'<z-booklist\b.*?</z-booklist>', re.S)
+PREVIEW_COVER_RE = re.compile(r'<a\b[^>]*?\shref="([^"]*)"[^>]*>\s*<z-cover\b([^>]*)>', re.S)
+COVER_ATTR_RE = re.compile(r'(?:^|\s)(id|title|author)="([^"]*)"')
+
+# Compiled XPath queries for the booklist pages, evaluated by libxml2
+BOOKCARDS_XPATH = etree.XPath('//z-bookcard')
+BOOK_ITEMS_XPATH = etree.XPath('//div[contains(concat(" ", normalize-space(@class), " "), " book-item ")]')
+NEXT_LINK_XPATH = etree.XPath('//a[@rel="next"]/@href')
+NESTED_BOOKCARD_XPATH = etree.XPath('.//z-bookcard')
+TITLE_XPATH = etree.XPath('string(.//div[@slot="title"])')
+AUTHOR_XPATH = etree.XPath('string(.//div[@slot="author"])')
+FALLBACK_TITLE_XPATH = etree.XPath(
+    'string((.//h3 | .//h4 | .//*[contains(concat(" ", normalize-space(@class), " "), " title ")'
+    ' or contains(concat(" ", normalize-space(@class), " "), " book-title ")])[1])'
+)
+FALLBACK_AUTHOR_XPATH = etree.XPath(
+    'string((.//*[contains(concat(" ", normalize-space(@class), " "), " author ")'
+    ' or contains(concat(" ", normalize-space(@class), " "), " book-author ")])[1])'
+)
+
 class ZLibraryBooklistScraper:
     def __init__(self):
         self.chrome_options = Options()
@@ -54,18 +83,23 @@ class ZLibraryBooklistScraper:
             
             # Get page source and parse with BeautifulSoup
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = BeautifulSoup(page_source, 'lxml', parse_only=BOOKLIST_STRAINER)
             
             # Find all z-booklist elements (the actual structure used by Z-Library)
             booklist_elements = soup.find_all('z-booklist')
             
             print(f"Found {len(booklist_elements)} z-booklist elements")
             
+            # Raw markup of each z-booklist, in document order, for regex extraction
+            raw_booklists = Z_BOOKLIST_RE.findall(page_source)
+            if len(raw_booklists) != len(booklist_elements):
+                raw_booklists = [None] * len(booklist_elements)
+            
             booklists = []
             
-            for element in booklist_elements:
+            for element, raw_html in zip(booklist_elements, raw_booklists):
                 try:
-                    booklist_data = self.parse_z_booklist_element(element)
+                    booklist_data = self.parse_z_booklist_element(element, raw_html)
                     if booklist_data:
                         booklists.append(booklist_data)
                 except Exception as e:
@@ -78,7 +112,7 @@ class ZLibraryBooklistScraper:
             print(f"Error scraping booklists page: {e}")
             return []
     
-    def parse_z_booklist_element(self, element):
+    def parse_z_booklist_element(self, element, raw_html=None):
         """Parse a z-booklist element to extract metadata and booklist URL"""
         try:
             booklist_data = {
@@ -102,7 +136,7 @@ class ZLibraryBooklistScraper:
             }
             
             # Extract preview books from within the z-booklist element
-            booklist_data['preview_books'] = self.extract_preview_books_from_z_booklist(element)
+            booklist_data['preview_books'] = self.extract_preview_books_from_z_booklist(element, raw_html)
             
             return booklist_data
             
@@ -110,8 +144,33 @@ class ZLibraryBooklistScraper:
             print(f"Error parsing z-booklist element: {e}")
             return None
 
-    def extract_preview_books_from_z_booklist(self, element):
-        """Extract preview books from within a z-booklist element"""
+    def extract_preview_books_from_raw_html(self, raw_html):
+        """Extract preview books from a z-booklist's raw markup with regexes"""
+        preview_books = []
+        
+        for match in PREVIEW_COVER_RE.finditer(raw_html):
+            href = html.unescape(match.group(1))
+            attrs = {name: html.unescape(value) for name, value in COVER_ATTR_RE.findall(match.group(2))}
+            preview_books.append({
+                'id': attrs.get('id'),
+                'title': attrs.get('title'),
+                'author': attrs.get('author'),
+                'book_url': f"{ZLIBRARY_BASE_URL}{href}" if href else None
+            })
+        
+        return preview_books
+    
+    def extract_preview_books_from_z_booklist(self, element, raw_html=None):
+        """Extract preview books from within a z-booklist element
+        
+        Uses the regex fast path on ``raw_html`` when given, falling back to
+        walking the parse tree if the markup doesn't have the expected shape.
+        """
+        if raw_html is not None:
+            preview_books = self.extract_preview_books_from_raw_html(raw_html)
+            if preview_books or '<z-cover' not in raw_html:
+                return preview_books
+        
         preview_books = []
         
         try:
@@ -254,15 +313,15 @@ class ZLibraryBooklistScraper:
                     
                     # Get page source
                     page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
+                    tree = lxml.html.fromstring(page_source)
                     
                     # Find all book elements (they might be in different formats)
                     # Look for z-bookcard elements first
-                    book_elements = soup.find_all('z-bookcard')
+                    book_elements = BOOKCARDS_XPATH(tree)
                     
                     # If no z-bookcard found, look for other book item patterns
                     if not book_elements:
-                        book_elements = soup.find_all('div', class_='book-item')
+                        book_elements = BOOK_ITEMS_XPATH(tree)
                     
                     if not book_elements:
                         print(f"No book elements found on page {page_num}")
@@ -279,9 +338,9 @@ class ZLibraryBooklistScraper:
                     # Check for next page
                     try:
                         # Look for pagination links
-                        next_link = soup.find('a', {'rel': 'next'})
-                        if next_link and next_link.get('href'):
-                            next_url = f"{ZLIBRARY_BASE_URL}{next_link.get('href')}"
+                        next_hrefs = NEXT_LINK_XPATH(tree)
+                        if next_hrefs and next_hrefs[0]:
+                            next_url = f"{ZLIBRARY_BASE_URL}{next_hrefs[0]}"
                             self.driver.get(next_url)
                             time.sleep(3)
                             page_num += 1
@@ -304,12 +363,12 @@ class ZLibraryBooklistScraper:
             return []
     
     def extract_book_from_Element(self, element):
-        """Extract book information from a book element"""
+        """Extract book information from a book element (an lxml element)"""
         try:
             book_info = {}
             
             # Handle z-bookcard elements (the actual structure used by Z-Library)
-            if element.name == 'z-bookcard':
+            if element.tag == 'z-bookcard':
                 book_info = {
                     'id': element.get('id'),
                     'isbn': element.get('isbn'),
@@ -326,15 +385,9 @@ class ZLibraryBooklistScraper:
                     'deleted': element.get('deleted') == '1' if element.get('deleted') else False
                 }
                 
-                # Extract title from slot
-                title_slot = element.find('div', {'slot': 'title'})
-                if title_slot:
-                    book_info['title'] = title_slot.text.strip()
-                
-                # Extract author from slot  
-                author_slot = element.find('div', {'slot': 'author'})
-                if author_slot:
-                    book_info['author'] = author_slot.text.strip()
+                # Extract title and author from slots
+                book_info['title'] = TITLE_XPATH(element).strip() or None
+                book_info['author'] = AUTHOR_XPATH(element).strip() or None
                 
                 # If title or author is still None, try to get from attributes
                 if not book_info['title']:
@@ -345,9 +398,9 @@ class ZLibraryBooklistScraper:
             # Handle other book item formats (fallback)
             else:
                 # Look for book card within the element
-                bookcard = element.find('z-bookcard')
-                if bookcard:
-                    return self.extract_book_from_Element(bookcard)
+                bookcards = NESTED_BOOKCARD_XPATH(element)
+                if bookcards:
+                    return self.extract_book_from_Element(bookcards[0])
                 
                 # Fallback: extract from generic book item structure
                 book_info = {
@@ -364,13 +417,13 @@ class ZLibraryBooklistScraper:
                 }
                 
                 # Try to extract what we can
-                title_elem = element.find(['h3', 'h4', '.title', '.book-title'])
-                if title_elem:
-                    book_info['title'] = title_elem.text.strip()
+                title = FALLBACK_TITLE_XPATH(element).strip()
+                if title:
+                    book_info['title'] = title
                 
-                author_elem = element.find(['.author', '.book-author'])
-                if author_elem:
-                    book_info['author'] = author_elem.text.strip()
+                author = FALLBACK_AUTHOR_XPATH(element).strip()
+                if author:
+                    book_info['author'] = author
             
             # Only return if we have at least a title
             return book_info if book_info.get('title') and book_info.get('title') != 'Unknown Title' else None
@@ -443,7 +496,7 @@ class ZLibraryBooklistScraper:
             }
             
             # Save to JSON file
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
                 json.dump(output_data, f, ensure_ascii=False, indent=2)
             
             print(f"✅ Saved booklist data to: {filepath}")